@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+from umls_python_client import UMLSClient
+from umls_python_client.localAPI import RRFStore, StringIndex
+
+# Synthetic release 2099AA. SNOMEDCT_US hierarchy (child -> parents): 200 -> 100, 300 -> 200,
+# 400 -> 200 and 300, 500 -> 100. C0000005 (Headache) also has MSH atoms under D006261.
+RRF_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "rrf")
+
+
+@pytest.fixture
+def rrf_dir():
+    return RRF_DIR
+
+
+@pytest.fixture(scope="module")
+def store():
+    store = RRFStore.from_directory(RRF_DIR)
+    yield store
+    store.close()
+
+
+@pytest.fixture(scope="module")
+def string_index(store, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("index") / "strings.idx")
+    StringIndex.build(store).save(path)
+    index = StringIndex.load(path)
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def client():
+    client = UMLSClient("test-key", rrf_path=RRF_DIR)
+    yield client
+    client.close()
@@ -0,0 +1,89 @@
+import itertools
+import math
+
+import pytest
+
+from umls_python_client import UMLSClient
+from umls_python_client.localAPI import FuzzyIndex
+from umls_python_client.localAPI.fuzzy_index import MEASURES, features
+
+QUERIES = (
+    "headache",
+    "headahce",
+    "fractur of bone",
+    "bone fractures",
+    "closed fracture of carpal",
+    "cephalalgia",
+    "fracture",
+    "xyz",
+)
+
+
+def similarity(measure, first, second):
+    overlap = len(first & second)
+    if measure == "cosine":
+        return overlap / math.sqrt(len(first) * len(second))
+    if measure == "jaccard":
+        return overlap / len(first | second)
+    return 2 * overlap / (len(first) + len(second))
+
+
+@pytest.fixture(scope="module")
+def fuzzy_index(string_index, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("fuzzy") / "fuzzy.idx")
+    FuzzyIndex.build(string_index).save(path)
+    index = FuzzyIndex.load(path, string_index)
+    yield index
+    index.close()
+
+
+@pytest.mark.parametrize("measure", MEASURES)
+def test_matches_agree_with_brute_force(string_index, fuzzy_index, measure):
+    keys = list(string_index.keys("exact"))
+    key_features = [set(features(key)) for key in keys]
+    for query, threshold in itertools.product(QUERIES, (0.4, 0.7, 1.0)):
+        query_features = set(features(query))
+        expected = {
+            key: similarity(measure, query_features, candidate)
+            for key, candidate in zip(keys, key_features)
+            if similarity(measure, query_features, candidate) >= threshold - 1e-9
+        }
+        matches = fuzzy_index.matches(query, measure, threshold)
+        assert {key for key, _ in matches} == set(expected), (query, threshold)
+        for key, score in matches:
+            assert score == pytest.approx(expected[key])
+        scores = [score for _, score in matches]
+        assert scores == sorted(scores, reverse=True)
+
+
+def test_misspelled_query_finds_the_concept(fuzzy_index):
+    results = fuzzy_index.search("headahce", threshold=0.5)["result"]["results"]
+    assert results[0]["ui"] == "C0000005"
+    no_match = fuzzy_index.search("xyz", threshold=0.5)["result"]["results"]
+    assert no_match == [{"ui": "NONE", "name": "NO RESULTS"}]
+
+
+def test_invalid_threshold_is_rejected(fuzzy_index):
+    with pytest.raises(ValueError):
+        fuzzy_index.matches("headache", threshold=0)
+
+
+def test_search_many_matches_search(fuzzy_index):
+    queries = list(QUERIES) + ["headahce"]
+    expected = [fuzzy_index.search(query, threshold=0.5) for query in queries]
+    assert fuzzy_index.search_many(queries, threshold=0.5) == expected
+    assert fuzzy_index.search_many(queries, max_workers=2, threshold=0.5) == expected
+
+
+def test_client_opens_the_fuzzy_index(rrf_dir, tmp_path):
+    client = UMLSClient(
+        "test-key",
+        rrf_path=rrf_dir,
+        rrf_index_dir=str(tmp_path),
+        rrf_fuzzy_index=True,
+    )
+    try:
+        results = client.fuzzy_index.search("cephalagia", sabs="MSH")
+        assert [r["ui"] for r in results["result"]["results"]] == ["C0000005"]
+    finally:
+        client.close()
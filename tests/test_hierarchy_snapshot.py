@@ -0,0 +1,23 @@
+import pytest
+
+from umls_python_client.sourceAPI.hierarchy_snapshot import HierarchySnapshot
+
+
+def test_similarity_needs_a_root_complete_snapshot(client, tmp_path):
+    source = client.sourceAPI
+    path = str(tmp_path / "snomed.snap")
+    source.build_hierarchy_snapshot("SNOMEDCT_US", "200", file_path=path)
+    source.register_snapshot(HierarchySnapshot.load(path))
+    assert source.concept_similarity("SNOMEDCT_US", "300", "400")["lca"] == "300"
+
+    source.register_snapshot(
+        source.build_hierarchy_snapshot("SNOMEDCT_US", "200", include_ancestors=False)
+    )
+    with pytest.raises(ValueError, match="ancestors"):
+        source.concept_similarity("SNOMEDCT_US", "300", "400")
+
+    source.register_snapshot(
+        source.build_hierarchy_snapshot("SNOMEDCT_US", "100", max_nodes=2)
+    )
+    with pytest.raises(ValueError, match="partial"):
+        source.concept_similarity_many("SNOMEDCT_US", [("200", "500")])
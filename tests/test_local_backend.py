@@ -0,0 +1,146 @@
+import json
+
+from umls_python_client.localAPI.local_backend import NOT_FOUND
+
+
+def uis(response):
+    return [item["ui"] for item in response["result"]]
+
+
+def test_release_is_read_from_release_dat(client):
+    assert client.release == "2099AA"
+
+
+def test_cui_routes(client):
+    info = client.cuiAPI.get_cui_info("C0000005", return_indented=False)["result"]
+    assert info["ui"] == "C0000005"
+    assert info["name"] == "Headache"
+    assert info["atomCount"] == 4
+    assert [sty["name"] for sty in info["semanticTypes"]] == ["Sign or Symptom"]
+
+    atoms = client.cuiAPI.get_atoms("C0000005", return_indented=False)
+    assert uis(atoms) == ["A11", "A12", "A13", "A14"]
+
+    definitions = client.cuiAPI.get_definitions("C0000005", return_indented=False)
+    assert [d["rootSource"] for d in definitions["result"]] == ["MSH", "NCI"]
+
+    relations = client.cuiAPI.get_relations("C0000003", return_indented=False)
+    assert [r["relationLabel"] for r in relations["result"]] == ["RB"]
+    with_obsolete = client.cuiAPI.get_relations(
+        "C0000003", include_obsolete=True, return_indented=False
+    )
+    assert len(with_obsolete["result"]) == 2
+
+
+def test_source_routes(client):
+    concept = client.sourceAPI.get_source_concept(
+        "SNOMEDCT_US", "300", return_indented=False
+    )["result"]
+    assert concept["ui"] == "300"
+    assert concept["name"] == "Closed fracture of carpal bone"
+
+    attributes = client.sourceAPI.get_source_attributes(
+        "SNOMEDCT_US", "300", return_indented=False
+    )
+    assert [a["name"] for a in attributes["result"]] == [
+        "DEFINITION_STATUS_ID",
+        "CTV3ID",
+    ]
+
+
+def test_hierarchy_follows_par_and_chd_direction(client):
+    source = client.sourceAPI
+    parents = source.get_source_parents("SNOMEDCT_US", "400", return_indented=False)
+    assert uis(parents) == ["200", "300"]
+    children = source.get_source_children("SNOMEDCT_US", "200", return_indented=False)
+    assert uis(children) == ["300", "400"]
+    ancestors = source.get_source_ancestors("SNOMEDCT_US", "400", return_indented=False)
+    assert sorted(uis(ancestors)) == ["100", "200", "300"]
+    descendants = source.get_source_descendants(
+        "SNOMEDCT_US", "100", return_indented=False
+    )
+    assert sorted(uis(descendants)) == ["200", "300", "400", "500"]
+    assert source.is_a("SNOMEDCT_US", "400", "100")
+    assert not source.is_a("SNOMEDCT_US", "100", "400")
+
+
+def test_all_pages_of_a_closure(client):
+    descendants = client.sourceAPI.get_all_source_descendants(
+        "SNOMEDCT_US", "100", page_size=1
+    )
+    assert sorted(concept["ui"] for concept in descendants) == [
+        "200",
+        "300",
+        "400",
+        "500",
+    ]
+
+
+def test_crosswalk_route(client):
+    crosswalk = client.crosswalkAPI.get_crosswalk(
+        "SNOMEDCT_US", "500", return_indented=False
+    )
+    assert [(c["rootSource"], c["ui"]) for c in crosswalk["result"]] == [
+        ("MSH", "D006261")
+    ]
+    rows = list(client.crosswalkAPI.crosswalk_many([("MSH", "D006261")], "SNOMEDCT_US"))
+    assert rows == [("MSH", "D006261", "SNOMEDCT_US", "500", "Headache")]
+
+
+def test_search_route(client):
+    search = client.searchAPI.search
+    results = search("headache", return_indented=False)["result"]["results"]
+    assert [r["ui"] for r in results] == ["C0000005"]
+
+    results = search("carpal fracture", return_indented=False)["result"]["results"]
+    assert sorted(r["ui"] for r in results) == ["C0000003", "C0000004"]
+
+    results = search(
+        "fracture", sabs="ICD10CM", return_id_type="code", return_indented=False
+    )["result"]["results"]
+    assert sorted(r["ui"] for r in results) == ["S02", "S62.1"]
+
+    results = search(
+        "D006261", input_type="sourceUi", search_type="exact", return_indented=False
+    )["result"]["results"]
+    assert [r["ui"] for r in results] == ["C0000005"]
+
+    empty = search("nothing here", return_indented=False)["result"]["results"]
+    assert empty == [{"ui": "NONE", "name": "NO RESULTS"}]
+
+
+def test_missing_resources_return_the_404_envelope(client):
+    assert client.cuiAPI.get_cui_info("C9999999", return_indented=False) == NOT_FOUND
+    assert (
+        client.sourceAPI.get_source_parents("SNOMEDCT_US", "999", return_indented=False)
+        == NOT_FOUND
+    )
+    assert (
+        client.crosswalkAPI.get_crosswalk("MSH", "D000000", return_indented=False)
+        == NOT_FOUND
+    )
+
+
+def test_search_many_keeps_every_input_string(client, tmp_path):
+    strings = ["Headache", "  headache ", "", "carpal fracture", "Headache"]
+    rows = list(client.searchAPI.search_many(strings))
+    assert [(string, key) for string, key, _ in rows] == [
+        ("Headache", "headache"),
+        ("  headache ", "headache"),
+        ("", ""),
+        ("carpal fracture", "carpal fracture"),
+        ("Headache", "headache"),
+    ]
+    assert [ids for _, key, ids in rows if key == "headache"] == [["C0000005"]] * 3
+    assert rows[2][2] == []
+    unordered = client.searchAPI.search_many(strings, ordered=False, max_workers=2)
+    assert sorted(unordered) == sorted(rows)
+
+    path = str(tmp_path / "table.jsonl")
+    assert client.searchAPI.save_search_table(strings, path, format="jsonl") == 5
+    with open(path) as f:
+        assert json.loads(f.readline()) == {
+            "string": "Headache",
+            "normalized": "headache",
+            "ids": ["C0000005"],
+        }
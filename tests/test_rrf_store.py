@@ -0,0 +1,80 @@
+import sqlite3
+
+import pytest
+
+from umls_python_client.localAPI import RRFStore
+
+TABLES = ("mrconso", "mrrel", "mrsty", "mrdef", "mrsat", "words", "nwords")
+DERIVED = ("concepts", "source_concepts", "hierarchy")
+
+
+class Interrupted(Exception):
+    pass
+
+
+def contents(path):
+    """Every row of the store tables, for comparing two loads."""
+    connection = sqlite3.connect(path)
+    try:
+        return {
+            **{
+                table: connection.execute(
+                    f"SELECT * FROM {table} ORDER BY rowid"
+                ).fetchall()
+                for table in TABLES
+            },
+            **{
+                table: sorted(connection.execute(f"SELECT * FROM {table}").fetchall())
+                for table in DERIVED
+            },
+        }
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def reference(rrf_dir, tmp_path):
+    path = str(tmp_path / "reference.db")
+    RRFStore.from_directory(rrf_dir, path=path).close()
+    return contents(path)
+
+
+def test_chunked_parallel_load_matches_a_single_chunk(rrf_dir, tmp_path, reference):
+    path = str(tmp_path / "chunked.db")
+    store = RRFStore(path)
+    counts = store.load(rrf_dir, max_workers=2, chunk_bytes=100)
+    assert counts["MRCONSO"] == len(reference["mrconso"])
+    assert store.is_loaded and store.release == "2099AA"
+    store.close()
+    assert contents(path) == reference
+
+
+def test_interrupted_load_resumes_from_merged_chunks(rrf_dir, tmp_path, reference):
+    path = str(tmp_path / "resumed.db")
+    merged = []
+
+    def interrupt(name, done, total):
+        merged.append(name)
+        if len(merged) == 4:
+            raise Interrupted
+
+    store = RRFStore(path)
+    with pytest.raises(Interrupted):
+        store.load(rrf_dir, max_workers=1, chunk_bytes=150, progress=interrupt)
+    assert not store.is_loaded
+    assert len(store.merged_chunks("MRCONSO")) == 4
+    store.close()
+
+    # The resumed load keeps the original chunk size and merges only the remaining chunks
+    resumed = []
+    store = RRFStore(path)
+    store.load(
+        rrf_dir,
+        max_workers=1,
+        chunk_bytes=1 << 20,
+        progress=lambda name, done, total: resumed.append(name),
+    )
+    assert store.is_loaded
+    assert resumed.count("MRCONSO") == len(store.merged_chunks("MRCONSO")) - 4
+    store.close()
+    assert contents(path) == reference
@@ -0,0 +1,100 @@
+import itertools
+
+import pytest
+
+from umls_python_client import UMLSClient
+from umls_python_client.localAPI.search_results import search_results
+from umls_python_client.localAPI.string_index import SEARCH_TYPES
+
+
+def queries(store):
+    strings = [row["str"] for row in store._query("SELECT str FROM mrconso")]
+    return sorted(
+        set(strings)
+        | {string.upper() for string in strings}
+        | {string.split()[0] for string in strings}
+        | {string[:4] for string in strings}
+        | {string[-5:] for string in strings}
+        | {"bones fracture", "the of", "of", "fractures of bones", "zzz", ""}
+    )
+
+
+def store_results(store, string, search_type, sabs, flags, return_id_type):
+    rows = store.search(
+        string,
+        search_type,
+        sabs=sabs,
+        include_obsolete=flags[0],
+        include_suppressible=flags[1],
+    )
+    names = store.concept_names(row["cui"] for row in rows)
+    return search_results(
+        rows,
+        lambda row: names.get(row["cui"], row["str"]),
+        return_id_type=return_id_type,
+        version="2099AA",
+    )
+
+
+@pytest.mark.parametrize("search_type", SEARCH_TYPES)
+def test_index_matches_store_search(store, string_index, search_type):
+    combinations = itertools.product(
+        queries(store),
+        (None, ["MSH"], ["SNOMEDCT_US", "ICD10CM"]),
+        ((False, False), (True, True)),
+        ("concept", "aui", "code"),
+    )
+    for string, sabs, flags, return_id_type in combinations:
+        expected = store_results(
+            store, string, search_type, sabs, flags, return_id_type
+        )
+        assert (
+            string_index.search_results(
+                string, search_type, sabs, flags[0], flags[1], return_id_type
+            )
+            == expected
+        ), (string, sabs, flags, return_id_type)
+
+
+def test_stop_words_only_match_nothing(string_index):
+    assert string_index.search_results("Of the", "exact") != []
+    assert string_index.search_results("Of the", "normalizedWords") == []
+
+
+def test_truncation_ranks_and_pages(store, string_index):
+    expected = store_results(
+        store, "fracture", "rightTruncation", None, (True, True), "aui"
+    )
+    assert len(expected) > 2
+    for page_number in (1, 2, 3):
+        page = string_index.search(
+            "fracture",
+            include_obsolete=True,
+            include_suppressible=True,
+            return_id_type="aui",
+            search_type="rightTruncation",
+            page_number=page_number,
+            page_size=2,
+        )["result"]["results"]
+        start = (page_number - 1) * 2
+        assert page == (
+            expected[start : start + 2] or [{"ui": "NONE", "name": "NO RESULTS"}]
+        )
+
+
+def test_client_serves_searches_from_the_index(client, rrf_dir, tmp_path):
+    indexed = UMLSClient(
+        "test-key", rrf_path=rrf_dir, rrf_index_dir=str(tmp_path / "indexes")
+    )
+    try:
+        assert indexed.string_index is not None
+        for search_type, string in itertools.product(
+            SEARCH_TYPES, ("fracture of bone", "Headache", "bone", "carpal")
+        ):
+            assert indexed.searchAPI.search(
+                string, search_type=search_type, return_indented=False
+            ) == client.searchAPI.search(
+                string, search_type=search_type, return_indented=False
+            )
+    finally:
+        indexed.close()
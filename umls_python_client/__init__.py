@@ -1 +1,2 @@
+from .async_umls_client import AsyncUMLSClient
 from .umls_client import UMLSClient
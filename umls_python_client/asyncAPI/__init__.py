@@ -0,0 +1,7 @@
+from .async_api_base import AsyncUMLSAPIBase
+from .async_crosswalk_api import AsyncCrosswalkAPI
+from .async_cui_api import AsyncCUIAPI
+from .async_search_api import AsyncSearchAPI
+from .async_semantic_network_api import AsyncSemanticNetworkAPI
+from .async_session_pool import AsyncSessionPool
+from .async_source_api import AsyncSourceAPI
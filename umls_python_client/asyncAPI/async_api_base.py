@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from umls_python_client.asyncAPI.async_session_pool import (
+    AsyncResponse,
+    AsyncSessionPool,
+    aiohttp,
+)
+from umls_python_client.baseAPI.release_resolver import ReleaseResolver
+from umls_python_client.baseAPI.umls_api_base import UMLSAPIBase
+from umls_python_client.utils.cache import MemoryCache, SQLiteCache
+from umls_python_client.utils.save_output import save_output_to_file
+from umls_python_client.utils.utils import handle_response_with_format
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncUMLSAPIBase(UMLSAPIBase):
+    """
+    Base class for the asyncio API namespaces. Response handling and formatting are shared with
+    the synchronous `UMLSAPIBase`, so both clients return the same data.
+
+    Attributes:
+        api_key (str): The API key used for making requests to the UMLS API.
+        version (str): The version of the UMLS content to use, defaults to "current".
+        base_url (str): The base URL for the UMLS API.
+        session_pool (AsyncSessionPool): The pooled async connections used for all requests.
+        cache (Optional[SQLiteCache]): Persistent cache of parsed responses, shared with other namespaces.
+        memory_cache (Optional[MemoryCache]): In-process LRU cache checked before the persistent cache.
+        release_resolver (Optional[ReleaseResolver]): Resolves "current" to a pinned release. The lookup runs
+            in a worker thread so it never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        version: str = "current",
+        session_pool: Optional[AsyncSessionPool] = None,
+        cache: Optional[SQLiteCache] = None,
+        memory_cache: Optional[MemoryCache] = None,
+        release_resolver: Optional[ReleaseResolver] = None,
+    ):
+        """
+        Initialize the AsyncUMLSAPIBase class.
+        Args:
+            api_key (str): The API key required for all API requests.
+            version (str, optional): The version of the UMLS release to use. Defaults to "current".
+            session_pool (AsyncSessionPool, optional): Async connection pool to share with other namespaces.
+                A private pool is created when not provided.
+            cache (SQLiteCache, optional): Persistent response cache. Responses are not cached when not provided.
+            memory_cache (MemoryCache, optional): In-process response cache. Not used when not provided.
+            release_resolver (ReleaseResolver, optional): Resolver pinning "current" to a concrete release.
+        Raises:
+            ValueError: If the API key is not provided or is empty.
+        """
+        super().__init__(
+            api_key,
+            version,
+            session_pool if session_pool is not None else AsyncSessionPool(),
+            cache,
+            memory_cache,
+            release_resolver,
+        )
+
+    @property
+    def version(self) -> str:
+        """The UMLS release used in URLs and cache keys. Never blocks: see `_refresh_release`."""
+        if self.release_resolver is None or self._version != "current":
+            return self._version
+        return self.release_resolver.release or self._version
+
+    @version.setter
+    def version(self, value: str) -> None:
+        self._version = value
+
+    async def _refresh_release(self) -> None:
+        """Resolve "current" in a worker thread if the resolver is due for a check."""
+        if (
+            self.release_resolver is not None
+            and self._version == "current"
+            and self.release_resolver.needs_refresh()
+        ):
+            await asyncio.to_thread(self.release_resolver.resolve, self._version)
+
+    async def _get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncResponse:
+        """
+        Send a GET request through the shared async connection pool.
+        Args:
+            url (str): The URL to request.
+            params (Optional[Dict[str, Any]]): Query parameters for the request.
+        Returns:
+            AsyncResponse: The HTTP response from the API request.
+        """
+        return await self.session_pool.get(url, params=params)
+
+    async def _fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Perform a GET request and return the parsed response, serving it from the caches when possible.
+        Only successful responses are cached. Persistent cache reads and writes run in a worker thread
+        so SQLite never blocks the event loop.
+        Args:
+            url (str): The URL to request.
+            params (Optional[Dict[str, Any]]): Query parameters for the request.
+        Returns:
+            Any: The parsed JSON response, or a structured error message (see `_handle_response`).
+        """
+        if self.cache is None and self.memory_cache is None:
+            return self._handle_response(await self._get(url, params=params))
+
+        key = self._cache_key(url, params)
+        if self.cache is None:
+            cached = self._cache_lookup(key)
+        else:
+            cached = await asyncio.to_thread(self._cache_lookup, key)
+        if cached is not None:
+            return cached
+
+        response = await self._get(url, params=params)
+        data = self._handle_response(response)
+        if self.cache is None:
+            self._cache_store(key, response.status_code, data)
+        else:
+            await asyncio.to_thread(self._cache_store, key, response.status_code, data)
+        return data
+
+    async def _request(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        file_name: str,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: Optional[str] = None,
+    ) -> Any:
+        """
+        Perform a GET request and handle it exactly like the synchronous API methods do.
+        Args:
+            url (str): The URL to request.
+            params (Dict[str, Any]): Query parameters; None values are dropped.
+            file_name (str): File name used when `save_to_file` is True.
+            return_indented (bool): Whether to return indented JSON.
+            format (str): The output format, 'json' or 'rdf'.
+            save_to_file (bool): Whether to save the parsed response to a file.
+            file_path (Optional[str]): Directory to save the output file in.
+        Returns:
+            Any: The formatted response, or an error dictionary if the request failed.
+        """
+        if format not in ["json", "rdf"]:
+            logger.error(
+                "Invalid output format selected. Available types are json, rdf"
+            )
+            return ""
+
+        params = {k: v for k, v in params.items() if v is not None}
+
+        try:
+            data = await self._fetch(url, params=params)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error during API request: {e}")
+            return {"error": f"Request failed: {e}"}
+
+        if save_to_file:
+            if file_path == None:
+                file_path = file_name
+            else:
+                file_path = os.path.join(file_path, file_name)
+            save_output_to_file(response=data, file_path=file_path)
+
+        return handle_response_with_format(
+            response=data, format=format, return_indented=return_indented
+        )
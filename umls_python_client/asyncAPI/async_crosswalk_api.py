@@ -0,0 +1,47 @@
+import logging
+from typing import Any, Optional
+
+from umls_python_client.asyncAPI.async_api_base import AsyncUMLSAPIBase
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCrosswalkAPI(AsyncUMLSAPIBase):
+    """
+    Asyncio counterpart of `CrosswalkAPI`. Methods take the same arguments and return the same data.
+    """
+
+    async def get_crosswalk(
+        self,
+        source: str,
+        id: str,
+        target_source: Optional[str] = None,
+        include_obsolete: bool = False,
+        page_number: int = 1,
+        page_size: int = 25,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Any:
+        """Retrieve crosswalk data between vocabularies. See `CrosswalkAPI.get_crosswalk`."""
+        params = {
+            "apiKey": self.api_key,
+            "targetSource": target_source,
+            "includeObsolete": str(include_obsolete).lower(),
+            "pageNumber": page_number,
+            "pageSize": page_size,
+        }
+        logger.info(
+            f"Fetching crosswalk data for source: {source}, ID: {id}, target: {target_source}"
+        )
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/crosswalk/{self.version}/source/{source}/{id}",
+            params,
+            file_name=f"crosswalk_{source}.txt",
+            return_indented=return_indented,
+            format=format,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
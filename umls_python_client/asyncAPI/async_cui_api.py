@@ -0,0 +1,131 @@
+import logging
+from typing import Any, Dict, Optional, Union
+
+from umls_python_client.asyncAPI.async_api_base import AsyncUMLSAPIBase
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCUIAPI(AsyncUMLSAPIBase):
+    """
+    Asyncio counterpart of `CUIAPI`. Methods take the same arguments and return the same data.
+    """
+
+    async def get_cui_info(
+        self,
+        cui,
+        return_indented: bool = True,
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Union[str, Dict[str, Any]]:
+        """Fetches detailed information about the specified CUI. See `CUIAPI.get_cui_info`."""
+        logger.info(f"Fetching CUI concept: {cui}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/CUI/{cui}",
+            {"apiKey": self.api_key},
+            file_name=f"cui_info_{cui}.txt",
+            return_indented=return_indented,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_atoms(
+        self,
+        cui: str,
+        return_indented: bool = True,
+        sabs: Optional[str] = None,
+        ttys: Optional[str] = None,
+        language: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        page_number: int = 1,
+        page_size: int = 25,
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Union[str, Dict[str, Any]]:
+        """Fetches atoms associated with the specified CUI. See `CUIAPI.get_atoms`."""
+        params = {
+            "apiKey": self.api_key,
+            "sabs": sabs,
+            "ttys": ttys,
+            "language": language,
+            "includeObsolete": str(include_obsolete).lower(),
+            "includeSuppressible": str(include_suppressible).lower(),
+            "pageNumber": page_number,
+            "pageSize": page_size,
+        }
+        logger.info(f"Fetching CUI atoms for: {cui}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/CUI/{cui}/atoms",
+            params,
+            file_name=f"cui_atoms_{cui}.txt",
+            return_indented=return_indented,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_definitions(
+        self,
+        cui: str,
+        return_indented: bool = True,
+        sabs: Optional[str] = None,
+        page_number: int = 1,
+        page_size: int = 25,
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Union[str, Dict[str, Any]]:
+        """Fetches definitions associated with the specified CUI. See `CUIAPI.get_definitions`."""
+        params = {
+            "apiKey": self.api_key,
+            "sabs": sabs,
+            "pageNumber": page_number,
+            "pageSize": page_size,
+        }
+        logger.info(f"Fetching CUI definitions for: {cui}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/CUI/{cui}/definitions",
+            params,
+            file_name=f"cui_definitions_{cui}.txt",
+            return_indented=return_indented,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_relations(
+        self,
+        cui,
+        return_indented: bool = True,
+        sabs: Optional[str] = None,
+        include_relation_labels: Optional[str] = None,
+        include_additional_labels: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        page_number: int = 1,
+        page_size: int = 25,
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Union[str, Dict[str, Any]]:
+        """Fetches relationships for the specified CUI. See `CUIAPI.get_relations`."""
+        params = {
+            "apiKey": self.api_key,
+            "sabs": sabs,
+            "includeRelationLabels": include_relation_labels,
+            "includeAdditionalRelationLabels": include_additional_labels,
+            "includeObsolete": str(include_obsolete).lower(),
+            "includeSuppressible": str(include_suppressible).lower(),
+            "pageNumber": page_number,
+            "pageSize": page_size,
+        }
+        logger.info(f"Fetching CUI relations for: {cui}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/CUI/{cui}/relations",
+            params,
+            file_name=f"cui_relations_{cui}.txt",
+            return_indented=return_indented,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
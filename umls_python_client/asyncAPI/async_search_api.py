@@ -0,0 +1,56 @@
+import logging
+from typing import Any, Dict, Optional
+
+from umls_python_client.asyncAPI.async_api_base import AsyncUMLSAPIBase
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSearchAPI(AsyncUMLSAPIBase):
+    """
+    Asyncio counterpart of `SearchAPI`. Methods take the same arguments and return the same data.
+    """
+
+    async def search(
+        self,
+        search_string: str,
+        input_type: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        return_id_type: str = "concept",
+        sabs: Optional[str] = None,
+        search_type: str = "words",
+        partial_search: bool = False,
+        page_number: int = 1,
+        page_size: int = 25,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Dict[str, Any]:
+        """Perform a search query on the UMLS Metathesaurus. See `SearchAPI.search`."""
+        params = {
+            "string": search_string,
+            "inputType": input_type,
+            "includeObsolete": str(include_obsolete).lower(),
+            "includeSuppressible": str(include_suppressible).lower(),
+            "returnIdType": return_id_type,
+            "sabs": sabs,
+            "searchType": search_type,
+            "partialSearch": str(partial_search).lower(),
+            "pageNumber": page_number,
+            "pageSize": page_size,
+            "apiKey": self.api_key,
+        }
+        logger.info(f"Searching UMLS for: {search_string}")
+
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/search/{self.version}",
+            params,
+            file_name=f"search_{search_string}.txt",
+            return_indented=return_indented,
+            format=format,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
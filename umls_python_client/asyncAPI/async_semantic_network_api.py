@@ -0,0 +1,36 @@
+import logging
+
+from umls_python_client.asyncAPI.async_api_base import AsyncUMLSAPIBase
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSemanticNetworkAPI(AsyncUMLSAPIBase):
+    """
+    Asyncio counterpart of `SemanticNetworkAPI`. Methods take the same arguments and return the same data.
+    """
+
+    async def get_semantic_type(
+        self,
+        tui: str,
+        save_to_file: bool = False,
+        file_path: str = None,
+        return_indented: bool = True,
+        **kwargs,
+    ):
+        """Retrieve information about a semantic type using its TUI. See `SemanticNetworkAPI.get_semantic_type`."""
+        if "format" in kwargs:
+            logger.warning(
+                "Format is unavailable for this function, it will be enabled in future."
+            )
+
+        logger.info(f"Fetching semantic type for TUI: {tui}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/semantic-network/{self.version}/TUI/{tui}",
+            {"apiKey": self.api_key},
+            file_name=f"semantic_type_{tui}.txt",
+            return_indented=return_indented,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Mapping, Optional
+
+from umls_python_client.utils.rate_limiter import RetryPolicy, TokenBucket
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResponse:
+    """
+    Minimal response object exposing the parts of `requests.Response` used by `UMLSAPIBase._handle_response`.
+
+    Attributes:
+        status_code (int): The HTTP status code.
+        text (str): The decoded response body.
+        headers (Mapping[str, str]): The response headers.
+    """
+
+    def __init__(self, status_code: int, text: str, headers: Mapping[str, str]):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers
+
+    def json(self) -> Any:
+        """Parse the response body as JSON."""
+        return json.loads(self.text)
+
+
+class AsyncSessionPool:
+    """
+    Pool of keep-alive connections shared by all namespaces of an `AsyncUMLSClient`.
+
+    The underlying `aiohttp.ClientSession` is created lazily inside the running event loop.
+    A semaphore caps the number of requests in flight at once. An optional token bucket caps the
+    request rate, and throttled (429) or failed (5xx) requests are retried with jittered
+    exponential backoff that honours `Retry-After`.
+
+    Attributes:
+        max_concurrency (int): Maximum number of requests in flight at once.
+        limit_per_host (int): Maximum number of open connections per host.
+        timeout (Optional[float]): Total timeout in seconds for every request (None waits forever).
+        rate_limiter (Optional[TokenBucket]): Token bucket limiting the request rate.
+        retry_policy (RetryPolicy): Backoff policy for throttled and failed requests.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        limit_per_host: int = 10,
+        gzip: bool = True,
+        timeout: Optional[float] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        """
+        Initialize the AsyncSessionPool.
+
+        Args:
+            max_concurrency (int, optional): Maximum number of requests in flight. Defaults to 10.
+            limit_per_host (int, optional): Maximum number of open connections per host. Defaults to 10.
+            gzip (bool, optional): Ask the server for gzip/deflate compressed responses. Defaults to True.
+            timeout (Optional[float], optional): Request timeout in seconds. Defaults to None.
+            rate_limiter (Optional[TokenBucket], optional): Token bucket limiting the request rate. Defaults to None.
+            retry_policy (Optional[RetryPolicy], optional): Retry policy. Defaults to `RetryPolicy()`.
+        Raises:
+            ImportError: If aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for the async client. Install it with 'pip install aiohttp'."
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.headers: Dict[str, str] = {
+            "Accept-Encoding": "gzip, deflate" if gzip else "identity",
+        }
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _ensure_session(self) -> "aiohttp.ClientSession":
+        """Create the aiohttp session and semaphore on first use inside the event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency, limit_per_host=self.limit_per_host
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncResponse:
+        """
+        Send a GET request over a pooled connection, pacing and retrying it as configured.
+
+        Args:
+            url (str): The URL to request.
+            params (Optional[Dict[str, Any]]): Query parameters for the request.
+
+        Returns:
+            AsyncResponse: The HTTP response with its body already read (the last one if all retries were used up).
+        Raises:
+            aiohttp.ClientError: If the request still fails at the connection level after all retries.
+        """
+        session = self._ensure_session()
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            try:
+                async with self._semaphore:
+                    async with session.get(url, params=params) as response:
+                        text = await response.text()
+                        result = AsyncResponse(
+                            response.status, text, dict(response.headers)
+                        )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.retry_policy.max_retries:
+                    raise
+                delay = self.retry_policy.compute_delay(attempt)
+                logger.warning(
+                    f"Request to {url} failed ({e}), retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if not self.retry_policy.should_retry(result.status_code, attempt):
+                return result
+
+            retry_after = result.headers.get("Retry-After")
+            delay = self.retry_policy.compute_delay(attempt, retry_after)
+            logger.warning(
+                f"Request to {url} returned {result.status_code}, retrying in {delay:.2f}s"
+            )
+            if (
+                result.status_code == 429
+                and retry_after
+                and self.rate_limiter is not None
+            ):
+                # The server asked every client to back off, not only this task
+                self.rate_limiter.pause(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("Closed pooled async UMLS HTTP connections")
@@ -0,0 +1,248 @@
+import logging
+from typing import Any, Dict, Optional, Union
+
+from umls_python_client.asyncAPI.async_api_base import AsyncUMLSAPIBase
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSourceAPI(AsyncUMLSAPIBase):
+    """
+    Asyncio counterpart of the `SourceAPI` getters. Methods take the same arguments and return the same data.
+    """
+
+    async def get_source_concept(
+        self,
+        source: str,
+        id: str,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Union[str, Dict[str, Any]]:
+        """Retrieve a known source-asserted concept. See `SourceAPI.get_source_concept`."""
+        if format not in ["json", "rdf"]:
+            logger.error(
+                "Invalid output format selected. Available types are 'json' and 'rdf'."
+            )
+            raise ValueError("Invalid format. Please choose either 'json' or 'rdf'.")
+
+        logger.info(f"Fetching source concept: {source}/{id}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/source/{source}/{id}",
+            {"apiKey": self.api_key},
+            file_name=f"source_concept_{source}_{id}.txt",
+            return_indented=return_indented,
+            format=format,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_source_atoms(
+        self,
+        source: str,
+        id: str,
+        sabs: Optional[str] = None,
+        ttys: Optional[str] = None,
+        language: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        page_number: int = 1,
+        page_size: int = 25,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Union[str, Dict[str, Any]]:
+        """Retrieve atoms for a known source-asserted identifier. See `SourceAPI.get_source_atoms`."""
+        params = {
+            "apiKey": self.api_key,
+            "sabs": sabs,
+            "ttys": ttys,
+            "language": language,
+            "includeObsolete": str(include_obsolete).lower(),
+            "includeSuppressible": str(include_suppressible).lower(),
+            "pageNumber": page_number,
+            "pageSize": page_size,
+        }
+        logger.info(f"Fetching source atoms for: {source}/{id}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/source/{source}/{id}/atoms",
+            params,
+            file_name=f"source_atoms_{source}_{id}.txt",
+            return_indented=return_indented,
+            format=format,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_source_parents(
+        self,
+        source: str,
+        id: str,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: str = None,
+        page_number: int = 1,
+        page_size: int = 25,
+    ) -> Union[str, Dict[str, Any]]:
+        """Retrieve immediate parents of a known source-asserted identifier. See `SourceAPI.get_source_parents`."""
+        logger.info(f"Fetching parents for: {source}/{id}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/source/{source}/{id}/parents",
+            {"apiKey": self.api_key, "pageNumber": page_number, "pageSize": page_size},
+            file_name=f"source_parents_{source}_{id}.txt",
+            return_indented=return_indented,
+            format=format,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_source_children(
+        self,
+        source: str,
+        id: str,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: str = None,
+        page_number: int = 1,
+        page_size: int = 25,
+    ) -> Union[str, Dict[str, Any]]:
+        """Retrieve immediate children of a known source-asserted identifier. See `SourceAPI.get_source_children`."""
+        logger.info(f"Fetching children for: {source}/{id}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/source/{source}/{id}/children",
+            {"apiKey": self.api_key, "pageNumber": page_number, "pageSize": page_size},
+            file_name=f"source_children_{source}_{id}.txt",
+            return_indented=return_indented,
+            format=format,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_source_ancestors(
+        self,
+        source: str,
+        id: str,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: str = None,
+        page_number: int = 1,
+        page_size: int = 25,
+    ) -> Union[str, Dict[str, Any]]:
+        """Retrieve all ancestors of a known source-asserted identifier. See `SourceAPI.get_source_ancestors`."""
+        logger.info(f"Fetching ancestors for: {source}/{id}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/source/{source}/{id}/ancestors",
+            {"apiKey": self.api_key, "pageNumber": page_number, "pageSize": page_size},
+            file_name=f"source_ancestors_{source}_{id}.txt",
+            return_indented=return_indented,
+            format=format,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_source_descendants(
+        self,
+        source: str,
+        id: str,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: str = None,
+        page_number: int = 1,
+        page_size: int = 25,
+    ) -> Union[str, Dict[str, Any]]:
+        """Retrieve all descendants of a known source-asserted identifier. See `SourceAPI.get_source_descendants`."""
+        logger.info(f"Fetching descendants for: {source}/{id}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/source/{source}/{id}/descendants",
+            {"apiKey": self.api_key, "pageNumber": page_number, "pageSize": page_size},
+            file_name=f"source_descendants_{source}_{id}.txt",
+            return_indented=return_indented,
+            format=format,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_source_attributes(
+        self,
+        source: str,
+        id: str,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Union[str, Dict[str, Any]]:
+        """Retrieve information about source-asserted attributes. See `SourceAPI.get_source_attributes`."""
+        logger.info(f"Fetching attributes for: {source}/{id}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/source/{source}/{id}/attributes",
+            {"apiKey": self.api_key},
+            file_name=f"source_attributes_{source}_{id}.txt",
+            return_indented=return_indented,
+            format=format,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_source_relations(
+        self,
+        source: str,
+        id: str,
+        include_relation_labels: Optional[str] = None,
+        include_additional_labels: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        page_number: int = 1,
+        page_size: int = 25,
+        return_indented: bool = True,
+        format: str = "json",
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Union[str, Dict[str, Any]]:
+        """Retrieve relationships for a known source-asserted identifier. See `SourceAPI.get_source_relations`."""
+        params = {
+            "apiKey": self.api_key,
+            "includeRelationLabels": include_relation_labels,
+            "includeAdditionalRelationLabels": include_additional_labels,
+            "includeObsolete": str(include_obsolete).lower(),
+            "includeSuppressible": str(include_suppressible).lower(),
+            "pageNumber": page_number,
+            "pageSize": page_size,
+        }
+        logger.info(f"Fetching relations for concept: {source}/{id}")
+        await self._refresh_release()
+        return await self._request(
+            f"{self.base_url}/content/{self.version}/source/{source}/{id}/relations",
+            params,
+            file_name=f"source_relations_{source}_{id}.txt",
+            return_indented=return_indented,
+            format=format,
+            save_to_file=save_to_file,
+            file_path=file_path,
+        )
+
+    async def get_relations_by_url(
+        self, relations_url: str, return_indented: bool = True, format: str = "json"
+    ) -> Union[str, Dict[str, Any]]:
+        """Retrieve related concepts from a relations endpoint URL. See `SourceAPI.get_relations_by_url`."""
+        logger.info(f"Fetching relations from URL: {relations_url}")
+        await self._refresh_release()
+        return await self._request(
+            relations_url,
+            {"apiKey": self.api_key},
+            file_name="",
+            return_indented=return_indented,
+            format=format,
+        )
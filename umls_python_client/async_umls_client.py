@@ -0,0 +1,177 @@
+import logging
+from typing import Dict, Optional
+
+from umls_python_client.asyncAPI.async_crosswalk_api import AsyncCrosswalkAPI
+from umls_python_client.asyncAPI.async_cui_api import AsyncCUIAPI
+from umls_python_client.asyncAPI.async_search_api import AsyncSearchAPI
+from umls_python_client.asyncAPI.async_semantic_network_api import (
+    AsyncSemanticNetworkAPI,
+)
+from umls_python_client.asyncAPI.async_session_pool import AsyncSessionPool
+from umls_python_client.asyncAPI.async_source_api import AsyncSourceAPI
+from umls_python_client.baseAPI.release_resolver import ReleaseResolver
+from umls_python_client.baseAPI.session_pool import SessionPool
+from umls_python_client.utils.cache import MemoryCache, SQLiteCache
+from umls_python_client.utils.rate_limiter import RetryPolicy, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncUMLSClient:
+    """
+    AsyncUMLSClient is the asyncio interface to the UMLS APIs. It exposes the same namespaces as
+    `UMLSClient` (searchAPI, sourceAPI, cuiAPI, semanticNetworkAPI, crosswalkAPI) with awaitable
+    methods that return the same data, all sharing one async connection pool.
+
+    Example:
+        async with AsyncUMLSClient(api_key) as client:
+            results = await client.searchAPI.search("diabetes", return_indented=False)
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        version: str = "current",
+        max_concurrency: int = 10,
+        limit_per_host: int = 10,
+        gzip: bool = True,
+        timeout: Optional[float] = None,
+        requests_per_second: Optional[float] = 20.0,
+        burst: Optional[float] = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        cache_max_bytes: Optional[int] = None,
+        memory_cache_entries: Optional[int] = 1024,
+        memory_cache_bytes: Optional[int] = None,
+        memory_cache_ttl: Optional[float] = None,
+        resolve_current: bool = True,
+    ):
+        """
+        Initialize the AsyncUMLSClient with the provided API key and version.
+
+        Args:
+            api_key (str): UMLS API key required for authentication.
+            version (str): UMLS version to use for API calls (default is "current").
+            max_concurrency (int): Maximum number of requests in flight at once (default is 10).
+            limit_per_host (int): Maximum number of open connections per host (default is 10).
+            gzip (bool): Request gzip/deflate compressed responses (default is True).
+            timeout (Optional[float]): Request timeout in seconds (default is None).
+            requests_per_second (Optional[float]): Client-wide request rate limit, None to disable (default is 20).
+            burst (Optional[float]): Number of requests allowed in a burst (default is `requests_per_second`).
+            max_retries (int): Retries for throttled (429) and failed (5xx) requests (default is 3).
+            backoff_factor (float): Base delay in seconds of the exponential backoff (default is 0.5).
+            cache_path (Optional[str]): SQLite file used to cache parsed responses on disk, None to disable (default is None).
+            cache_ttl (Optional[float]): Time to live of cached responses in seconds (default is None, never expire).
+            cache_max_bytes (Optional[int]): Size limit of the disk cache, evicting least recently used entries (default is None).
+            memory_cache_entries (Optional[int]): Entry limit of the in-process LRU cache, 0 to disable (default is 1024).
+            memory_cache_bytes (Optional[int]): Approximate size limit of the in-process cache in bytes (default is None).
+            memory_cache_ttl (Optional[float]): Time to live of in-process cached responses in seconds (default is None).
+            resolve_current (bool): Resolve version "current" to the concrete current release once and use it in
+                URLs and cache keys; cached responses of a superseded release are invalidated (default is True).
+                While the release service is unreachable the lookup is retried at most once a minute, and
+                the request that triggers a retry waits for it (up to `timeout`) before being sent.
+        """
+        # One async connection pool shared by every namespace
+        self.session_pool = AsyncSessionPool(
+            max_concurrency=max_concurrency,
+            limit_per_host=limit_per_host,
+            gzip=gzip,
+            timeout=timeout,
+            rate_limiter=(
+                TokenBucket(requests_per_second, burst) if requests_per_second else None
+            ),
+            retry_policy=RetryPolicy(
+                max_retries=max_retries, backoff_factor=backoff_factor
+            ),
+        )
+
+        # One persistent response cache shared by every namespace
+        self.cache = (
+            SQLiteCache(cache_path, ttl=cache_ttl, max_size_bytes=cache_max_bytes)
+            if cache_path
+            else None
+        )
+        self.memory_cache = (
+            MemoryCache(
+                max_entries=memory_cache_entries,
+                max_bytes=memory_cache_bytes,
+                ttl=memory_cache_ttl,
+            )
+            if memory_cache_entries != 0
+            else None
+        )
+
+        # "current" is pinned to one release shared by every namespace; the lookup runs in a worker
+        # thread, so it uses its own synchronous connection pool
+        self.release_session_pool = (
+            SessionPool(timeout=timeout) if resolve_current else None
+        )
+        self.release_resolver = (
+            ReleaseResolver(
+                self.release_session_pool, caches=[self.memory_cache, self.cache]
+            )
+            if self.release_session_pool is not None
+            else None
+        )
+
+        shared = {
+            "session_pool": self.session_pool,
+            "cache": self.cache,
+            "memory_cache": self.memory_cache,
+            "release_resolver": self.release_resolver,
+        }
+        self.searchAPI = AsyncSearchAPI(api_key, version, **shared)
+        self.sourceAPI = AsyncSourceAPI(api_key, version, **shared)
+        self.cuiAPI = AsyncCUIAPI(api_key, version, **shared)
+        self.semanticNetworkAPI = AsyncSemanticNetworkAPI(api_key, version, **shared)
+        self.crosswalkAPI = AsyncCrosswalkAPI(api_key, version, **shared)
+
+        logger.info(
+            "AsyncUMLSClient initialized with SearchAPI, SourceAPI, CUIAPI, semanticNetworkAPI and crosswalkAPI"
+        )
+
+    def cache_stats(self) -> Dict[str, Optional[Dict[str, int]]]:
+        """
+        Return hit, miss and eviction counters of the response caches.
+
+        Returns:
+            Dict[str, Optional[Dict[str, int]]]: Statistics of the "memory" and "disk" caches (None if disabled).
+        """
+        return {
+            "memory": (
+                self.memory_cache.stats() if self.memory_cache is not None else None
+            ),
+            "disk": self.cache.stats() if self.cache is not None else None,
+        }
+
+    async def close(self) -> None:
+        """Close the pooled connections and the response cache shared by all namespaces."""
+        await self.session_pool.close()
+        if self.release_session_pool is not None:
+            self.release_session_pool.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    @property
+    def release(self) -> str:
+        """The UMLS release the namespaces query ("current" until it has been resolved)."""
+        return self.searchAPI.version
+
+    async def resolve_release(self) -> str:
+        """
+        Resolve version "current" to the concrete current release in a worker thread.
+
+        Returns:
+            str: The release used by every namespace.
+        """
+        await self.searchAPI._refresh_release()
+        return self.release
+
+    async def __aenter__(self) -> "AsyncUMLSClient":
+        await self.resolve_release()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
@@ -1 +1,2 @@
+from .session_pool import SessionPool
 from .umls_api_base import UMLSAPIBase
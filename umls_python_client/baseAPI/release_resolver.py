@@ -0,0 +1,153 @@
+import logging
+import threading
+import time
+from typing import Any, List, Optional
+
+import requests
+
+from umls_python_client.baseAPI.session_pool import SessionPool
+
+logger = logging.getLogger(__name__)
+
+
+class ReleaseResolver:
+    """
+    Resolves the "current" UMLS version to a concrete release (e.g. "2024AB") once and shares it.
+
+    Pinning the release makes results reproducible and lets caches key entries by a real release.
+    The resolution is lazy, happens once per `refresh_interval`, and falls back to "current" if the
+    UTS release service cannot be reached. When a newer release is detected, only the cache entries
+    of the previous release are invalidated.
+
+    Attributes:
+        releases_url (str): URL of the UTS release service.
+        release_type (str): The release type to look up.
+        refresh_interval (Optional[float]): Seconds after which the current release is checked again (None never).
+        caches (List[Any]): Caches whose entries are invalidated when the release changes.
+    """
+
+    META_KEY = "current_release"
+
+    def __init__(
+        self,
+        session_pool: Optional[SessionPool] = None,
+        releases_url: str = "https://uts-ws.nlm.nih.gov/releases",
+        release_type: str = "umls-full-release",
+        refresh_interval: Optional[float] = 24 * 60 * 60,
+        retry_interval: float = 60.0,
+        caches: Optional[List[Any]] = None,
+    ):
+        """
+        Initialize the ReleaseResolver.
+
+        Args:
+            session_pool (SessionPool, optional): Connection pool used to query the release service.
+            releases_url (str, optional): URL of the UTS release service.
+            release_type (str, optional): Release type to look up. Defaults to "umls-full-release".
+            refresh_interval (Optional[float], optional): Seconds between checks for a new release. Defaults to one day.
+            retry_interval (float, optional): Seconds to wait before retrying a failed lookup. Defaults to 60.
+            caches (Optional[List[Any]], optional): Caches to invalidate when the release changes.
+        """
+        self.session_pool = session_pool if session_pool is not None else SessionPool()
+        self.releases_url = releases_url
+        self.release_type = release_type
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.caches = [cache for cache in (caches or []) if cache is not None]
+
+        self._release: Optional[str] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def release(self) -> Optional[str]:
+        """The resolved current release, or None if it has not been resolved yet."""
+        return self._release
+
+    def resolve(self, version: str) -> str:
+        """
+        Resolve a version to a concrete release.
+
+        Args:
+            version (str): The configured version; anything other than "current" is returned as is.
+
+        Returns:
+            str: The pinned release, or "current" if it could not be resolved.
+        """
+        if version != "current":
+            return version
+        if not self.needs_refresh():
+            return self._release or version
+
+        with self._lock:
+            if self.needs_refresh():
+                self._refresh()
+        return self._release or version
+
+    def needs_refresh(self) -> bool:
+        """Return True if the current release has never been checked or is due for another check."""
+        interval = (
+            self.refresh_interval if self._release is not None else self.retry_interval
+        )
+        if self._checked_at == 0.0:
+            return True
+        return interval is not None and time.monotonic() - self._checked_at >= interval
+
+    def _refresh(self) -> None:
+        """Look up the current release and invalidate cache entries of a superseded one."""
+        self._checked_at = time.monotonic()
+        release = self._fetch_current_release()
+        if release is None:
+            return
+
+        previous = self._release or self._persisted_release()
+        if previous and previous != release:
+            logger.info(
+                f"UMLS release changed from {previous} to {release}, invalidating cached {previous} responses"
+            )
+            for cache in self.caches:
+                cache.invalidate_release(previous)
+        # Entries stored before the release was known cannot be attributed to a release
+        for cache in self.caches:
+            cache.invalidate_release("current")
+
+        for cache in self.caches:
+            if hasattr(cache, "set_meta"):
+                cache.set_meta(self.META_KEY, release)
+        if self._release != release:
+            logger.info(f"Resolved UMLS version 'current' to release {release}")
+        self._release = release
+
+    def _persisted_release(self) -> Optional[str]:
+        """Return the release recorded by a persistent cache in an earlier run."""
+        for cache in self.caches:
+            if hasattr(cache, "get_meta"):
+                release = cache.get_meta(self.META_KEY)
+                if release:
+                    return release
+        return None
+
+    def _fetch_current_release(self) -> Optional[str]:
+        """Query the UTS release service for the current release version."""
+        params = {"releaseType": self.release_type, "current": "true"}
+        try:
+            response = self.session_pool.get(self.releases_url, params=params)
+            if response.status_code != 200:
+                logger.warning(
+                    f"Could not resolve the current UMLS release (status {response.status_code}), using 'current'"
+                )
+                return None
+            releases = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(
+                f"Could not resolve the current UMLS release ({e}), using 'current'"
+            )
+            return None
+
+        for release in releases if isinstance(releases, list) else []:
+            if isinstance(release, dict) and release.get("releaseVersion"):
+                return release["releaseVersion"]
+        logger.warning(
+            "The UTS release service returned no current release, using 'current'"
+        )
+        return None
@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from umls_python_client.utils.rate_limiter import (
+    AIMDController,
+    RetryPolicy,
+    TokenBucket,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPool:
+    """
+    Pool of keep-alive HTTP connections shared by all UMLS API namespaces.
+
+    Every thread gets its own `requests.Session` (sessions keep mutable state such as cookies
+    and are not safe to share), but all of those sessions are mounted on one `HTTPAdapter`,
+    so the underlying TCP/TLS connections are pooled and reused across threads.
+
+    The pool is also where request pacing lives: an optional token bucket caps the request rate,
+    an optional AIMD controller adapts the number of requests in flight, and throttled (429) or
+    failed (5xx) requests are retried with jittered exponential backoff that honours `Retry-After`.
+
+    Attributes:
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Maximum number of connections kept alive per host.
+        pool_block (bool): Whether to block when the per-host limit is reached instead of opening extra connections.
+        timeout (Optional[float]): Timeout in seconds applied to every request (None waits forever).
+        headers (Dict[str, str]): Default headers sent with every request.
+        rate_limiter (Optional[TokenBucket]): Token bucket shared by every thread using the pool.
+        concurrency_controller (Optional[AIMDController]): Adaptive limit on requests in flight.
+        retry_policy (RetryPolicy): Backoff policy for throttled and failed requests.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = True,
+        keep_alive: bool = True,
+        gzip: bool = True,
+        timeout: Optional[float] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        concurrency_controller: Optional[AIMDController] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        """
+        Initialize the SessionPool.
+
+        Args:
+            pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of connections kept per host. Defaults to 10.
+            pool_block (bool, optional): Block when all connections to a host are busy. Defaults to True.
+            keep_alive (bool, optional): Keep connections open between requests. Defaults to True.
+            gzip (bool, optional): Ask the server for gzip/deflate compressed responses. Defaults to True.
+            timeout (Optional[float], optional): Request timeout in seconds. Defaults to None.
+            rate_limiter (Optional[TokenBucket], optional): Token bucket limiting the request rate. Defaults to None.
+            concurrency_controller (Optional[AIMDController], optional): AIMD limit on requests in flight. Defaults to None.
+            retry_policy (Optional[RetryPolicy], optional): Retry policy. Defaults to `RetryPolicy()`.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.concurrency_controller = concurrency_controller
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+
+        self.headers: Dict[str, str] = {
+            "Connection": "keep-alive" if keep_alive else "close",
+            "Accept-Encoding": "gzip, deflate" if gzip else "identity",
+        }
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the session bound to the calling thread, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
+
+    def get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        """
+        Send a GET request over a pooled connection, pacing and retrying it as configured.
+
+        Args:
+            url (str): The URL to request.
+            params (Optional[Dict[str, Any]]): Query parameters for the request.
+
+        Returns:
+            requests.Response: The HTTP response (the last one if all retries were used up).
+        Raises:
+            requests.RequestException: If the request still fails at the connection level after all retries.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if self.concurrency_controller is not None:
+                self.concurrency_controller.acquire()
+
+            start = time.monotonic()
+            response = None
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            finally:
+                if self.concurrency_controller is not None:
+                    self.concurrency_controller.release(
+                        time.monotonic() - start,
+                        throttled=response is not None and response.status_code == 429,
+                    )
+
+            if response is None:
+                if attempt >= self.retry_policy.max_retries:
+                    raise error
+                delay = self.retry_policy.compute_delay(attempt)
+                logger.warning(
+                    f"Request to {url} failed ({error}), retrying in {delay:.2f}s"
+                )
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if not self.retry_policy.should_retry(response.status_code, attempt):
+                return response
+
+            retry_after = response.headers.get("Retry-After")
+            delay = self.retry_policy.compute_delay(attempt, retry_after)
+            logger.warning(
+                f"Request to {url} returned {response.status_code}, retrying in {delay:.2f}s"
+            )
+            if (
+                response.status_code == 429
+                and retry_after
+                and self.rate_limiter is not None
+            ):
+                # The server asked every client to back off, not only this thread
+                self.rate_limiter.pause(delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.adapter.close()
+        logger.info("Closed pooled UMLS HTTP connections")
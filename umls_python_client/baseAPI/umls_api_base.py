@@ -1,9 +1,17 @@
 import json
 import logging
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 
 import requests
 
+from umls_python_client.baseAPI.release_resolver import ReleaseResolver
+from umls_python_client.baseAPI.session_pool import SessionPool
+from umls_python_client.localAPI.local_backend import NOT_FOUND, LocalBackend
+from umls_python_client.utils.cache import MemoryCache, SQLiteCache, make_cache_key
+from umls_python_client.utils.concurrency import bounded_map
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -19,24 +27,321 @@ class UMLSAPIBase:
         version (str): The version of the UMLS content to use, defaults to "current".
         base_url (str): The base URL for the UMLS API.
         return_indented (bool): Whether or not to return indented JSON by default.
+        session_pool (SessionPool): The pooled keep-alive HTTP connections used for all requests.
+        cache (Optional[SQLiteCache]): Persistent cache of parsed responses, shared with other namespaces.
+        memory_cache (Optional[MemoryCache]): In-process LRU cache checked before the persistent cache.
+        release_resolver (Optional[ReleaseResolver]): Resolves "current" to a pinned release used in URLs and cache keys.
+        local_backend (Optional[LocalBackend]): Answers requests from local release files instead of UTS.
     """
 
-    def __init__(self, api_key: str, version: str = "current"):
+    def __init__(
+        self,
+        api_key: str,
+        version: str = "current",
+        session_pool: Optional[SessionPool] = None,
+        cache: Optional[SQLiteCache] = None,
+        memory_cache: Optional[MemoryCache] = None,
+        release_resolver: Optional[ReleaseResolver] = None,
+        local_backend: Optional[LocalBackend] = None,
+    ):
         """
         Initialize the UMLSAPIBase class with the API key, version, and return behavior.
         Args:
             api_key (str): The API key required for all API requests.
             version (str, optional): The version of the UMLS release to use. Defaults to "current".
             return_indented (bool, optional): Whether to return indented JSON by default. Defaults to True.
+            session_pool (SessionPool, optional): Connection pool to share with other API namespaces.
+                A private pool is created when not provided.
+            cache (SQLiteCache, optional): Persistent response cache. Responses are not cached when not provided.
+            memory_cache (MemoryCache, optional): In-process response cache. Not used when not provided.
+            release_resolver (ReleaseResolver, optional): Resolver pinning "current" to a concrete release.
+                The literal "current" is used when not provided.
+            local_backend (LocalBackend, optional): Serve every request from local release files.
+                No API key is needed and nothing is sent over the network when provided.
         Raises:
-            ValueError: If the API key is not provided or is empty.
+            ValueError: If the API key is not provided or is empty and no local backend is given.
         """
-        if not api_key:
+        if not api_key and local_backend is None:
             raise ValueError("API key is required for UMLS API requests.")
 
         self.api_key = api_key
         self.base_url = "https://uts-ws.nlm.nih.gov/rest"
+        self.release_resolver = release_resolver
         self.version = version
+        self.session_pool = session_pool if session_pool is not None else SessionPool()
+        self.cache = cache
+        self.memory_cache = memory_cache
+        self.local_backend = local_backend
+
+    @property
+    def version(self) -> str:
+        """The UMLS release used in URLs and cache keys, with "current" resolved when possible."""
+        if self.release_resolver is None:
+            return self._version
+        return self.release_resolver.resolve(self._version)
+
+    @version.setter
+    def version(self, value: str) -> None:
+        self._version = value
+
+    def _get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        """
+        Send a GET request through the shared connection pool.
+        Args:
+            url (str): The URL to request.
+            params (Optional[Dict[str, Any]]): Query parameters for the request.
+        Returns:
+            requests.Response: The HTTP response from the API request.
+        """
+        return self.session_pool.get(url, params=params)
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        """Build the cache key of a request from the release, the URL path and the parameters."""
+        return make_cache_key(self.version, urlparse(url).path, params)
+
+    def _cache_lookup(self, key: str) -> Optional[Any]:
+        """Look a response up in the memory cache, then in the persistent cache."""
+        if self.memory_cache is not None:
+            cached = self.memory_cache.get(key)
+            if cached is not None:
+                return cached
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if self.memory_cache is not None:
+                    self.memory_cache.set(key, cached, release=self.version)
+                return cached
+        return None
+
+    def _cache_store(self, key: str, status_code: int, data: Any) -> None:
+        """Store a successful parsed response in every configured cache."""
+        if status_code != 200 or not isinstance(data, (dict, list)):
+            return
+        if self.memory_cache is not None:
+            self.memory_cache.set(key, data, release=self.version)
+        if self.cache is not None:
+            self.cache.set(key, data, release=self.version)
+
+    def _fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Perform a GET request and return the parsed response, serving it from the caches when possible.
+        Only successful responses are cached. With a local backend the request is answered from local
+        release files instead.
+        Args:
+            url (str): The URL to request.
+            params (Optional[Dict[str, Any]]): Query parameters for the request.
+        Returns:
+            Any: The parsed JSON response, or a structured error message (see `_handle_response`).
+        """
+        if self.local_backend is not None:
+            return self.local_backend.fetch(url, params)
+        if self.cache is None and self.memory_cache is None:
+            return self._handle_response(self._get(url, params=params))
+
+        key = self._cache_key(url, params)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            logger.debug(f"Cache hit for {url}")
+            return cached
+
+        response = self._get(url, params=params)
+        data = self._handle_response(response)
+        self._cache_store(key, response.status_code, data)
+        return data
+
+    @staticmethod
+    def _page_results(data: Any) -> List[Any]:
+        """
+        Extract the items of one page of a paged response.
+        Args:
+            data (Any): The parsed response of a paged endpoint.
+        Returns:
+            List[Any]: The items on the page (search results are nested under `result.results`).
+        """
+        result = data.get("result", []) if isinstance(data, dict) else []
+        if isinstance(result, dict):
+            result = result.get("results", [])
+        if not isinstance(result, list):
+            return []
+        # The search endpoint marks an exhausted result set with a single "NO RESULTS" entry
+        if (
+            len(result) == 1
+            and isinstance(result[0], dict)
+            and result[0].get("ui") == "NONE"
+        ):
+            return []
+        return result
+
+    def _iter_pages(
+        self,
+        fetch_page: Callable[[int], Any],
+        page_size: int,
+        max_items: Optional[int] = None,
+        start_page: int = 1,
+        strict: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Lazily walk a paged endpoint, fetching the next page only when the previous one is used up.
+        Args:
+            fetch_page (Callable[[int], Any]): Returns the parsed response for a page number.
+            page_size (int): The page size requested by `fetch_page`.
+            max_items (Optional[int]): Stop after yielding this many items (None for all).
+            start_page (int): The first page to fetch.
+            strict (bool): Raise on a failed page instead of logging it and stopping.
+        Yields:
+            Any: The items of every page, in order.
+        Raises:
+            RuntimeError: If `strict` is True and a page could not be fetched.
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        yielded = 0
+        page_number = start_page
+        while True:
+            data = fetch_page(page_number)
+            if not isinstance(data, dict) or "error" in data:
+                if strict:
+                    raise RuntimeError(f"Failed to fetch page {page_number}: {data}")
+                logger.warning(f"Stopping pagination at page {page_number}: {data}")
+                return
+
+            results = self._page_results(data)
+            for item in results:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+
+            # Search responses carry no pageCount; a short page means the last one
+            page_count = data.get("pageCount")
+            if not results:
+                return
+            if page_count is not None:
+                if page_number >= page_count:
+                    return
+            elif len(results) < page_size:
+                return
+            page_number += 1
+
+    def _fetch_all_pages(
+        self,
+        fetch_page: Callable[[int], Any],
+        page_size: int,
+        max_workers: int = 8,
+    ) -> List[Any]:
+        """
+        Fetch every page of a paged endpoint, requesting the pages after the first one concurrently.
+        A missing resource (404 on the first page) has no items; any other failed page raises, so a
+        returned list is always complete.
+        Args:
+            fetch_page (Callable[[int], Any]): Returns the parsed response for a page number. Must be thread-safe.
+            page_size (int): The page size requested by `fetch_page`.
+            max_workers (int): Maximum number of pages fetched at once.
+        Returns:
+            List[Any]: The items of all pages, in page order.
+        Raises:
+            RuntimeError: If a page could not be fetched once the retries of the session pool were exhausted.
+        """
+        first = fetch_page(1)
+        if isinstance(first, dict) and first.get("error") == NOT_FOUND["error"]:
+            return []
+        if not isinstance(first, dict) or "error" in first:
+            raise RuntimeError(f"Failed to fetch page 1: {first}")
+
+        results = list(self._page_results(first))
+        page_count = first.get("pageCount")
+        if page_count is None:
+            # Without a page count the pages can only be discovered one after another
+            if len(results) >= page_size:
+                results.extend(
+                    self._iter_pages(fetch_page, page_size, start_page=2, strict=True)
+                )
+            return results
+        if page_count <= 1:
+            return results
+
+        logger.info(f"Fetching {page_count - 1} remaining pages concurrently")
+        page_numbers = range(2, page_count + 1)
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(page_numbers))
+        ) as executor:
+            # map() yields in submission order, so the pages are reassembled in order
+            for page_number, data in zip(
+                page_numbers, executor.map(fetch_page, page_numbers)
+            ):
+                if not isinstance(data, dict) or "error" in data:
+                    raise RuntimeError(f"Failed to fetch page {page_number}: {data}")
+                results.extend(self._page_results(data))
+        return results
+
+    def get_all_pages(
+        self,
+        getter: Callable[..., Any],
+        *args: Any,
+        page_size: int = 25,
+        max_workers: int = 8,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Fetch the whole result set of any paged API method, reading `pageCount` from the first page
+        and fetching the remaining pages concurrently with a bounded pool.
+        Args:
+            getter (Callable[..., Any]): A paged API method, e.g. `cuiAPI.get_relations`.
+            *args (Any): Positional arguments for the method (e.g. the CUI).
+            page_size (int): Number of items per page. Defaults to 25.
+            max_workers (int): Maximum number of pages fetched at once. Defaults to 8.
+            **kwargs (Any): Additional keyword arguments for the method.
+        Returns:
+            List[Any]: The items of all pages, in order (empty if the resource does not exist).
+        Raises:
+            RuntimeError: If a page could not be fetched once the retries were exhausted.
+        """
+        return self._fetch_all_pages(
+            lambda page_number: getter(
+                *args,
+                return_indented=False,
+                page_number=page_number,
+                page_size=page_size,
+                **kwargs,
+            ),
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
+    def _map_many(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_workers: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[Any, Any]]:
+        """
+        Run a lookup for every distinct item concurrently, skipping repeated items.
+        Args:
+            func (Callable[[Any], Any]): The lookup to run for one item. Must be thread-safe.
+            items (Iterable[Any]): The items to look up, possibly a generator.
+            max_workers (int): Maximum number of lookups in flight at once.
+            ordered (bool): Yield in input order (True) or in completion order (False).
+        Yields:
+            Tuple[Any, Any]: Each distinct item with its result, or an error dictionary if the lookup raised.
+        """
+        seen = set()
+
+        def distinct() -> Iterator[Any]:
+            for item in items:
+                if item not in seen:
+                    seen.add(item)
+                    yield item
+
+        for item, result in bounded_map(
+            func, distinct(), max_workers=max_workers, ordered=ordered
+        ):
+            if isinstance(result, Exception):
+                logger.error(f"Lookup for {item} failed: {result}")
+                result = {"error": f"Request failed: {result}"}
+            yield item, result
 
     def _format_json(self, data: Dict[str, Any]) -> str:
         """
@@ -88,11 +393,7 @@ class UMLSAPIBase:
         # Handle Not Found (404)
         if response.status_code == 404:
             logger.error("Not Found: The requested resource does not exist.")
-            error_response = {
-                "error": "Resource not found. The requested resource could not be found.",
-                "resolution": "Check the endpoint or resource identifier in the request.",
-            }
-            return error_response
+            return dict(NOT_FOUND)
         # Handle other client or server errors (4xx or 5xx)
         error_message = {
             "error": "API request failed.",
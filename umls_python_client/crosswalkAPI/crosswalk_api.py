@@ -1,11 +1,14 @@
 import logging
 import os
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import requests
 
 from umls_python_client.baseAPI.umls_api_base import UMLSAPIBase
-from umls_python_client.utils.save_output import save_output_to_file
+from umls_python_client.utils.save_output import (
+    save_output_to_file,
+    save_rows_to_file,
+)
 from umls_python_client.utils.utils import handle_response_with_format
 
 # Configure logging
@@ -15,6 +18,9 @@ logging.basicConfig(
 logger = logging.getLogger()
 
 
+CROSSWALK_TABLE_FIELDS = ("source", "id", "target_source", "target_id", "target_name")
+
+
 class CrosswalkAPI(UMLSAPIBase):
     """
     A class to interact with the UMLS REST API's Crosswalk functionality, inheriting from UMLSAPIBase.
@@ -82,7 +88,7 @@ class CrosswalkAPI(UMLSAPIBase):
 
         # Make the API request
         try:
-            response = requests.get(url, params=params)
+            response = self._fetch(url, params=params)
         except requests.RequestException as e:
             logger.error(f"Error during API request: {e}")
             return {"error": f"Request failed: {e}"}
@@ -93,13 +99,179 @@ class CrosswalkAPI(UMLSAPIBase):
             else:
                 file_path = os.path.join(file_path, f"crosswalk_{source}.txt")
                 print("RAN", file_path)
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         # Handle the response
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             format=format,
             return_indented=return_indented,
         )
+
+    def iter_crosswalk(
+        self,
+        source: str,
+        id: str,
+        target_source: Optional[str] = None,
+        include_obsolete: bool = False,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all crosswalk mappings of a code, fetching the next page only when it is needed.
+
+        Args:
+            source (str): The source vocabulary abbreviation, such as 'HPO'.
+            id (str): The identifier code from the source vocabulary, e.g., 'HP:0001947'.
+            target_source (Optional[str], optional): The target vocabulary abbreviation. Defaults to None.
+            include_obsolete (bool, optional): Determines whether to return obsolete codes. Defaults to False.
+            page_size (int, optional): Number of mappings fetched per request. Defaults to 25.
+            max_items (Optional[int], optional): Stop after this many mappings. Defaults to None (all).
+
+        Yields:
+            Dict[str, Any]: One mapped concept at a time.
+        """
+        return self._iter_pages(
+            lambda page_number: self.get_crosswalk(
+                source,
+                id,
+                target_source=target_source,
+                include_obsolete=include_obsolete,
+                page_number=page_number,
+                page_size=page_size,
+                return_indented=False,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    def crosswalk_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        target_sources: Union[str, Sequence[str], None] = None,
+        include_obsolete: bool = False,
+        page_size: int = 200,
+        max_workers: int = 8,
+        ordered: bool = True,
+        skip_failed: bool = False,
+    ) -> Iterator[Tuple[str, str, str, str, str]]:
+        """
+        Crosswalk many source codes to one or more target vocabularies concurrently, following every page.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): (source, id) pairs such as ('HPO', 'HP:0001947'); may be a generator.
+                Repeated pairs are looked up once.
+            target_sources (Union[str, Sequence[str], None], optional): One or more target vocabularies, such as
+                'SNOMEDCT_US'. Defaults to None (all vocabularies).
+            include_obsolete (bool, optional): Determines whether to return obsolete codes. Defaults to False.
+            page_size (int, optional): Number of mappings fetched per request. Defaults to 200.
+            max_workers (int, optional): Maximum number of crosswalks in flight at once. Defaults to 8.
+            ordered (bool, optional): Yield in input order (True) or as soon as each crosswalk finishes (False).
+            skip_failed (bool, optional): Log and skip codes whose crosswalk failed instead of raising. Defaults to False.
+
+        Yields:
+            Tuple[str, str, str, str, str]: Distinct (source, id, target_source, target_id, target_name) rows.
+            Codes without mappings produce no rows.
+
+        Raises:
+            RuntimeError: If a crosswalk failed and `skip_failed` is False.
+        """
+        if target_sources is None or isinstance(target_sources, str):
+            target_sources = [target_sources]
+
+        def lookups() -> Iterator[Tuple[str, str, Optional[str]]]:
+            for source, id in pairs:
+                for target_source in target_sources:
+                    yield source, id, target_source
+
+        def crosswalk_one(lookup: Tuple[str, str, Optional[str]]) -> List[Any]:
+            source, id, target_source = lookup
+            return self._fetch_all_pages(
+                lambda page_number: self.get_crosswalk(
+                    source,
+                    id,
+                    target_source=target_source,
+                    include_obsolete=include_obsolete,
+                    page_number=page_number,
+                    page_size=page_size,
+                    return_indented=False,
+                ),
+                page_size=page_size,
+                max_workers=1,
+            )
+
+        for (source, id, target_source), mappings in self._map_many(
+            crosswalk_one, lookups(), max_workers=max_workers, ordered=ordered
+        ):
+            if isinstance(mappings, dict):
+                if not skip_failed:
+                    raise RuntimeError(
+                        f"Crosswalk of {source}/{id} failed: {mappings['error']}"
+                    )
+                logger.error(f"Crosswalk of {source}/{id} failed: {mappings}")
+                continue
+            seen = set()
+            for mapping in mappings:
+                row = (
+                    source,
+                    id,
+                    mapping.get("rootSource", target_source),
+                    mapping.get("ui"),
+                    mapping.get("name"),
+                )
+                if row not in seen:
+                    seen.add(row)
+                    yield row
+
+    def save_crosswalk_table(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        file_path: str,
+        target_sources: Union[str, Sequence[str], None] = None,
+        format: str = "csv",
+        **kwargs: Any,
+    ) -> int:
+        """
+        Stream the mapping table of `crosswalk_many` to a CSV or JSON Lines file.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): (source, id) pairs to crosswalk; may be a generator.
+            file_path (str): The path of the output file.
+            target_sources (Union[str, Sequence[str], None], optional): One or more target vocabularies.
+            format (str, optional): Either 'csv' or 'jsonl'. Defaults to 'csv'.
+            **kwargs: Additional arguments for `crosswalk_many`.
+
+        Returns:
+            int: The number of rows written.
+        """
+        return save_rows_to_file(
+            self.crosswalk_many(pairs, target_sources, **kwargs),
+            file_path,
+            fieldnames=CROSSWALK_TABLE_FIELDS,
+            format=format,
+        )
+
+    def build_crosswalk_index(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        target_sources: Union[str, Sequence[str], None] = None,
+        **kwargs: Any,
+    ) -> Dict[Tuple[str, str], List[Tuple[str, str]]]:
+        """
+        Load the mapping table of `crosswalk_many` into a dictionary for constant-time lookups.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): (source, id) pairs to crosswalk; may be a generator.
+            target_sources (Union[str, Sequence[str], None], optional): One or more target vocabularies.
+            **kwargs: Additional arguments for `crosswalk_many`.
+
+        Returns:
+            Dict[Tuple[str, str], List[Tuple[str, str]]]: Maps (source, id) to its (target_source, target_id)
+            pairs. Codes without mappings are absent.
+        """
+        index: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for source, id, target_source, target_id, _ in self.crosswalk_many(
+            pairs, target_sources, **kwargs
+        ):
+            index.setdefault((source, id), []).append((target_source, target_id))
+        return index
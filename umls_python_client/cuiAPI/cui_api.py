@@ -1,8 +1,6 @@
 import logging
 import os
-from typing import Any, Dict, Optional, Union
-
-import requests
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 from umls_python_client.baseAPI.umls_api_base import UMLSAPIBase
 from umls_python_client.utils.save_output import save_output_to_file
@@ -50,7 +48,7 @@ class CUIAPI(UMLSAPIBase):
 
         url = f"{self.base_url}/content/{self.version}/CUI/{cui}"
         params = {"apiKey": self.api_key}
-        response = requests.get(url, params=params)
+        response = self._fetch(url, params=params)
         logger.info(f"Fetching CUI concept: {cui}")
 
         # Save to file if required
@@ -59,12 +57,10 @@ class CUIAPI(UMLSAPIBase):
                 file_path = f"cui_info_{cui}.txt"
             else:
                 file_path = os.path.join(file_path, f"cui_info_{cui}.txt")
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             return_indented=return_indented,
         )
 
@@ -105,7 +101,7 @@ class CUIAPI(UMLSAPIBase):
         # Filter out any None values from params
         params = {k: v for k, v in params.items() if v is not None}
 
-        response = requests.get(url, params=params)
+        response = self._fetch(url, params=params)
         logger.info(f"Fetching CUI atoms for: {cui}")
 
         # Save to file if required
@@ -114,12 +110,10 @@ class CUIAPI(UMLSAPIBase):
                 file_path = f"cui_atoms_{cui}.txt"
             else:
                 file_path = os.path.join(file_path, f"cui_atoms_{cui}.txt")
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             return_indented=return_indented,
         )
 
@@ -152,7 +146,7 @@ class CUIAPI(UMLSAPIBase):
         # Filter out any None values from params
         params = {k: v for k, v in params.items() if v is not None}
 
-        response = requests.get(url, params=params)
+        response = self._fetch(url, params=params)
         logger.info(f"Fetching CUI definitions for: {cui}")
 
         # Save to file if required
@@ -161,12 +155,10 @@ class CUIAPI(UMLSAPIBase):
                 file_path = f"cui_definitions_{cui}.txt"
             else:
                 file_path = os.path.join(file_path, f"cui_definitions_{cui}.txt")
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             return_indented=return_indented,
         )
 
@@ -207,7 +199,7 @@ class CUIAPI(UMLSAPIBase):
         # Filter out any None values from params
         params = {k: v for k, v in params.items() if v is not None}
 
-        response = requests.get(url, params=params)
+        response = self._fetch(url, params=params)
         logger.info(f"Fetching CUI relations for: {cui}")
 
         # Save to file if required
@@ -216,11 +208,182 @@ class CUIAPI(UMLSAPIBase):
                 file_path = f"cui_relations_{cui}.txt"
             else:
                 file_path = os.path.join(file_path, f"cui_relations_{cui}.txt")
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             return_indented=return_indented,
         )
+
+    def iter_atoms(
+        self,
+        cui: str,
+        sabs: Optional[str] = None,
+        ttys: Optional[str] = None,
+        language: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all atoms of a CUI, fetching the next page only when it is needed.
+        - Parameters:
+            - cui (str): The Concept Unique Identifier (CUI) to query.
+            - page_size (int): Number of atoms fetched per request.
+            - max_items (int, optional): Stop after this many atoms.
+        - Yields:
+            - One atom dictionary at a time.
+        """
+        return self._iter_pages(
+            lambda page_number: self.get_atoms(
+                cui,
+                return_indented=False,
+                sabs=sabs,
+                ttys=ttys,
+                language=language,
+                include_obsolete=include_obsolete,
+                include_suppressible=include_suppressible,
+                page_number=page_number,
+                page_size=page_size,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    def iter_definitions(
+        self,
+        cui: str,
+        sabs: Optional[str] = None,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all definitions of a CUI, fetching the next page only when it is needed.
+        - Parameters:
+            - cui (str): The Concept Unique Identifier (CUI) to query.
+            - page_size (int): Number of definitions fetched per request.
+            - max_items (int, optional): Stop after this many definitions.
+        - Yields:
+            - One definition dictionary at a time.
+        """
+        return self._iter_pages(
+            lambda page_number: self.get_definitions(
+                cui,
+                return_indented=False,
+                sabs=sabs,
+                page_number=page_number,
+                page_size=page_size,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    def iter_relations(
+        self,
+        cui: str,
+        sabs: Optional[str] = None,
+        include_relation_labels: Optional[str] = None,
+        include_additional_labels: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all relations of a CUI, fetching the next page only when it is needed.
+        - Parameters:
+            - cui (str): The Concept Unique Identifier (CUI) to query.
+            - page_size (int): Number of relations fetched per request.
+            - max_items (int, optional): Stop after this many relations.
+        - Yields:
+            - One relation dictionary at a time.
+        """
+        return self._iter_pages(
+            lambda page_number: self.get_relations(
+                cui,
+                return_indented=False,
+                sabs=sabs,
+                include_relation_labels=include_relation_labels,
+                include_additional_labels=include_additional_labels,
+                include_obsolete=include_obsolete,
+                include_suppressible=include_suppressible,
+                page_number=page_number,
+                page_size=page_size,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    def get_cui_info_many(
+        self,
+        cuis: Iterable[str],
+        max_workers: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Fetches information about many CUIs concurrently.
+        - Parameters:
+            - cuis (Iterable[str]): The CUIs to query; may be a generator. Repeated CUIs are fetched and yielded once.
+            - max_workers (int): Maximum number of requests in flight at once.
+            - ordered (bool): Yield in input order (True) or as soon as each lookup finishes (False).
+        - Returns:
+            - An iterator of (cui, result) pairs, where a failed lookup yields an error dictionary
+              instead of aborting the batch.
+        """
+        return self._map_many(
+            lambda cui: self.get_cui_info(cui, return_indented=False),
+            cuis,
+            max_workers=max_workers,
+            ordered=ordered,
+        )
+
+    def get_atoms_many(
+        self,
+        cuis: Iterable[str],
+        max_workers: int = 8,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Fetches the atoms of many CUIs concurrently.
+        - Parameters:
+            - cuis (Iterable[str]): The CUIs to query; may be a generator. Repeated CUIs are fetched and yielded once.
+            - max_workers (int): Maximum number of requests in flight at once.
+            - ordered (bool): Yield in input order (True) or as soon as each lookup finishes (False).
+            - **kwargs: Filters and paging passed to `get_atoms` (sabs, ttys, language, page_size, ...).
+        - Returns:
+            - An iterator of (cui, result) pairs, where a failed lookup yields an error dictionary
+              instead of aborting the batch.
+        """
+        return self._map_many(
+            lambda cui: self.get_atoms(cui, return_indented=False, **kwargs),
+            cuis,
+            max_workers=max_workers,
+            ordered=ordered,
+        )
+
+    def get_definitions_many(
+        self,
+        cuis: Iterable[str],
+        max_workers: int = 8,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Fetches the definitions of many CUIs concurrently.
+        - Parameters:
+            - cuis (Iterable[str]): The CUIs to query; may be a generator. Repeated CUIs are fetched and yielded once.
+            - max_workers (int): Maximum number of requests in flight at once.
+            - ordered (bool): Yield in input order (True) or as soon as each lookup finishes (False).
+            - **kwargs: Filters and paging passed to `get_definitions` (sabs, page_size, ...).
+        - Returns:
+            - An iterator of (cui, result) pairs, where a failed lookup yields an error dictionary
+              instead of aborting the batch.
+        """
+        return self._map_many(
+            lambda cui: self.get_definitions(cui, return_indented=False, **kwargs),
+            cuis,
+            max_workers=max_workers,
+            ordered=ordered,
+        )
@@ -0,0 +1,4 @@
+from .fuzzy_index import FuzzyIndex
+from .local_backend import LocalBackend
+from .rrf_store import RRFStore
+from .string_index import StringIndex
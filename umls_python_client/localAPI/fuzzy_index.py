@@ -0,0 +1,518 @@
+import logging
+import math
+import mmap
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from umls_python_client.localAPI.search_results import search_response
+from umls_python_client.localAPI.string_index import StringIndex
+from umls_python_client.utils.concurrency import bounded_map
+from umls_python_client.utils.mapped_sections import (
+    StringTable,
+    build_string_table,
+    close_sections,
+    load_sections,
+    save_sections,
+)
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"UMLSFZX1"
+FORMAT_VERSION = 1
+# Section order in the file
+SECTIONS = (
+    ("entry_key", "i"),
+    ("size_offsets", "q"),
+    ("gram_offsets", "q"),
+    ("gram_blob", "B"),
+    ("gram_post_offsets", "q"),
+    ("gram_postings", "i"),
+)
+
+GRAM = 3
+# Marks the start and end of a string, so its first and last characters form features too
+PAD = "$" * (GRAM - 1)
+MEASURES = ("cosine", "jaccard", "dice")
+# Posting list length per candidate above which candidates are binary searched in the list
+# instead of intersected with it
+_SEARCH_RATIO = 32
+
+
+def features(text: str) -> List[str]:
+    """
+    Return the character trigram features of a string, as in SimString.
+
+    The string is padded at both ends, and repeated trigrams are numbered ('abc', 'abc1', ...),
+    so the features form a set whose size is always `len(text) + 2`.
+
+    Args:
+        text (str): The string, already lowercased.
+
+    Returns:
+        List[str]: The distinct features.
+    """
+    padded = f"{PAD}{text}{PAD}"
+    seen: Dict[str, int] = {}
+    grams = []
+    for i in range(len(padded) - GRAM + 1):
+        gram = padded[i : i + GRAM]
+        count = seen.get(gram, 0)
+        seen[gram] = count + 1
+        grams.append(f"{gram}{count}" if count else gram)
+    return grams
+
+
+def _size_bounds(measure: str, size: int, threshold: float) -> Tuple[int, int]:
+    """Range of feature set sizes that can reach `threshold` against a query of `size` features."""
+    if measure == "cosine":
+        low, high = threshold * threshold * size, size / (threshold * threshold)
+    elif measure == "jaccard":
+        low, high = threshold * size, size / threshold
+    else:
+        low, high = (
+            threshold / (2 - threshold) * size,
+            (2 - threshold) / threshold * size,
+        )
+    return math.ceil(low - 1e-9), math.floor(high + 1e-9)
+
+
+def _min_overlap(measure: str, size: int, other: int, threshold: float) -> int:
+    """Smallest number of shared features for which two sets of these sizes reach `threshold`."""
+    if measure == "cosine":
+        overlap = threshold * math.sqrt(size * other)
+    elif measure == "jaccard":
+        overlap = threshold * (size + other) / (1 + threshold)
+    else:
+        overlap = threshold * (size + other) / 2
+    return max(1, math.ceil(overlap - 1e-9))
+
+
+def _similarity(measure: str, size: int, other: int, overlap: int) -> float:
+    if measure == "cosine":
+        return overlap / math.sqrt(size * other)
+    if measure == "jaccard":
+        return overlap / (size + other - overlap)
+    return 2 * overlap / (size + other)
+
+
+class FuzzyIndex:
+    """
+    Approximate string matching over the atom strings of a StringIndex, after SimString.
+
+    Every distinct lowercase string of the string index is an entry, described by its character
+    trigrams. Entries are numbered by feature count, so each count owns a contiguous range of
+    entry numbers and the posting list of a trigram, sorted by entry, is bucketed by length. A
+    query only reads the part of each posting list whose lengths can reach the similarity
+    threshold, counts entries over the shortest lists and binary searches the longest ones
+    (the CPMerge algorithm). Matched entries lead back to their atoms through the string index,
+    so results are ranked like the other local searches and keep the `SearchAPI.search` shape.
+
+    Attributes:
+        strings (StringIndex): The index holding the atoms of the entries.
+        path (Optional[str]): The file a loaded index is mapped from.
+    """
+
+    def __init__(
+        self,
+        strings: StringIndex,
+        sections: Dict[str, Sequence[int]],
+        mapped: Optional[mmap.mmap] = None,
+        gram_cache_size: int = 1 << 16,
+    ):
+        """
+        Initialize the FuzzyIndex from its arrays. Use `build` or `load` instead.
+
+        Args:
+            strings (StringIndex): The string index the entries refer to.
+            sections (Dict[str, Sequence[int]]): The arrays named in `SECTIONS`.
+            mapped (Optional[mmap.mmap]): The memory map backing the arrays, if any.
+            gram_cache_size (int): Number of trigram lookups to cache.
+        """
+        self.strings = strings
+        self.path: Optional[str] = None
+        self._sections = sections
+        self._mmap = mapped
+        self._keys = strings.keys("exact")
+        self._grams = StringTable(sections["gram_blob"], sections["gram_offsets"])
+        # Common trigrams recur across queries; skip their binary search over the mapped table
+        self._gram_bounds = lru_cache(maxsize=gram_cache_size)(self._find_gram)
+
+    @classmethod
+    def build(cls, strings: StringIndex) -> "FuzzyIndex":
+        """
+        Build the index over the lowercase strings of a string index.
+
+        Args:
+            strings (StringIndex): The string index.
+
+        Returns:
+            FuzzyIndex: The in-memory index.
+        """
+        keys = strings.keys("exact")
+        by_size: Dict[int, List[int]] = {}
+        for i, key in enumerate(keys):
+            by_size.setdefault(len(key) + GRAM - 1, []).append(i)
+        max_size = max(by_size, default=0)
+
+        entry_key = array("i")
+        size_offsets = array("q", [0])
+        for size in range(max_size + 1):
+            entry_key.extend(by_size.get(size, ()))
+            size_offsets.append(len(entry_key))
+
+        postings: Dict[str, array] = {}
+        for entry, key in enumerate(entry_key):
+            for feature in features(keys[key]):
+                posting = postings.get(feature)
+                if posting is None:
+                    posting = postings[feature] = array("i")
+                posting.append(entry)
+
+        grams = sorted(postings)
+        gram_offsets, gram_blob = build_string_table(grams)
+        gram_post_offsets, gram_postings = array("q", [0]), array("i")
+        for gram in grams:
+            gram_postings.extend(postings.pop(gram))
+            gram_post_offsets.append(len(gram_postings))
+        logger.info(
+            f"Built fuzzy index with {len(entry_key)} strings and {len(grams)} features"
+        )
+        return cls(
+            strings,
+            {
+                "entry_key": entry_key,
+                "size_offsets": size_offsets,
+                "gram_offsets": gram_offsets,
+                "gram_blob": gram_blob,
+                "gram_post_offsets": gram_post_offsets,
+                "gram_postings": gram_postings,
+            },
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Write the index to a file that `load` can memory-map.
+
+        Args:
+            path (str): The file to write.
+        """
+        save_sections(
+            path,
+            MAGIC,
+            {
+                "version": FORMAT_VERSION,
+                "release": self.strings.release,
+                "entries": len(self),
+            },
+            [(name, typecode, self._sections[name]) for name, typecode in SECTIONS],
+        )
+        logger.info(f"Saved fuzzy index to {path}")
+
+    @classmethod
+    def load(cls, path: str, strings: StringIndex) -> "FuzzyIndex":
+        """
+        Memory-map an index written by `save`.
+
+        Args:
+            path (str): The index file.
+            strings (StringIndex): The string index it was built from.
+
+        Returns:
+            FuzzyIndex: The index, backed by the file.
+        Raises:
+            ValueError: If the file is not a fuzzy index, was written in an incompatible format or
+                was built from another string index.
+        """
+        header, sections, mapped = load_sections(
+            path, MAGIC, "fuzzy index", FORMAT_VERSION
+        )
+        if header["release"] != strings.release or header["entries"] != len(
+            strings.keys("exact")
+        ):
+            close_sections(sections, mapped)
+            raise ValueError(f"{path} was built from another string index.")
+        index = cls(strings, sections, mapped)
+        index.path = path
+        return index
+
+    def close(self) -> None:
+        """Release the memory map of a loaded index."""
+        close_sections(self._sections, self._mmap)
+        self._mmap = None
+
+    def __enter__(self) -> "FuzzyIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._sections["entry_key"])
+
+    def _find_gram(self, feature: str) -> Tuple[int, int]:
+        """Return the bounds of the posting list of a feature, empty if no string has it."""
+        i = bisect_left(self._grams, feature)
+        if i == len(self._grams) or self._grams[i] != feature:
+            return 0, 0
+        offsets = self._sections["gram_post_offsets"]
+        return offsets[i], offsets[i + 1]
+
+    def matches(
+        self, string: str, measure: str = "cosine", threshold: float = 0.7
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the strings similar to a query.
+
+        Args:
+            string (str): The query.
+            measure (str): 'cosine' (default), 'jaccard' or 'dice' similarity of the trigram sets.
+            threshold (float): Minimum similarity, in (0, 1].
+
+        Returns:
+            List[Tuple[str, float]]: The matching lowercase strings and their similarity, most similar
+            first and, among equally similar strings, in the rank order of their best atom.
+        Raises:
+            ValueError: If the measure or threshold is not supported.
+        """
+        return [
+            (self._keys[key], similarity)
+            for key, similarity in self._match_keys(string, measure, threshold)
+        ]
+
+    def _match_keys(
+        self, string: str, measure: str, threshold: float
+    ) -> List[Tuple[int, float]]:
+        """Return the exact keys of the string index similar to a query, ranked as in `matches`."""
+        if measure not in MEASURES:
+            raise ValueError(
+                f"Unsupported measure: {measure}. Available measures are {', '.join(MEASURES)}"
+            )
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1].")
+        query = features(string.lower())
+        size = len(query)
+        size_offsets = self._sections["size_offsets"]
+        low, high = _size_bounds(measure, size, threshold)
+        high = min(high, len(size_offsets) - 2)
+        if low > high:
+            return []
+        postings = self._sections["gram_postings"]
+        # Posting lists of the query features that have entries of a reachable size; the
+        # cursors advance through them one size bucket at a time
+        first, last = size_offsets[low], size_offsets[high + 1]
+        bounds = []
+        for start, end in map(self._gram_bounds, query):
+            start = bisect_left(postings, first, start, end)
+            end = bisect_left(postings, last, start, end)
+            if start < end:
+                bounds.append([start, end])
+
+        entry_key = self._sections["entry_key"]
+        found = []
+        for other in range(low, high + 1):
+            if size_offsets[other] == size_offsets[other + 1]:
+                continue
+            last = size_offsets[other + 1]
+            lists = []
+            for cursor in bounds:
+                start = cursor[0]
+                cursor[0] = bisect_left(postings, last, start, cursor[1])
+                if cursor[0] > start:
+                    lists.append((start, cursor[0]))
+            required = _min_overlap(measure, size, other, threshold)
+            # A match shares a feature with the shortest `size - required + 1` lists, counting
+            # the empty lists of the other features; the longer lists only confirm candidates
+            prefix = len(lists) - required + 1
+            if prefix <= 0:
+                continue
+            lists.sort(key=lambda span: span[1] - span[0])
+            counts = Counter(
+                chain.from_iterable(
+                    postings[start:end] for start, end in lists[:prefix]
+                )
+            )
+            for i in range(prefix, len(lists)):
+                if not counts:
+                    break
+                start, end = lists[i]
+                if (end - start) > _SEARCH_RATIO * len(counts):
+                    # Few candidates: binary search them in the long list
+                    hits = []
+                    for entry in sorted(counts):
+                        start = bisect_left(postings, entry, start, end)
+                        if start < end and postings[start] == entry:
+                            hits.append(entry)
+                else:
+                    hits = counts.keys() & postings[start:end]
+                for entry in hits:
+                    counts[entry] += 1
+                # Drop the candidates that cannot reach `required` with the lists left
+                least = required - (len(lists) - i - 1)
+                if least > 1:
+                    counts = {
+                        entry: count
+                        for entry, count in counts.items()
+                        if count >= least
+                    }
+
+            for entry, overlap in counts.items():
+                if overlap < required:
+                    continue
+                similarity = _similarity(measure, size, other, overlap)
+                if similarity >= threshold - 1e-9:
+                    key = entry_key[entry]
+                    best = self.strings.key_postings("exact", key)[0]
+                    found.append((-similarity, best, key))
+        found.sort()
+        return [(key, -similarity) for similarity, _, key in found]
+
+    def search_results(
+        self,
+        string: str,
+        measure: str = "cosine",
+        threshold: float = 0.7,
+        sabs: Optional[Sequence[str]] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        return_id_type: str = "concept",
+        base_url: str = "https://uts-ws.nlm.nih.gov/rest",
+        version: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run an approximate search and shape the matches like the results of the UTS search endpoint.
+
+        Args:
+            string (str): The query, possibly misspelled.
+            measure (str): 'cosine', 'jaccard' or 'dice'.
+            threshold (float): Minimum similarity of a matching string.
+            sabs (Optional[Sequence[str]]): Only atoms of these sources.
+            include_obsolete (bool): Include obsolete atoms.
+            include_suppressible (bool): Include suppressible atoms.
+            return_id_type (str): The identifier of each result, as in `SearchAPI.search`.
+            base_url (str): Base of the result URIs.
+            version (Optional[str]): The release used in result URIs. Defaults to the index release.
+            limit (Optional[int]): Return the top `limit` results (None for all).
+
+        Returns:
+            List[Dict[str, Any]]: The results (ui, rootSource, uri, name), most similar first.
+        """
+        atoms = chain.from_iterable(
+            self.strings.key_postings("exact", key)
+            for key, _ in self._match_keys(string, measure, threshold)
+        )
+        return self.strings.results(
+            self.strings.filter_atoms(
+                atoms, sabs, include_obsolete, include_suppressible
+            ),
+            return_id_type,
+            base_url,
+            version,
+            limit,
+        )
+
+    def search(
+        self,
+        search_string: str,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        return_id_type: str = "concept",
+        sabs: Optional[str] = None,
+        measure: str = "cosine",
+        threshold: float = 0.7,
+        page_number: int = 1,
+        page_size: int = 25,
+    ) -> Dict[str, Any]:
+        """
+        Search approximately, returning a response shaped like the one of `SearchAPI.search`.
+
+        Parameters:
+            search_string (str): The search term, possibly misspelled.
+            include_obsolete (bool, optional): Return content that matches on obsolete terms. Default is False.
+            include_suppressible (bool, optional): Return content that matches on suppressible terms. Default is False.
+            return_id_type (str, optional): Specifies the type of identifier to retrieve. Default is 'concept'.
+            sabs (str, optional): Comma-separated list of source vocabularies to include in your search.
+            measure (str, optional): 'cosine' (default), 'jaccard' or 'dice' similarity of the trigram sets.
+            threshold (float, optional): Minimum similarity of a matching string. Default is 0.7.
+            page_number (int, optional): Specifies the page of results to fetch. Default is 1.
+            page_size (int, optional): Specifies the number of results to include per page, i.e. the top k. Default is 25.
+
+        Returns:
+            Dict[str, Any]: The search results, most similar first.
+        """
+        results = self.search_results(
+            search_string,
+            measure=measure,
+            threshold=threshold,
+            sabs=[sab for sab in (sabs or "").split(",") if sab],
+            include_obsolete=include_obsolete,
+            include_suppressible=include_suppressible,
+            return_id_type=return_id_type,
+            limit=page_number * page_size,
+        )
+        return search_response(results, page_number, page_size)
+
+    def search_many(
+        self, search_strings: Sequence[str], max_workers: int = 1, **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Run `search` for many queries, e.g. the terms extracted from a batch of notes.
+
+        Repeated queries are searched once. With several workers the queries are spread over a
+        process pool whose workers map the same index files, so the index is shared through the
+        page cache instead of being copied.
+
+        Args:
+            search_strings (Sequence[str]): The queries.
+            max_workers (int, optional): Worker processes; 1 (default) searches in this process.
+                Requires an index loaded from files when greater than 1.
+            **kwargs: Other arguments of `search`.
+
+        Returns:
+            List[Dict[str, Any]]: One response per query, in order.
+        Raises:
+            ValueError: If several workers are asked for an index that was not loaded from files.
+        """
+        distinct = list(dict.fromkeys(search_strings))
+        if max_workers <= 1 or len(distinct) <= 1:
+            responses = {query: self.search(query, **kwargs) for query in distinct}
+            return [responses[query] for query in search_strings]
+        if self.path is None or self.strings.path is None:
+            raise ValueError("Parallel search requires indexes loaded from files.")
+
+        responses = {}
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_open_worker_index,
+            initargs=(self.path, self.strings.path),
+        ) as executor:
+            searched = bounded_map(
+                _worker_search,
+                [(query, kwargs) for query in distinct],
+                max_workers=max_workers,
+                executor=executor,
+            )
+            for (query, _), response in searched:
+                if isinstance(response, Exception):
+                    raise response
+                responses[query] = response
+        return [responses[query] for query in search_strings]
+
+
+# Index opened by each worker process of FuzzyIndex.search_many
+_worker_index: Optional[FuzzyIndex] = None
+
+
+def _open_worker_index(path: str, strings_path: str) -> None:
+    global _worker_index
+    _worker_index = FuzzyIndex.load(path, StringIndex.load(strings_path))
+
+
+def _worker_search(task: Tuple[str, Dict[str, Any]]) -> Dict[str, Any]:
+    query, kwargs = task
+    return _worker_index.search(query, **kwargs)
@@ -0,0 +1,461 @@
+import logging
+import math
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from umls_python_client.localAPI.rrf_store import RRFStore
+from umls_python_client.localAPI.search_results import (
+    RETURN_ID_COLUMNS,
+    search_response,
+    search_results,
+)
+from umls_python_client.localAPI.string_index import SEARCH_TYPES as STRING_INDEX_TYPES
+from umls_python_client.localAPI.string_index import StringIndex
+
+logger = logging.getLogger(__name__)
+
+NOT_FOUND = {
+    "error": "Resource not found. The requested resource could not be found.",
+    "resolution": "Check the endpoint or resource identifier in the request.",
+}
+
+# Endpoints of the UTS REST API served locally, matched on the URL path
+ROUTES = (
+    ("search", re.compile(r"/search/(?P<version>[^/]+)$")),
+    (
+        "concept",
+        re.compile(
+            r"/content/(?P<version>[^/]+)/CUI/(?P<cui>[^/]+)(?:/(?P<endpoint>[A-Za-z]+))?$"
+        ),
+    ),
+    (
+        "source",
+        re.compile(
+            r"/content/(?P<version>[^/]+)/source/(?P<source>[^/]+)/(?P<id>[^/]+)"
+            r"(?:/(?P<endpoint>[A-Za-z]+))?$"
+        ),
+    ),
+    (
+        "crosswalk",
+        re.compile(
+            r"/crosswalk/(?P<version>[^/]+)/source/(?P<source>[^/]+)/(?P<id>[^/]+)$"
+        ),
+    ),
+)
+
+
+def _flag(params: Dict[str, Any], key: str) -> bool:
+    return str(params.get(key, "false")).lower() == "true"
+
+
+def _list(params: Dict[str, Any], key: str) -> Optional[List[str]]:
+    value = params.get(key)
+    if not value:
+        return None
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+
+def _status(suppress: str) -> Dict[str, bool]:
+    return {"suppressible": suppress not in ("N", ""), "obsolete": suppress == "O"}
+
+
+class LocalBackend:
+    """
+    Answers UTS REST requests from an RRFStore, so the API namespaces run without the network.
+
+    The backend receives the same URL and query parameters the namespaces would send to UTS and
+    returns the parsed JSON that UTS would return: the same envelopes, paging fields, result
+    objects and error messages. Every namespace method, including the paging, bulk and composite
+    helpers built on top of the endpoints, therefore works unchanged against local release files.
+
+    Attributes:
+        store (RRFStore): The local Metathesaurus.
+        base_url (str): Base of the URLs embedded in results (e.g. a concept's `atoms` link).
+        string_index (Optional[StringIndex]): Answers exact, normalized and truncation atom searches, if given.
+    """
+
+    def __init__(
+        self,
+        store: RRFStore,
+        base_url: str = "https://uts-ws.nlm.nih.gov/rest",
+        string_index: Optional[StringIndex] = None,
+    ):
+        """
+        Initialize the LocalBackend.
+
+        Args:
+            store (RRFStore): The loaded store.
+            base_url (str, optional): Base of the URLs embedded in results. Defaults to the UTS REST API.
+            string_index (Optional[StringIndex], optional): Memory-mapped index answering `exact`,
+                normalized and truncation atom searches instead of the store.
+        """
+        self.store = store
+        self.base_url = base_url
+        self.string_index = string_index
+        self._handlers: Dict[str, Callable[..., Any]] = {
+            "search": self._search,
+            "concept": self._concept,
+            "source": self._source,
+            "crosswalk": self._crosswalk,
+        }
+
+    def fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Answer a request the way the UTS REST API would.
+
+        Args:
+            url (str): The request URL; only its path is used.
+            params (Optional[Dict[str, Any]]): The query parameters.
+
+        Returns:
+            Any: The parsed JSON response, or the structured error message of a 404 response.
+        """
+        path = urlparse(url).path
+        params = params or {}
+        for name, pattern in ROUTES:
+            match = pattern.search(path)
+            if match:
+                groups = match.groupdict()
+                version = groups.pop("version")
+                try:
+                    result = self._handlers[name](
+                        version=version, params=params, **groups
+                    )
+                except ValueError as e:
+                    logger.error(f"API request failed with status code 400: {e}")
+                    return {
+                        "error": "API request failed.",
+                        "status_code": 400,
+                        "message": str(e),
+                    }
+                if result is None:
+                    logger.error("Not Found: The requested resource does not exist.")
+                    return dict(NOT_FOUND)
+                return result
+        logger.error(f"Not Found: {path} is not available from local release files.")
+        return dict(NOT_FOUND)
+
+    @staticmethod
+    def _page(items: List[Any], params: Dict[str, Any]) -> Dict[str, Any]:
+        """Wrap one page of a list endpoint in the UTS paging envelope."""
+        page_number = int(params.get("pageNumber", 1))
+        page_size = int(params.get("pageSize", 25))
+        start = (page_number - 1) * page_size
+        return {
+            "pageSize": page_size,
+            "pageNumber": page_number,
+            "pageCount": math.ceil(len(items) / page_size) if page_size > 0 else 0,
+            "result": items[start : start + page_size],
+        }
+
+    def _content_url(self, version: str, *parts: str) -> str:
+        return "/".join((self.base_url, "content", version, *parts))
+
+    def _source_concept_entry(
+        self,
+        version: str,
+        source: str,
+        code: str,
+        name: Optional[str],
+        suppress: str = "N",
+    ) -> Dict[str, Any]:
+        """A source-asserted concept in the shape of the UTS SourceAtomCluster objects."""
+        url = self._content_url(version, "source", source, code)
+        return {
+            "classType": "SourceAtomCluster",
+            "ui": code,
+            **_status(suppress),
+            "rootSource": source,
+            "attributes": f"{url}/attributes",
+            "atoms": f"{url}/atoms",
+            "ancestors": f"{url}/ancestors",
+            "parents": f"{url}/parents",
+            "children": f"{url}/children",
+            "descendants": f"{url}/descendants",
+            "relations": f"{url}/relations",
+            "defaultPreferredAtom": f"{url}/atoms/preferred",
+            "name": name,
+        }
+
+    def _atom_entry(self, version: str, row: Any) -> Dict[str, Any]:
+        """An MRCONSO row in the shape of the UTS Atom objects."""
+        source = row["sab"]
+
+        def source_url(identifier: str) -> str:
+            if not identifier:
+                return "NONE"
+            return self._content_url(version, "source", source, identifier)
+
+        return {
+            "classType": "Atom",
+            "ui": row["aui"],
+            **_status(row["suppress"]),
+            "rootSource": source,
+            "termType": row["tty"],
+            "code": source_url(row["code"]),
+            "concept": self._content_url(version, "CUI", row["cui"]),
+            "sourceConcept": source_url(row["scui"]),
+            "sourceDescriptor": source_url(row["sdui"]),
+            "name": row["str"],
+            "language": row["lat"],
+        }
+
+    def _atoms(
+        self, version: str, params: Dict[str, Any], **lookup: Any
+    ) -> List[Dict[str, Any]]:
+        rows = self.store.atoms(
+            sabs=_list(params, "sabs"),
+            ttys=_list(params, "ttys"),
+            language=params.get("language"),
+            include_obsolete=_flag(params, "includeObsolete"),
+            include_suppressible=_flag(params, "includeSuppressible"),
+            **lookup,
+        )
+        return [self._atom_entry(version, row) for row in rows]
+
+    @staticmethod
+    def _filter_labels(rows: Sequence[Any], params: Dict[str, Any]) -> List[Any]:
+        labels = _list(params, "includeRelationLabels")
+        additional = _list(params, "includeAdditionalRelationLabels")
+        return [
+            row
+            for row in rows
+            if (not labels or row["rel"] in labels)
+            and (not additional or row["rela"] in additional)
+        ]
+
+    def _concept(
+        self, version: str, params: Dict[str, Any], cui: str, endpoint: Optional[str]
+    ) -> Any:
+        concept = self.store.concept(cui)
+        if concept is None:
+            return None
+
+        if endpoint is None:
+            url = self._content_url(version, "CUI", cui)
+            counts = self.store.concept_counts(cui)
+            semantic_types = [
+                {
+                    "name": row["sty"],
+                    "uri": f"{self.base_url}/semantic-network/{version}/TUI/{row['tui']}",
+                }
+                for row in self.store.semantic_types(cui)
+            ]
+            return {
+                "pageSize": 25,
+                "pageNumber": 1,
+                "pageCount": 1,
+                "result": {
+                    "classType": "Concept",
+                    "ui": cui,
+                    "suppressible": concept["suppress"] not in ("N", ""),
+                    "semanticTypes": semantic_types,
+                    "atomCount": counts["atomCount"],
+                    "attributeCount": counts["attributeCount"],
+                    "relationCount": counts["relationCount"],
+                    "atoms": f"{url}/atoms",
+                    "definitions": (
+                        f"{url}/definitions" if counts["definitionCount"] else "NONE"
+                    ),
+                    "relations": (
+                        f"{url}/relations" if counts["relationCount"] else "NONE"
+                    ),
+                    "defaultPreferredAtom": f"{url}/atoms/preferred",
+                    "name": concept["name"],
+                },
+            }
+        if endpoint == "atoms":
+            return self._page(self._atoms(version, params, cui=cui), params)
+        if endpoint == "definitions":
+            definitions = [
+                {
+                    "classType": "Definition",
+                    "sourceOriginated": True,
+                    "rootSource": row["sab"],
+                    "value": row["def"],
+                }
+                for row in self.store.definitions(cui, sabs=_list(params, "sabs"))
+            ]
+            return self._page(definitions, params)
+        if endpoint == "relations":
+            rows = self.store.concept_relations(
+                cui,
+                sabs=_list(params, "sabs"),
+                include_obsolete=_flag(params, "includeObsolete"),
+                include_suppressible=_flag(params, "includeSuppressible"),
+            )
+            relations = [
+                {
+                    "classType": "ConceptRelation",
+                    "ui": row["rui"],
+                    **_status(row["suppress"]),
+                    "sourceUi": row["srui"] or "NONE",
+                    "sourceOriginated": row["sab"] != "MTH",
+                    "rootSource": row["sab"],
+                    "groupId": row["rg"] or "NONE",
+                    "relationLabel": row["rel"],
+                    "additionalRelationLabel": row["rela"],
+                    "relatedId": self._content_url(version, "CUI", row["cui2"]),
+                    "relatedIdName": row["related_name"],
+                }
+                for row in self._filter_labels(rows, params)
+            ]
+            return self._page(relations, params)
+        return None
+
+    def _source(
+        self,
+        version: str,
+        params: Dict[str, Any],
+        source: str,
+        id: str,
+        endpoint: Optional[str],
+    ) -> Any:
+        concept = self.store.source_concept(source, id)
+        if concept is None:
+            return None
+
+        if endpoint is None:
+            entry = self._source_concept_entry(
+                version, source, id, concept["name"], concept["suppress"]
+            )
+            entry["atomCount"] = len(self.store.atoms(source=source, code=id))
+            entry["concepts"] = (
+                f"{self.base_url}/search/{version}?string={id}&sabs={source}"
+                "&searchType=exact&inputType=sourceUi"
+            )
+            return {"pageSize": 25, "pageNumber": 1, "pageCount": 1, "result": entry}
+        if endpoint == "atoms":
+            return self._page(
+                self._atoms(version, params, source=source, code=id), params
+            )
+        if endpoint in ("parents", "children", "ancestors", "descendants"):
+            codes = getattr(self.store, endpoint)(source, id)
+            names = self.store.source_names(source, codes)
+            entries = [
+                self._source_concept_entry(version, source, code, names.get(code))
+                for code in codes
+            ]
+            return self._page(entries, params)
+        if endpoint == "attributes":
+            attributes = [
+                {
+                    "classType": "Attribute",
+                    "ui": row["atui"],
+                    "sourceUi": row["satui"] or "NONE",
+                    "rootSource": row["sab"],
+                    "name": row["atn"],
+                    "value": row["atv"],
+                }
+                for row in self.store.source_attributes(source, id)
+            ]
+            return self._page(attributes, params)
+        if endpoint == "relations":
+            rows = self.store.source_relations(
+                source,
+                id,
+                include_obsolete=_flag(params, "includeObsolete"),
+                include_suppressible=_flag(params, "includeSuppressible"),
+            )
+            relations = []
+            seen = set()
+            for row in self._filter_labels(rows, params):
+                if row["rui"] in seen:
+                    continue
+                seen.add(row["rui"])
+                related = (
+                    self._content_url(
+                        version, "source", row["related_sab"], row["related_code"]
+                    )
+                    if row["related_code"]
+                    else self._content_url(version, "CUI", row["cui2"])
+                )
+                relations.append(
+                    {
+                        "classType": "AtomClusterRelation",
+                        "ui": row["rui"],
+                        **_status(row["suppress"]),
+                        "sourceUi": row["srui"] or "NONE",
+                        "sourceOriginated": True,
+                        "rootSource": row["sab"],
+                        "groupId": row["rg"] or "NONE",
+                        "relationLabel": row["rel"],
+                        "additionalRelationLabel": row["rela"],
+                        "relatedId": related,
+                        "relatedIdName": row["related_name"],
+                    }
+                )
+            return self._page(relations, params)
+        return None
+
+    def _crosswalk(
+        self, version: str, params: Dict[str, Any], source: str, id: str
+    ) -> Any:
+        if self.store.source_concept(source, id) is None:
+            return None
+        rows = self.store.crosswalk(
+            source,
+            id,
+            target_sources=_list(params, "targetSource"),
+            include_obsolete=_flag(params, "includeObsolete"),
+        )
+        entries = [
+            self._source_concept_entry(version, row["sab"], row["code"], row["name"])
+            for row in rows
+        ]
+        return self._page(entries, params)
+
+    def _search(self, version: str, params: Dict[str, Any]) -> Any:
+        page_number = int(params.get("pageNumber", 1))
+        page_size = int(params.get("pageSize", 25))
+        string = str(params.get("string", ""))
+        search_type = params.get("searchType", "words")
+        input_type = params.get("inputType")
+        sabs = _list(params, "sabs")
+        include_obsolete = _flag(params, "includeObsolete")
+        include_suppressible = _flag(params, "includeSuppressible")
+        limit = page_number * page_size
+
+        if (
+            self.string_index is not None
+            and search_type in STRING_INDEX_TYPES
+            and input_type in (None, "atom")
+        ):
+            results = self.string_index.search_results(
+                string,
+                search_type=search_type,
+                sabs=sabs,
+                include_obsolete=include_obsolete,
+                include_suppressible=include_suppressible,
+                return_id_type=params.get("returnIdType", "concept"),
+                base_url=self.base_url,
+                version=version,
+                limit=limit,
+            )
+            return search_response(results, page_number, page_size)
+
+        rows = self.store.search(
+            string,
+            search_type=search_type,
+            input_type=input_type,
+            sabs=sabs,
+            include_obsolete=include_obsolete,
+            include_suppressible=include_suppressible,
+            partial_search=_flag(params, "partialSearch"),
+        )
+        return_id_type = params.get("returnIdType", "concept")
+        names = (
+            self.store.concept_names(row["cui"] for row in rows)
+            if RETURN_ID_COLUMNS.get(return_id_type, "cui") == "cui"
+            else {}
+        )
+        results = search_results(
+            rows,
+            lambda row: names.get(row["cui"], row["str"]),
+            return_id_type=return_id_type,
+            base_url=self.base_url,
+            version=version,
+            limit=limit,
+        )
+        return search_response(results, page_number, page_size)
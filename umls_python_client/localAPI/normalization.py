@@ -0,0 +1,88 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List
+
+# Words dropped by normalization, following the stop words of the NLM norm program
+STOP_WORDS = frozenset(
+    ("a", "an", "and", "by", "for", "in", "of", "on", "or", "the", "to", "with")
+)
+
+_SPLIT = re.compile(r"[^0-9a-z]+")
+_GENITIVE = re.compile(r"'s\b")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split a string into lowercase alphanumeric words, as used by the `words` search.
+
+    Args:
+        text (str): The string to split.
+
+    Returns:
+        List[str]: The words, in order.
+    """
+    return [word for word in _SPLIT.split(_fold(text)) if word]
+
+
+def normalize_words(text: str) -> List[str]:
+    """
+    Normalize the words of a string, as used by the `normalizedWords` search.
+
+    Words are case and diacritic folded, genitive marks and stop words are removed and plural
+    forms are reduced to their singular with simple suffix rules. This approximates the lexical
+    normalization of the NLM norm program without its lexicon.
+
+    Args:
+        text (str): The string to normalize.
+
+    Returns:
+        List[str]: The distinct normalized words, sorted.
+    """
+    folded = _GENITIVE.sub("", _fold(text))
+    return sorted(
+        {
+            _uninflect(word)
+            for word in _SPLIT.split(folded)
+            if word and word not in STOP_WORDS
+        }
+    )
+
+
+def normalize_string(text: str) -> str:
+    """
+    Normalize a whole string, as used by the `normalizedString` search.
+
+    Two strings normalize to the same value when they have the same normalized words, regardless
+    of word order, case, punctuation or inflection.
+
+    Args:
+        text (str): The string to normalize.
+
+    Returns:
+        str: The normalized words joined by single spaces.
+    """
+    return " ".join(normalize_words(text))
+
+
+def _fold(text: str) -> str:
+    """Lowercase a string and strip its diacritics."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+# Vocabularies reuse a small set of words, so most lookups are cache hits
+@lru_cache(maxsize=1 << 18)
+def _uninflect(word: str) -> str:
+    """Reduce a plural noun to its singular form."""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    if word.endswith(("ches", "shes", "sses", "xes", "zes")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
@@ -0,0 +1,247 @@
+import logging
+import mmap
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from umls_python_client.localAPI.normalization import normalize_words, tokenize
+from umls_python_client.utils.concurrency import bounded_map
+
+logger = logging.getLogger(__name__)
+
+# Columns of the supported Metathesaurus files, in file order
+RRF_COLUMNS = {
+    "MRCONSO": (
+        "cui", "lat", "ts", "lui", "stt", "sui", "ispref", "aui", "saui",
+        "scui", "sdui", "sab", "tty", "code", "str", "srl", "suppress", "cvf",
+    ),
+    "MRREL": (
+        "cui1", "aui1", "stype1", "rel", "cui2", "aui2", "stype2", "rela",
+        "rui", "srui", "sab", "sl", "rg", "dir", "suppress", "cvf",
+    ),
+    "MRSTY": ("cui", "tui", "stn", "sty", "atui", "cvf"),
+    "MRDEF": ("cui", "aui", "atui", "satui", "sab", "def", "suppress", "cvf"),
+    "MRSAT": (
+        "cui", "lui", "sui", "metaui", "stype", "code", "atui", "satui", "atn",
+        "sab", "atv", "suppress", "cvf",
+    ),
+}  # fmt: skip
+
+# Columns derived from MRCONSO.STR at load time
+CONSO_DERIVED = ("str_lower", "rev_lower", "norm")
+
+# Columns of every table filled from the files
+TABLE_COLUMNS = {
+    **{name.lower(): columns for name, columns in RRF_COLUMNS.items()},
+    "mrconso": RRF_COLUMNS["MRCONSO"] + CONSO_DERIVED,
+    "words": ("word", "aui"),
+    "nwords": ("word", "aui"),
+}
+
+# Tables filled from each file
+FILE_TABLES = {
+    **{name: (name.lower(),) for name in RRF_COLUMNS},
+    "MRCONSO": ("mrconso", "words", "nwords"),
+}
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def table_schema(tables: Iterable[str]) -> str:
+    """Return the CREATE TABLE statements of store tables."""
+    return "".join(
+        f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(TABLE_COLUMNS[table])});\n"
+        for table in tables
+    )
+
+
+def parse_rrf_lines(name: str, lines: Iterable[str]) -> Dict[str, List[Tuple]]:
+    """
+    Parse the lines of a Metathesaurus file into rows of the store tables.
+
+    MRCONSO rows are extended with their lowercase, reversed and normalized strings, and the
+    words of each atom are emitted as rows of the `words` and `nwords` tables.
+
+    Args:
+        name (str): The file name without extension, e.g. 'MRCONSO'.
+        lines (Iterable[str]): The pipe-delimited lines.
+
+    Returns:
+        Dict[str, List[Tuple]]: Rows by table name.
+    """
+    width = len(RRF_COLUMNS[name])
+    rows = []
+    tables = {name.lower(): rows}
+    conso = name == "MRCONSO"
+    if conso:
+        words = tables["words"] = []
+        nwords = tables["nwords"] = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line:
+            continue
+        fields = line.split("|", width)[:width]
+        if len(fields) < width:
+            fields += [""] * (width - len(fields))
+        if conso:
+            string, aui = fields[14], fields[7]
+            lowered = string.lower()
+            normalized = normalize_words(string)
+            fields += [lowered, lowered[::-1], " ".join(normalized)]
+            words.extend((word, aui) for word in set(tokenize(string)))
+            nwords.extend((word, aui) for word in normalized)
+        rows.append(tuple(fields))
+    return tables
+
+
+def find_rrf_files(directory: str) -> Dict[str, str]:
+    """
+    Locate the supported RRF files of a release, in the directory itself or its META folder.
+
+    Args:
+        directory (str): The release directory.
+
+    Returns:
+        Dict[str, str]: File paths by file name without extension.
+    """
+    found = {}
+    for folder in (directory, os.path.join(directory, "META")):
+        for name in RRF_COLUMNS:
+            path = os.path.join(folder, f"{name}.RRF")
+            if name not in found and os.path.isfile(path):
+                found[name] = path
+    return found
+
+
+def read_release_name(directory: str) -> Optional[str]:
+    """Read the release name (e.g. '2024AB') from the release.dat file of a release, if present."""
+    for folder in (directory, os.path.dirname(os.path.abspath(directory))):
+        path = os.path.join(folder, "release.dat")
+        if not os.path.isfile(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                key, _, value = line.strip().partition("=")
+                if key == "umls.release.name" and value:
+                    return value
+    return None
+
+
+def split_chunks(
+    path: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges of about `chunk_bytes` that start and end at line boundaries.
+
+    Only the bytes around each boundary are read, through a memory map of the file.
+
+    Args:
+        path (str): The file to split.
+        chunk_bytes (int, optional): Target size of a chunk. Defaults to 64 MiB.
+
+    Returns:
+        List[Tuple[int, int]]: The (start, end) offsets of the chunks, covering the whole file.
+    Raises:
+        ValueError: If `chunk_bytes` is less than 1.
+    """
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be at least 1.")
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    chunks = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        start = 0
+        while start < size:
+            newline = m.find(b"\n", min(start + chunk_bytes, size) - 1)
+            end = size if newline == -1 else newline + 1
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def parse_chunk(task: Tuple[str, str, int, int, str]) -> int:
+    """
+    Parse one chunk of a file into a SQLite file of its own. Runs in the worker processes.
+
+    Args:
+        task (Tuple[str, str, int, int, str]): The file name without extension, the file path,
+            the start and end offsets of the chunk and the SQLite file to write.
+
+    Returns:
+        int: The number of rows of the file table written.
+    """
+    name, path, start, end, output = task
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        text = m[start:end].decode("utf-8")
+    tables = parse_rrf_lines(name, text.split("\n"))
+
+    if os.path.exists(output):
+        os.remove(output)
+    conn = sqlite3.connect(output)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        with conn:
+            conn.executescript(table_schema(tables))
+            for table, rows in tables.items():
+                if rows:
+                    placeholders = ", ".join("?" * len(TABLE_COLUMNS[table]))
+                    conn.executemany(
+                        f"INSERT INTO {table} VALUES ({placeholders})", rows
+                    )
+    finally:
+        conn.close()
+    return len(tables[name.lower()])
+
+
+def iter_parsed_chunks(
+    name: str,
+    path: str,
+    chunks: Sequence[Tuple[int, int, int]],
+    work_dir: str,
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[int, int, int, str, int]]:
+    """
+    Parse chunks of a file across a process pool, yielding them in file order as they complete.
+
+    At most a few chunks per worker are parsed ahead of the consumer, so the disk space taken by
+    parsed but unmerged chunks stays bounded.
+
+    Args:
+        name (str): The file name without extension.
+        path (str): The file path.
+        chunks (Sequence[Tuple[int, int, int]]): The (index, start, end) of the chunks to parse.
+        work_dir (str): Directory receiving the per-chunk SQLite files.
+        max_workers (Optional[int], optional): Number of worker processes; 1 parses in this
+            process. Defaults to the number of CPUs.
+
+    Yields:
+        Tuple[int, int, int, str, int]: The chunk index, start and end offsets, its SQLite file and its row count.
+    Raises:
+        Exception: The error of a chunk that failed to parse.
+    """
+    tasks = [
+        (name, path, start, end, os.path.join(work_dir, f"{name}.{index}.sqlite"))
+        for index, start, end in chunks
+    ]
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        results = ((task, parse_chunk(task)) for task in tasks)
+        for (index, _, _), (task, rows) in zip(chunks, results):
+            yield index, task[2], task[3], task[4], rows
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = bounded_map(
+            parse_chunk,
+            tasks,
+            max_workers=workers,
+            max_pending=2 * workers,
+            executor=executor,
+        )
+        for (index, _, _), (task, rows) in zip(chunks, results):
+            if isinstance(rows, Exception):
+                raise rows
+            yield index, task[2], task[3], task[4], rows
@@ -0,0 +1,749 @@
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from umls_python_client.localAPI.normalization import (
+    normalize_string,
+    normalize_words,
+    tokenize,
+)
+from umls_python_client.localAPI.rrf_ingest import (
+    DEFAULT_CHUNK_BYTES,
+    FILE_TABLES,
+    TABLE_COLUMNS,
+    find_rrf_files,
+    iter_parsed_chunks,
+    read_release_name,
+    split_chunks,
+    table_schema,
+)
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TYPES = (
+    "exact",
+    "words",
+    "leftTruncation",
+    "rightTruncation",
+    "normalizedString",
+    "normalizedWords",
+)
+
+# Upper bound appended to a prefix to turn it into a range scan
+_PREFIX_END = "\U0010ffff"
+# SQLite limits the number of bound parameters per statement
+_CHUNK = 500
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);\n"
+    # One row per merged chunk of a file, so an interrupted load resumes where it stopped
+    "CREATE TABLE IF NOT EXISTS ingest_chunks (file TEXT, chunk INTEGER, start INTEGER, "
+    "end INTEGER, rows INTEGER, PRIMARY KEY (file, chunk));\n"
+    + table_schema(TABLE_COLUMNS)
+)
+
+# Built once all files are loaded; bulk inserts into unindexed tables are much faster
+INDEXES = """
+    CREATE UNIQUE INDEX IF NOT EXISTS mrconso_aui ON mrconso (aui);
+    CREATE INDEX IF NOT EXISTS mrconso_cui ON mrconso (cui);
+    CREATE INDEX IF NOT EXISTS mrconso_code ON mrconso (sab, code);
+    CREATE INDEX IF NOT EXISTS mrconso_scui ON mrconso (sab, scui);
+    CREATE INDEX IF NOT EXISTS mrconso_sdui ON mrconso (sab, sdui);
+    CREATE INDEX IF NOT EXISTS mrconso_str ON mrconso (str_lower);
+    CREATE INDEX IF NOT EXISTS mrconso_rev ON mrconso (rev_lower);
+    CREATE INDEX IF NOT EXISTS mrconso_norm ON mrconso (norm);
+    CREATE INDEX IF NOT EXISTS mrrel_cui1 ON mrrel (cui1);
+    CREATE INDEX IF NOT EXISTS mrrel_aui1 ON mrrel (aui1);
+    CREATE INDEX IF NOT EXISTS mrsty_cui ON mrsty (cui);
+    CREATE INDEX IF NOT EXISTS mrdef_cui ON mrdef (cui);
+    CREATE INDEX IF NOT EXISTS mrsat_cui ON mrsat (cui);
+    CREATE INDEX IF NOT EXISTS mrsat_code ON mrsat (sab, code);
+    CREATE INDEX IF NOT EXISTS words_word ON words (word);
+    CREATE INDEX IF NOT EXISTS nwords_word ON nwords (word);
+"""
+
+# Preferred atom first: English, preferred term status, preferred string, preferred atom
+ATOM_PREFERENCE = (
+    "lat = 'ENG' DESC, ts = 'P' DESC, stt = 'PF' DESC, ispref = 'Y' DESC, rowid"
+)
+
+DERIVED_TABLES = f"""
+    DROP TABLE IF EXISTS concepts;
+    CREATE TABLE concepts (cui TEXT PRIMARY KEY, name TEXT, aui TEXT, suppress TEXT)
+        WITHOUT ROWID;
+    INSERT INTO concepts
+        SELECT cui, str, aui, suppress FROM (
+            SELECT cui, str, aui, suppress,
+                ROW_NUMBER() OVER (PARTITION BY cui ORDER BY {ATOM_PREFERENCE}) AS position
+            FROM mrconso
+        ) WHERE position = 1;
+
+    DROP TABLE IF EXISTS source_concepts;
+    CREATE TABLE source_concepts (
+        sab TEXT, code TEXT, name TEXT, aui TEXT, suppress TEXT, PRIMARY KEY (sab, code)
+    ) WITHOUT ROWID;
+    INSERT INTO source_concepts
+        SELECT sab, code, str, aui, suppress FROM (
+            SELECT sab, code, str, aui, suppress,
+                ROW_NUMBER() OVER (PARTITION BY sab, code ORDER BY {ATOM_PREFERENCE}) AS position
+            FROM mrconso WHERE code != ''
+        ) WHERE position = 1;
+
+    DROP TABLE IF EXISTS hierarchy;
+    CREATE TABLE hierarchy (
+        sab TEXT, child TEXT, parent TEXT, PRIMARY KEY (sab, child, parent)
+    ) WITHOUT ROWID;
+    INSERT OR IGNORE INTO hierarchy
+        SELECT r.sab, a1.code, a2.code
+        FROM mrrel r
+        JOIN mrconso a1 ON a1.aui = r.aui1 AND a1.sab = r.sab
+        JOIN mrconso a2 ON a2.aui = r.aui2 AND a2.sab = r.sab
+        WHERE r.rel = 'PAR' AND a1.code != a2.code;
+    INSERT OR IGNORE INTO hierarchy
+        SELECT r.sab, a2.code, a1.code
+        FROM mrrel r
+        JOIN mrconso a1 ON a1.aui = r.aui1 AND a1.sab = r.sab
+        JOIN mrconso a2 ON a2.aui = r.aui2 AND a2.sab = r.sab
+        WHERE r.rel = 'CHD' AND a1.code != a2.code;
+    CREATE INDEX hierarchy_parent ON hierarchy (sab, parent);
+"""
+
+
+def _suppress_filter(include_obsolete: bool, include_suppressible: bool) -> str:
+    """SQL condition on the SUPPRESS column implementing the UTS includeObsolete/includeSuppressible flags."""
+    allowed = ["'N'", "''"]
+    if include_obsolete:
+        allowed.append("'O'")
+    if include_suppressible:
+        allowed += ["'E'", "'Y'"]
+    return f"suppress IN ({', '.join(allowed)})"
+
+
+class RRFStore:
+    """
+    Indexed local copy of Metathesaurus release files (MRCONSO, MRREL, MRSTY, MRDEF, MRSAT).
+
+    The files are loaded into a SQLite database, in memory or in a file that later runs can open
+    directly. Besides the raw rows the store keeps the preferred name of every concept and source
+    concept, the source hierarchies derived from the PAR/CHD relations of MRREL, and word tables for
+    the UTS search types.
+
+    Attributes:
+        path (str): Location of the SQLite database (":memory:" for an in-memory store).
+        release (Optional[str]): The release name recorded when the files were loaded.
+    """
+
+    def __init__(self, path: str = ":memory:", closure_cache_size: int = 1024):
+        """
+        Open or create a store.
+
+        Args:
+            path (str, optional): Location of the database file. Defaults to an in-memory database.
+            closure_cache_size (int, optional): Number of ancestor/descendant closures kept in memory,
+                so paging through a large closure computes it once. Defaults to 1024.
+        """
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+        self._closure = lru_cache(maxsize=closure_cache_size)(self._compute_closure)
+
+    @classmethod
+    def from_directory(
+        cls, directory: str, path: str = ":memory:", **kwargs: Any
+    ) -> "RRFStore":
+        """
+        Open a store built from a release directory, loading the files unless `path` already holds them.
+
+        Args:
+            directory (str): Directory containing the RRF files (or their META folder).
+            path (str, optional): Location of the database file. Defaults to an in-memory database.
+            **kwargs: Passed to the constructor.
+
+        Returns:
+            RRFStore: The loaded store.
+        """
+        store = cls(path, **kwargs)
+        if not store.is_loaded:
+            store.load(directory)
+        return store
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Return a value recorded in the store metadata."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Record a value in the store metadata."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value)
+            )
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once release files have been loaded and indexed."""
+        return self.get_meta("loaded") == "1"
+
+    @property
+    def release(self) -> Optional[str]:
+        """The release name read from release.dat when the files were loaded, if any."""
+        return self.get_meta("release")
+
+    def load(
+        self,
+        directory: str,
+        files: Optional[Sequence[str]] = None,
+        max_workers: Optional[int] = None,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        progress: Optional[Callable[[str, int, int], None]] = None,
+        work_dir: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Load the RRF files of a release directory and build the indexes.
+
+        Each file is split at line boundaries into chunks that a process pool parses into
+        temporary SQLite files; the chunks are merged into the store in file order, one
+        transaction per chunk. Every merged chunk is recorded, so calling `load` again after an
+        interruption skips the chunks already merged. The indexes are built once at the end.
+
+        Args:
+            directory (str): Directory containing the RRF files (or their META folder).
+            files (Optional[Sequence[str]], optional): File names to load, e.g. ['MRCONSO', 'MRREL'].
+                Defaults to every supported file present.
+            max_workers (Optional[int], optional): Number of parsing processes; 1 parses in this process.
+                Defaults to the number of CPUs.
+            chunk_bytes (int, optional): Target chunk size in bytes. A resumed load keeps the chunk size
+                it started with. Defaults to 64 MiB.
+            progress (Optional[Callable[[str, int, int], None]], optional): Called after every merged
+                chunk with the file name, the bytes merged so far and the size of the file.
+            work_dir (Optional[str], optional): Directory for the temporary chunk files. Defaults to the
+                directory of the store file, or the system temporary directory for in-memory stores.
+
+        Returns:
+            Dict[str, int]: The number of rows loaded per file.
+        Raises:
+            ValueError: If MRCONSO is not present, since every lookup resolves atoms through it, or if a
+                file changed since an interrupted load started.
+        """
+        found = find_rrf_files(directory)
+        if files is not None:
+            found = {name: path for name, path in found.items() if name in files}
+        if "MRCONSO" not in found:
+            raise ValueError(f"No MRCONSO.RRF found in {directory}.")
+
+        chunk_bytes = int(self.get_meta("chunk_bytes") or chunk_bytes)
+        self.set_meta("chunk_bytes", str(chunk_bytes))
+        if work_dir is None and self.path != ":memory:":
+            work_dir = os.path.dirname(os.path.abspath(self.path))
+
+        counts = {}
+        with tempfile.TemporaryDirectory(prefix="rrf_ingest_", dir=work_dir) as scratch:
+            for name, path in found.items():
+                counts[name] = self._load_file(
+                    name, path, chunk_bytes, max_workers, progress, scratch
+                )
+
+        self.finalize(release=read_release_name(directory))
+        return counts
+
+    def _load_file(
+        self,
+        name: str,
+        path: str,
+        chunk_bytes: int,
+        max_workers: Optional[int],
+        progress: Optional[Callable[[str, int, int], None]],
+        scratch: str,
+    ) -> int:
+        """Parse and merge the chunks of one file that are not merged yet."""
+        size = os.path.getsize(path)
+        recorded = self.get_meta(f"size_{name}")
+        if recorded is not None and int(recorded) != size:
+            raise ValueError(
+                f"{path} changed since it was partially loaded; load it into a new store."
+            )
+        self.set_meta(f"size_{name}", str(size))
+
+        chunks = split_chunks(path, chunk_bytes)
+        merged = self.merged_chunks(name)
+        done = sum(end - start for start, end in merged.values())
+        rows = self._query(
+            "SELECT COALESCE(SUM(rows), 0) FROM ingest_chunks WHERE file = ?", (name,)
+        )[0][0]
+        pending = [
+            (index, start, end)
+            for index, (start, end) in enumerate(chunks)
+            if index not in merged
+        ]
+        if merged:
+            logger.info(
+                f"Resuming {path}: {len(merged)} of {len(chunks)} chunks already loaded"
+            )
+
+        for index, start, end, chunk_path, chunk_rows in iter_parsed_chunks(
+            name, path, pending, scratch, max_workers
+        ):
+            self.merge_chunk(name, index, start, end, chunk_path, chunk_rows)
+            os.remove(chunk_path)
+            rows += chunk_rows
+            done += end - start
+            logger.info(
+                f"Loaded {name} chunk {index + 1}/{len(chunks)} ({done * 100 // size}%)"
+            )
+            if progress is not None:
+                progress(name, done, size)
+
+        logger.info(f"Loaded {rows} rows from {path}")
+        return rows
+
+    def merged_chunks(self, name: str) -> Dict[int, Tuple[int, int]]:
+        """Return the (start, end) offsets of the chunks of a file already merged, by chunk index."""
+        rows = self._query(
+            "SELECT chunk, start, end FROM ingest_chunks WHERE file = ?", (name,)
+        )
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def merge_chunk(
+        self, name: str, index: int, start: int, end: int, chunk_path: str, rows: int
+    ) -> None:
+        """
+        Append the tables of a parsed chunk and record it, in one transaction.
+
+        Args:
+            name (str): The file name without extension.
+            index (int): The chunk index.
+            start (int): The start offset of the chunk.
+            end (int): The end offset of the chunk.
+            chunk_path (str): The SQLite file written by `parse_chunk`.
+            rows (int): The number of rows of the file table in the chunk.
+        """
+        with self._lock:
+            self._conn.execute("ATTACH DATABASE ? AS chunk", (chunk_path,))
+            try:
+                with self._conn:
+                    for table in FILE_TABLES[name]:
+                        self._conn.execute(
+                            f"INSERT INTO main.{table} SELECT * FROM chunk.{table}"
+                        )
+                    self._conn.execute(
+                        "INSERT INTO ingest_chunks VALUES (?, ?, ?, ?, ?)",
+                        (name, index, start, end, rows),
+                    )
+            finally:
+                self._conn.execute("DETACH DATABASE chunk")
+
+    def finalize(self, release: Optional[str] = None) -> None:
+        """
+        Build the indexes and derived tables once all rows are inserted.
+
+        Args:
+            release (Optional[str], optional): The release name to record.
+        """
+        with self._lock, self._conn:
+            self._conn.executescript(INDEXES)
+            self._conn.executescript(DERIVED_TABLES)
+            self._conn.execute("ANALYZE")
+        if release:
+            self.set_meta("release", release)
+        self.set_meta("loaded", "1")
+        self._closure.cache_clear()
+        logger.info(f"Indexed local Metathesaurus store at {self.path}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def stream(
+        self, sql: str, params: Sequence[Any] = (), batch_size: int = 10000
+    ) -> Iterator[sqlite3.Row]:
+        """Run a query and yield its rows in batches, for results too large to fetch at once."""
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
+    def _query_in(
+        self, sql: str, values: Sequence[Any], params: Sequence[Any] = ()
+    ) -> List[sqlite3.Row]:
+        """Run a query with an `IN ({})` placeholder over many values, in chunks."""
+        rows = []
+        for start in range(0, len(values), _CHUNK):
+            chunk = list(values[start : start + _CHUNK])
+            rows += self._query(
+                sql.format(", ".join("?" * len(chunk))), [*params, *chunk]
+            )
+        return rows
+
+    def concept(self, cui: str) -> Optional[sqlite3.Row]:
+        """Return the concept row (cui, name, aui, suppress), or None if the CUI is unknown."""
+        rows = self._query("SELECT * FROM concepts WHERE cui = ?", (cui,))
+        return rows[0] if rows else None
+
+    def concept_names(self, cuis: Iterable[str]) -> Dict[str, str]:
+        """Return the preferred names of concepts."""
+        rows = self._query_in(
+            "SELECT cui, name FROM concepts WHERE cui IN ({})", list(set(cuis))
+        )
+        return {row["cui"]: row["name"] for row in rows}
+
+    def concept_counts(self, cui: str) -> Dict[str, int]:
+        """Return the number of atoms, attributes and relations of a concept."""
+        counts = {}
+        for key, sql in (
+            ("atomCount", "SELECT COUNT(*) FROM mrconso WHERE cui = ?"),
+            ("attributeCount", "SELECT COUNT(*) FROM mrsat WHERE cui = ?"),
+            ("relationCount", "SELECT COUNT(*) FROM mrrel WHERE cui1 = ?"),
+            ("definitionCount", "SELECT COUNT(*) FROM mrdef WHERE cui = ?"),
+        ):
+            counts[key] = self._query(sql, (cui,))[0][0]
+        return counts
+
+    def atoms(
+        self,
+        cui: Optional[str] = None,
+        source: Optional[str] = None,
+        code: Optional[str] = None,
+        sabs: Optional[Sequence[str]] = None,
+        ttys: Optional[Sequence[str]] = None,
+        language: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+    ) -> List[sqlite3.Row]:
+        """
+        Return the atoms of a concept (`cui`) or of a source concept (`source` and `code`), in file order.
+
+        Args:
+            cui (Optional[str]): The concept.
+            source (Optional[str]): The source vocabulary of the source concept.
+            code (Optional[str]): The source-asserted identifier.
+            sabs (Optional[Sequence[str]]): Only atoms of these sources.
+            ttys (Optional[Sequence[str]]): Only atoms of these term types.
+            language (Optional[str]): Only atoms of this language.
+            include_obsolete (bool): Include obsolete atoms.
+            include_suppressible (bool): Include suppressible atoms.
+
+        Returns:
+            List[sqlite3.Row]: The MRCONSO rows.
+        """
+        conditions = [_suppress_filter(include_obsolete, include_suppressible)]
+        params: List[Any] = []
+        if cui is not None:
+            conditions.append("cui = ?")
+            params.append(cui)
+        if source is not None:
+            conditions.append("sab = ? AND code = ?")
+            params += [source, code]
+        for column, values in (("sab", sabs), ("tty", ttys)):
+            if values:
+                conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params += values
+        if language:
+            conditions.append("lat = ?")
+            params.append(language)
+        return self._query(
+            f"SELECT rowid, * FROM mrconso WHERE {' AND '.join(conditions)} ORDER BY rowid",
+            params,
+        )
+
+    def semantic_types(self, cui: str) -> List[sqlite3.Row]:
+        """Return the MRSTY rows of a concept."""
+        return self._query("SELECT * FROM mrsty WHERE cui = ? ORDER BY rowid", (cui,))
+
+    def definitions(
+        self, cui: str, sabs: Optional[Sequence[str]] = None
+    ) -> List[sqlite3.Row]:
+        """Return the MRDEF rows of a concept, optionally only from some sources."""
+        if sabs:
+            return self._query_in(
+                "SELECT * FROM mrdef WHERE cui = ? AND sab IN ({}) ORDER BY rowid",
+                list(sabs),
+                (cui,),
+            )
+        return self._query("SELECT * FROM mrdef WHERE cui = ? ORDER BY rowid", (cui,))
+
+    def concept_relations(
+        self,
+        cui: str,
+        sabs: Optional[Sequence[str]] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+    ) -> List[sqlite3.Row]:
+        """Return the concept-level MRREL rows of a concept, with the name of the related concept."""
+        sql = (
+            "SELECT r.*, c.name AS related_name FROM mrrel r "
+            "LEFT JOIN concepts c ON c.cui = r.cui2 "
+            f"WHERE r.cui1 = ? AND r.stype1 = 'CUI' "
+            f"AND r.{_suppress_filter(include_obsolete, include_suppressible)}"
+        )
+        if sabs:
+            return self._query_in(
+                sql + " AND r.sab IN ({}) ORDER BY r.rowid", list(sabs), (cui,)
+            )
+        return self._query(sql + " ORDER BY r.rowid", (cui,))
+
+    def source_concept(self, source: str, code: str) -> Optional[sqlite3.Row]:
+        """Return the source concept row (sab, code, name, aui, suppress), or None if it is unknown."""
+        rows = self._query(
+            "SELECT * FROM source_concepts WHERE sab = ? AND code = ?", (source, code)
+        )
+        return rows[0] if rows else None
+
+    def source_names(self, source: str, codes: Iterable[str]) -> Dict[str, str]:
+        """Return the preferred names of source concepts."""
+        rows = self._query_in(
+            "SELECT code, name FROM source_concepts WHERE sab = ? AND code IN ({})",
+            list(set(codes)),
+            (source,),
+        )
+        return {row["code"]: row["name"] for row in rows}
+
+    def source_relations(
+        self,
+        source: str,
+        code: str,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+    ) -> List[sqlite3.Row]:
+        """Return the MRREL rows asserted by a source on the atoms of a source concept."""
+        return self._query(
+            "SELECT r.*, a2.code AS related_code, a2.sab AS related_sab, "
+            "s.name AS related_name FROM mrconso a1 "
+            "JOIN mrrel r ON r.aui1 = a1.aui AND r.sab = a1.sab "
+            "LEFT JOIN mrconso a2 ON a2.aui = r.aui2 "
+            "LEFT JOIN source_concepts s ON s.sab = a2.sab AND s.code = a2.code "
+            f"WHERE a1.sab = ? AND a1.code = ? "
+            f"AND r.{_suppress_filter(include_obsolete, include_suppressible)} "
+            "ORDER BY r.rowid",
+            (source, code),
+        )
+
+    def source_attributes(self, source: str, code: str) -> List[sqlite3.Row]:
+        """Return the MRSAT rows of a source concept."""
+        return self._query(
+            "SELECT * FROM mrsat WHERE sab = ? AND code = ? ORDER BY rowid",
+            (source, code),
+        )
+
+    def parents(self, source: str, code: str) -> List[str]:
+        """Return the immediate parents of a source concept."""
+        rows = self._query(
+            "SELECT parent FROM hierarchy WHERE sab = ? AND child = ?", (source, code)
+        )
+        return [row[0] for row in rows]
+
+    def children(self, source: str, code: str) -> List[str]:
+        """Return the immediate children of a source concept."""
+        rows = self._query(
+            "SELECT child FROM hierarchy WHERE sab = ? AND parent = ?", (source, code)
+        )
+        return [row[0] for row in rows]
+
+    def ancestors(self, source: str, code: str) -> List[str]:
+        """Return all ancestors of a source concept, nearest first."""
+        return list(self._closure(source, code, "parent"))
+
+    def descendants(self, source: str, code: str) -> List[str]:
+        """Return all descendants of a source concept, nearest first."""
+        return list(self._closure(source, code, "child"))
+
+    def _compute_closure(self, source: str, code: str, kind: str) -> Tuple[str, ...]:
+        """Breadth-first transitive closure over the hierarchy, one query per level."""
+        select, where = ("parent", "child") if kind == "parent" else ("child", "parent")
+        sql = f"SELECT {select} FROM hierarchy WHERE sab = ? AND {where} IN ({{}})"
+        visited = {code}
+        closure = []
+        level = [code]
+        while level:
+            next_level = []
+            for row in self._query_in(sql, level, (source,)):
+                if row[0] not in visited:
+                    visited.add(row[0])
+                    next_level.append(row[0])
+            closure += next_level
+            level = next_level
+        return tuple(closure)
+
+    def crosswalk(
+        self,
+        source: str,
+        code: str,
+        target_sources: Optional[Sequence[str]] = None,
+        include_obsolete: bool = False,
+    ) -> List[sqlite3.Row]:
+        """
+        Return the source concepts of other vocabularies that share a concept with a source concept.
+
+        Returns:
+            List[sqlite3.Row]: Rows of (sab, code, name), in file order of the matching atoms.
+        """
+        suppress = _suppress_filter(include_obsolete, False)
+        sql = (
+            "SELECT b.sab, b.code, s.name, MIN(b.rowid) AS position FROM mrconso a "
+            "JOIN mrconso b ON b.cui = a.cui "
+            "JOIN source_concepts s ON s.sab = b.sab AND s.code = b.code "
+            f"WHERE a.sab = ? AND a.code = ? AND a.{suppress} AND b.{suppress} "
+            "AND b.sab != a.sab AND b.code != ''"
+        )
+        if target_sources:
+            return self._query_in(
+                sql + " AND b.sab IN ({}) GROUP BY b.sab, b.code ORDER BY position",
+                list(target_sources),
+                (source, code),
+            )
+        return self._query(
+            sql + " GROUP BY b.sab, b.code ORDER BY position", (source, code)
+        )
+
+    def search(
+        self,
+        string: str,
+        search_type: str = "words",
+        input_type: Optional[str] = None,
+        sabs: Optional[Sequence[str]] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        partial_search: bool = False,
+    ) -> List[sqlite3.Row]:
+        """
+        Find the atoms matching a search string, best matches first.
+
+        Atoms whose string equals the query (ignoring case) rank first, then atoms matching more
+        query words (partial search), preferred atoms, and shorter strings.
+
+        Args:
+            string (str): The search string or, for identifier input types, the identifier.
+            search_type (str): One of `SEARCH_TYPES`.
+            input_type (Optional[str]): 'atom' (default) searches strings; 'code', 'sourceUi',
+                'sourceConcept', 'sourceDescriptor' and 'tty' look identifiers up exactly.
+            sabs (Optional[Sequence[str]]): Only atoms of these sources.
+            include_obsolete (bool): Include obsolete atoms.
+            include_suppressible (bool): Include suppressible atoms.
+            partial_search (bool): For word searches, fall back to atoms matching only some of the words.
+
+        Returns:
+            List[sqlite3.Row]: The matching MRCONSO rows, ranked.
+        Raises:
+            ValueError: If the search type is not supported.
+        """
+        if search_type not in SEARCH_TYPES:
+            raise ValueError(
+                f"Unsupported search type: {search_type}. Available types are {', '.join(SEARCH_TYPES)}"
+            )
+        conditions = [_suppress_filter(include_obsolete, include_suppressible)]
+        params: List[Any] = []
+        if sabs:
+            conditions.append(f"sab IN ({', '.join('?' * len(sabs))})")
+            params += sabs
+
+        lowered = string.lower()
+        matched: Dict[str, int] = {}
+        identifier_columns = {
+            "code": "code",
+            "sourceUi": "code",
+            "sourceConcept": "scui",
+            "sourceDescriptor": "sdui",
+            "tty": "tty",
+        }
+        if input_type in identifier_columns:
+            conditions.append(f"{identifier_columns[input_type]} = ?")
+            params.append(string)
+        elif search_type == "exact":
+            conditions.append("str_lower = ?")
+            params.append(lowered)
+        elif search_type == "normalizedString":
+            conditions.append("norm = ?")
+            params.append(normalize_string(string))
+        elif search_type == "rightTruncation":
+            conditions.append("str_lower >= ? AND str_lower < ?")
+            params += [lowered, lowered + _PREFIX_END]
+        elif search_type == "leftTruncation":
+            reversed_query = lowered[::-1]
+            conditions.append("rev_lower >= ? AND rev_lower < ?")
+            params += [reversed_query, reversed_query + _PREFIX_END]
+        else:
+            table, words = (
+                ("words", sorted(set(tokenize(string))))
+                if search_type == "words"
+                else ("nwords", normalize_words(string))
+            )
+            if not words:
+                return []
+            matched = self._match_words(table, words, partial_search)
+            if not matched:
+                return []
+            rows = self._query_in(
+                f"SELECT rowid, * FROM mrconso WHERE {' AND '.join(conditions)} "
+                "AND aui IN ({})",
+                list(matched),
+                params,
+            )
+            return self._rank(rows, lowered, matched)
+
+        rows = self._query(
+            f"SELECT rowid, * FROM mrconso WHERE {' AND '.join(conditions)}", params
+        )
+        return self._rank(rows, lowered, matched)
+
+    def _match_words(
+        self, table: str, words: List[str], partial_search: bool
+    ) -> Dict[str, int]:
+        """Return the atoms containing all the words (or, for partial search, any of them) with their match counts."""
+        rows = self._query_in(
+            f"SELECT aui, COUNT(DISTINCT word) FROM {table} WHERE word IN ({{}}) GROUP BY aui",
+            words,
+        )
+        counts = {row[0]: row[1] for row in rows}
+        complete = {aui: count for aui, count in counts.items() if count == len(words)}
+        if complete or not partial_search:
+            return complete
+        return counts
+
+    @staticmethod
+    def _rank(
+        rows: List[sqlite3.Row], lowered: str, matched: Dict[str, int]
+    ) -> List[sqlite3.Row]:
+        def key(row: sqlite3.Row) -> Tuple:
+            preferred = row["ts"] == "P" and row["stt"] == "PF" and row["ispref"] == "Y"
+            return (
+                row["str_lower"] != lowered,
+                -matched.get(row["aui"], 0),
+                not preferred,
+                len(row["str"]),
+                row["rowid"],
+            )
+
+        return sorted(rows, key=key)
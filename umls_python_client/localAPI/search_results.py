@@ -0,0 +1,90 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+NO_RESULTS = {"ui": "NONE", "name": "NO RESULTS"}
+
+# MRCONSO column holding the identifier of each UTS returnIdType
+RETURN_ID_COLUMNS = {
+    "concept": "cui",
+    "aui": "aui",
+    "code": "code",
+    "sourceUi": "code",
+    "sourceConcept": "scui",
+    "sourceDescriptor": "sdui",
+}
+
+
+def search_results(
+    rows: Iterable[Any],
+    concept_name: Callable[[Any], str],
+    return_id_type: str = "concept",
+    base_url: str = "https://uts-ws.nlm.nih.gov/rest",
+    version: str = "current",
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Turn ranked atoms into UTS search results, one per distinct identifier.
+
+    Args:
+        rows (Iterable[Any]): Ranked atoms, mappings with the cui, aui, sab, code, scui, sdui and str
+            MRCONSO columns. Consumed lazily.
+        concept_name (Callable[[Any], str]): Returns the preferred name of the concept of an atom.
+        return_id_type (str): 'concept', 'aui', 'code', 'sourceUi', 'sourceConcept' or 'sourceDescriptor'.
+        base_url (str): Base of the result URIs.
+        version (str): The release used in result URIs.
+        limit (Optional[int]): Stop after this many results (None for all).
+
+    Returns:
+        List[Dict[str, Any]]: The results (ui, rootSource, uri, name), best match first.
+    """
+    column = RETURN_ID_COLUMNS.get(return_id_type, "cui")
+    results = []
+    seen = set()
+    for row in rows:
+        if limit is not None and len(results) >= limit:
+            break
+        identifier = row[column]
+        if not identifier:
+            continue
+        key = identifier if column in ("cui", "aui") else (row["sab"], identifier)
+        if key in seen:
+            continue
+        seen.add(key)
+        if column == "cui":
+            uri = f"{base_url}/content/{version}/CUI/{identifier}"
+            name = concept_name(row)
+        elif column == "aui":
+            uri = f"{base_url}/content/{version}/AUI/{identifier}"
+            name = row["str"]
+        else:
+            uri = f"{base_url}/content/{version}/source/{row['sab']}/{identifier}"
+            name = row["str"]
+        results.append(
+            {"ui": identifier, "rootSource": row["sab"], "uri": uri, "name": name}
+        )
+    return results
+
+
+def search_response(
+    results: List[Dict[str, Any]], page_number: int = 1, page_size: int = 25
+) -> Dict[str, Any]:
+    """
+    Wrap one page of search results in the UTS search envelope.
+
+    Args:
+        results (List[Dict[str, Any]]): The results up to at least the end of the page.
+        page_number (int): The page to return.
+        page_size (int): The number of results per page.
+
+    Returns:
+        Dict[str, Any]: The response, with the "NO RESULTS" entry UTS returns for an empty page.
+    """
+    start = (page_number - 1) * page_size
+    page = results[start : start + page_size]
+    return {
+        "pageSize": page_size,
+        "pageNumber": page_number,
+        "result": {
+            "classType": "searchResults",
+            "results": page or [dict(NO_RESULTS)],
+        },
+    }
@@ -0,0 +1,656 @@
+import heapq
+import logging
+import mmap
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from umls_python_client.localAPI.normalization import normalize_string, normalize_words
+from umls_python_client.localAPI.rrf_store import RRFStore
+from umls_python_client.localAPI.search_results import (
+    search_response,
+    search_results,
+)
+from umls_python_client.utils.mapped_sections import (
+    StringTable,
+    close_sections,
+    load_sections,
+    save_sections,
+)
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"UMLSSTX1"
+FORMAT_VERSION = 2
+
+# Search types answered by the index
+SEARCH_TYPES = (
+    "exact",
+    "normalizedString",
+    "normalizedWords",
+    "rightTruncation",
+    "leftTruncation",
+)
+
+# Static atom ranking shared with RRFStore.search: preferred atoms, then shorter strings
+RANK_ORDER = "NOT (ts = 'P' AND stt = 'PF' AND ispref = 'Y'), length(str), rowid"
+
+# Per-atom string columns, stored as string tables in rank order
+ATOM_COLUMNS = ("aui", "code", "scui", "sdui", "str")
+
+# Key spaces: the lowercase string, its reverse, the normalized string and the normalized words
+# of each atom
+KEY_SPACES = {
+    "exact": "SELECT str_lower, rowid FROM mrconso ORDER BY str_lower",
+    "reverse": "SELECT rev_lower, rowid FROM mrconso ORDER BY rev_lower",
+    "norm": "SELECT norm, rowid FROM mrconso ORDER BY norm",
+    "nwords": (
+        "SELECT n.word, m.rowid FROM nwords n JOIN mrconso m ON m.aui = n.aui "
+        "ORDER BY n.word"
+    ),
+}
+
+# Key spaces searched by prefix, with block minima over their postings: a prefix matches a
+# contiguous run of keys, hence a contiguous slice of postings
+PREFIX_SPACES = ("exact", "reverse")
+# Postings per block, and blocks per superblock, of the block minima
+BLOCK = 256
+# Upper bound appended to a prefix to find the end of its key range
+_PREFIX_END = "\U0010ffff"
+
+# Bits of the atom_flags section
+OBSOLETE = 1
+SUPPRESSIBLE = 2
+# Any other SUPPRESS value; such atoms are never returned, as in RRFStore.search
+EXCLUDED = 4
+_SUPPRESS_FLAGS = {"": 0, "N": 0, "O": OBSOLETE, "E": SUPPRESSIBLE, "Y": SUPPRESSIBLE}
+
+
+def _sections_layout() -> List[Tuple[str, str]]:
+    """Section names and typecodes, in file order."""
+    layout = [("atom_cui", "i"), ("atom_sab", "H"), ("atom_flags", "B")]
+    for column in ATOM_COLUMNS:
+        layout += [(f"{column}_offsets", "q"), (f"{column}_blob", "B")]
+    layout += [
+        ("cui_offsets", "q"),
+        ("cui_blob", "B"),
+        ("name_offsets", "q"),
+        ("name_blob", "B"),
+    ]
+    for space in KEY_SPACES:
+        layout += [
+            (f"{space}_key_offsets", "q"),
+            (f"{space}_key_blob", "B"),
+            (f"{space}_post_offsets", "q"),
+            (f"{space}_postings", "i"),
+        ]
+    for space in PREFIX_SPACES:
+        layout += [(f"{space}_block_min", "i"), (f"{space}_super_min", "i")]
+    return layout
+
+
+SECTIONS = tuple(_sections_layout())
+
+
+class _StringTableBuilder:
+    """Accumulates the offsets and blob of a StringTable one string at a time."""
+
+    def __init__(self) -> None:
+        self.offsets = array("q", [0])
+        self.blob = bytearray()
+
+    def append(self, string: str) -> None:
+        self.blob += string.encode("utf-8")
+        self.offsets.append(len(self.blob))
+
+
+def _block_minima(values: Sequence[int]) -> array:
+    """Return the minimum of every BLOCK consecutive values."""
+    return array(
+        "i", (min(values[i : i + BLOCK]) for i in range(0, len(values), BLOCK))
+    )
+
+
+def _ranked_slice(
+    postings: Sequence[int],
+    block_min: Sequence[int],
+    super_min: Sequence[int],
+    start: int,
+    end: int,
+) -> Iterator[int]:
+    """
+    Yield the atoms of `postings[start:end]` in ascending order, without sorting the whole slice.
+
+    The slice is covered by its partial blocks at both ends, whole blocks and whole superblocks,
+    queued by their minimum. A superblock taken off the queue is replaced by its blocks and a
+    block by its sorted atoms, so only the parts holding the smallest atoms are ever expanded.
+    """
+    heap: List[Tuple[int, int, int, Any]] = []
+    # (smallest atom, tiebreak, kind, payload); kind 0 is a sorted run, 1 a block, 2 a superblock
+    counter = 0
+
+    def push_run(values: Sequence[int]) -> None:
+        nonlocal counter
+        run = iter(sorted(values))
+        first = next(run, None)
+        if first is not None:
+            heap.append((first, counter, 0, run))
+            counter += 1
+
+    def push_units(kind: int, minima: Sequence[int], first: int, last: int) -> None:
+        nonlocal counter
+        for unit in range(first, last):
+            heap.append((minima[unit], counter, kind, unit))
+            counter += 1
+
+    first_block, last_block = -(-start // BLOCK), end // BLOCK
+    if first_block >= last_block:
+        push_run(postings[start:end])
+    else:
+        push_run(postings[start : first_block * BLOCK])
+        push_run(postings[last_block * BLOCK : end])
+        first_super, last_super = -(-first_block // BLOCK), last_block // BLOCK
+        if first_super >= last_super:
+            push_units(1, block_min, first_block, last_block)
+        else:
+            push_units(1, block_min, first_block, first_super * BLOCK)
+            push_units(1, block_min, last_super * BLOCK, last_block)
+            push_units(2, super_min, first_super, last_super)
+    heapq.heapify(heap)
+
+    while heap:
+        atom, _, kind, payload = heap[0]
+        if kind == 0:
+            yield atom
+            following = next(payload, None)
+            if following is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (following, counter, 0, payload))
+                counter += 1
+        elif kind == 1:
+            heapq.heappop(heap)
+            run = iter(sorted(postings[payload * BLOCK : (payload + 1) * BLOCK]))
+            heapq.heappush(heap, (next(run), counter, 0, run))
+            counter += 1
+        else:
+            heapq.heappop(heap)
+            first = payload * BLOCK
+            for block in range(first, min(first + BLOCK, len(block_min))):
+                heapq.heappush(heap, (block_min[block], counter, 1, block))
+                counter += 1
+
+
+class StringIndex:
+    """
+    Memory-mappable index answering the `exact`, `normalizedString`, `normalizedWords`,
+    `rightTruncation` and `leftTruncation` searches of a local Metathesaurus store.
+
+    Atoms are numbered by their static rank (preferred atoms, then shorter strings), so each
+    posting list sorted by atom number is already in result order. Every key space (lowercase
+    strings, normalized strings and normalized words) is a sorted string table with a CSR posting
+    array: the atoms of key `k` are `postings[post_offsets[k]:post_offsets[k + 1]]`. A lookup is a
+    binary search over the keys, and only the atoms that end up in a page of results are decoded.
+    Truncation searches take the run of keys sharing a prefix (of the lowercase strings, or of
+    their reverses for left truncation) and walk its postings in rank order through per-block
+    minima. Saved indexes are memory-mapped on load, so memory use stays with the page cache.
+
+    Attributes:
+        release (Optional[str]): The release of the store the index was built from.
+        path (Optional[str]): The file a loaded index is mapped from.
+        sabs (List[str]): The source vocabularies, indexed by the atom_sab section.
+    """
+
+    def __init__(
+        self,
+        header: Dict[str, Any],
+        sections: Dict[str, Sequence[int]],
+        mapped: Optional[mmap.mmap] = None,
+    ):
+        """
+        Initialize the StringIndex from its arrays. Use `build` or `load` instead.
+
+        Args:
+            header (Dict[str, Any]): The release and source vocabularies.
+            sections (Dict[str, Sequence[int]]): The arrays named in `SECTIONS`.
+            mapped (Optional[mmap.mmap]): The memory map backing the arrays, if any.
+        """
+        self.release = header.get("release")
+        self.sabs = list(header["sabs"])
+        self._sab_ids = {sab: i for i, sab in enumerate(self.sabs)}
+        self._sections = sections
+        self._mmap = mapped
+        self.path: Optional[str] = None
+        self._columns = {
+            column: StringTable(
+                sections[f"{column}_blob"], sections[f"{column}_offsets"]
+            )
+            for column in ATOM_COLUMNS
+        }
+        self._cuis = StringTable(sections["cui_blob"], sections["cui_offsets"])
+        self._names = StringTable(sections["name_blob"], sections["name_offsets"])
+        self._keys = {
+            space: StringTable(
+                sections[f"{space}_key_blob"], sections[f"{space}_key_offsets"]
+            )
+            for space in KEY_SPACES
+        }
+
+    @classmethod
+    def build(cls, store: RRFStore) -> "StringIndex":
+        """
+        Build the index from a loaded store.
+
+        Args:
+            store (RRFStore): The store.
+
+        Returns:
+            StringIndex: The in-memory index.
+        Raises:
+            ValueError: If the store holds no release.
+        """
+        if not store.is_loaded:
+            raise ValueError(f"{store.path} holds no loaded release.")
+
+        cui_ids: Dict[str, int] = {}
+        cuis, names = _StringTableBuilder(), _StringTableBuilder()
+        for row in store.stream("SELECT cui, name FROM concepts ORDER BY cui"):
+            cui_ids[row["cui"]] = len(cui_ids)
+            cuis.append(row["cui"])
+            names.append(row["name"])
+
+        sab_ids: Dict[str, int] = {}
+        atom_cui, atom_sab, atom_flags = array("i"), array("H"), array("B")
+        columns = {column: _StringTableBuilder() for column in ATOM_COLUMNS}
+        # Rank of every atom by MRCONSO rowid, to renumber the postings
+        (max_rowid,) = next(store.stream("SELECT COALESCE(MAX(rowid), 0) FROM mrconso"))
+        ranks = array("i", [-1]) * (max_rowid + 1)
+        atoms = store.stream(
+            "SELECT rowid, cui, sab, suppress, "
+            f"{', '.join(ATOM_COLUMNS)} FROM mrconso ORDER BY {RANK_ORDER}"
+        )
+        for position, row in enumerate(atoms):
+            ranks[row["rowid"]] = position
+            atom_cui.append(cui_ids[row["cui"]])
+            atom_sab.append(sab_ids.setdefault(row["sab"], len(sab_ids)))
+            atom_flags.append(_SUPPRESS_FLAGS.get(row["suppress"], EXCLUDED))
+            for column, builder in columns.items():
+                builder.append(row[column] or "")
+
+        sections: Dict[str, Sequence[int]] = {
+            "atom_cui": atom_cui,
+            "atom_sab": atom_sab,
+            "atom_flags": atom_flags,
+            "cui_offsets": cuis.offsets,
+            "cui_blob": cuis.blob,
+            "name_offsets": names.offsets,
+            "name_blob": names.blob,
+        }
+        for column, builder in columns.items():
+            sections[f"{column}_offsets"] = builder.offsets
+            sections[f"{column}_blob"] = builder.blob
+        for space, sql in KEY_SPACES.items():
+            sections.update(cls._build_key_space(space, store.stream(sql), ranks))
+
+        logger.info(
+            f"Built string index with {len(atom_cui)} atoms and {len(cui_ids)} concepts"
+        )
+        return cls({"release": store.release, "sabs": list(sab_ids)}, sections)
+
+    @staticmethod
+    def _build_key_space(
+        space: str, rows: Iterator[Any], ranks: Sequence[int]
+    ) -> Dict[str, Sequence[int]]:
+        """Group (key, rowid) rows sorted by key into a key table and rank-ordered postings."""
+        keys = _StringTableBuilder()
+        post_offsets, postings = array("q", [0]), array("i")
+        current: Optional[str] = None
+        group: List[int] = []
+        for key, rowid in rows:
+            if key != current:
+                if group:
+                    postings.extend(sorted(group))
+                    post_offsets.append(len(postings))
+                    group = []
+                keys.append(key)
+                current = key
+            group.append(ranks[rowid])
+        if group:
+            postings.extend(sorted(group))
+            post_offsets.append(len(postings))
+        sections = {
+            f"{space}_key_offsets": keys.offsets,
+            f"{space}_key_blob": keys.blob,
+            f"{space}_post_offsets": post_offsets,
+            f"{space}_postings": postings,
+        }
+        if space in PREFIX_SPACES:
+            block_min = _block_minima(postings)
+            sections[f"{space}_block_min"] = block_min
+            sections[f"{space}_super_min"] = _block_minima(block_min)
+        return sections
+
+    def save(self, path: str) -> None:
+        """
+        Write the index to a file that `load` can memory-map.
+
+        Args:
+            path (str): The file to write.
+        """
+        save_sections(
+            path,
+            MAGIC,
+            {"version": FORMAT_VERSION, "release": self.release, "sabs": self.sabs},
+            [(name, typecode, self._sections[name]) for name, typecode in SECTIONS],
+        )
+        logger.info(f"Saved string index to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> "StringIndex":
+        """
+        Memory-map an index written by `save`.
+
+        Args:
+            path (str): The index file.
+
+        Returns:
+            StringIndex: The index, backed by the file.
+        Raises:
+            ValueError: If the file is not a string index or was written in an incompatible format.
+        """
+        header, sections, mapped = load_sections(
+            path, MAGIC, "string index", FORMAT_VERSION
+        )
+        index = cls(header, sections, mapped)
+        index.path = path
+        return index
+
+    def close(self) -> None:
+        """Release the memory map of a loaded index."""
+        close_sections(self._sections, self._mmap)
+        self._mmap = None
+
+    def __enter__(self) -> "StringIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._sections["atom_cui"])
+
+    def keys(self, space: str) -> Sequence[str]:
+        """Return the sorted keys of a key space (see `postings`)."""
+        return self._keys[space]
+
+    def key_postings(self, space: str, i: int) -> Sequence[int]:
+        """Return the atoms of the `i`-th key of a key space, in rank order."""
+        offsets = self._sections[f"{space}_post_offsets"]
+        return self._sections[f"{space}_postings"][offsets[i] : offsets[i + 1]]
+
+    def postings(self, space: str, key: str) -> Sequence[int]:
+        """
+        Return the atoms of a key, in rank order.
+
+        Args:
+            space (str): 'exact' (lowercase strings), 'reverse' (reversed lowercase strings),
+                'norm' (normalized strings) or 'nwords' (normalized words).
+            key (str): The key.
+
+        Returns:
+            Sequence[int]: The atom numbers; empty if the key is unknown.
+        """
+        keys = self._keys[space]
+        i = bisect_left(keys, key)
+        if i == len(keys) or keys[i] != key:
+            return ()
+        return self.key_postings(space, i)
+
+    def prefixed(self, space: str, prefix: str) -> Iterator[int]:
+        """
+        Yield the atoms of all keys starting with a prefix, in rank order.
+
+        Args:
+            space (str): 'exact' (lowercase strings) or 'reverse' (reversed lowercase strings).
+            prefix (str): The prefix.
+
+        Yields:
+            int: Atom numbers.
+        """
+        keys = self._keys[space]
+        first = bisect_left(keys, prefix)
+        last = bisect_left(keys, prefix + _PREFIX_END, first)
+        offsets = self._sections[f"{space}_post_offsets"]
+        return _ranked_slice(
+            self._sections[f"{space}_postings"],
+            self._sections[f"{space}_block_min"],
+            self._sections[f"{space}_super_min"],
+            offsets[first],
+            offsets[last],
+        )
+
+    def _matches(self, string: str, search_type: str) -> Iterator[int]:
+        """Yield the atoms matching a search, ranked like RRFStore.search."""
+        lowered = string.lower()
+        exact = self.postings("exact", lowered)
+        if search_type == "exact":
+            yield from exact
+            return
+        if search_type == "normalizedWords":
+            # A query of stop words only matches nothing, not even atoms equal to it
+            words = normalize_words(string)
+            if not words:
+                return
+        # Atoms equal to the query rank first; they are a subset of the other matches
+        yield from exact
+        seen = set(exact)
+        if search_type == "rightTruncation":
+            candidates: Iterator[int] = self.prefixed("exact", lowered)
+        elif search_type == "leftTruncation":
+            candidates = self.prefixed("reverse", lowered[::-1])
+        elif search_type == "normalizedString":
+            candidates = iter(self.postings("norm", normalize_string(string)))
+        else:
+            lists = sorted((self.postings("nwords", word) for word in words), key=len)
+            candidates = self._intersect(lists)
+        for atom in candidates:
+            if atom not in seen:
+                yield atom
+
+    @staticmethod
+    def _intersect(lists: List[Sequence[int]]) -> Iterator[int]:
+        """Intersect sorted posting lists, walking the shortest and binary searching the others."""
+        shortest, others = lists[0], lists[1:]
+        starts = [0] * len(others)
+        for atom in shortest:
+            for j, other in enumerate(others):
+                starts[j] = bisect_left(other, atom, starts[j])
+                if starts[j] == len(other) or other[starts[j]] != atom:
+                    break
+            else:
+                yield atom
+
+    def lookup(
+        self,
+        string: str,
+        search_type: str = "exact",
+        sabs: Optional[Sequence[str]] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+    ) -> Iterator[int]:
+        """
+        Yield the atoms matching a search, best matches first.
+
+        Args:
+            string (str): The search string.
+            search_type (str): One of `SEARCH_TYPES`.
+            sabs (Optional[Sequence[str]]): Only atoms of these sources.
+            include_obsolete (bool): Include obsolete atoms.
+            include_suppressible (bool): Include suppressible atoms.
+
+        Yields:
+            int: Atom numbers, to pass to `atom`.
+        Raises:
+            ValueError: If the search type is not supported.
+        """
+        if search_type not in SEARCH_TYPES:
+            raise ValueError(
+                f"Unsupported search type: {search_type}. Available types are {', '.join(SEARCH_TYPES)}"
+            )
+        return self.filter_atoms(
+            self._matches(string, search_type),
+            sabs,
+            include_obsolete,
+            include_suppressible,
+        )
+
+    def filter_atoms(
+        self,
+        atoms: Iterable[int],
+        sabs: Optional[Sequence[str]] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+    ) -> Iterator[int]:
+        """
+        Yield the atoms passing the source and suppression filters of a search, in their order.
+
+        Args:
+            atoms (Iterable[int]): Atom numbers.
+            sabs (Optional[Sequence[str]]): Only atoms of these sources.
+            include_obsolete (bool): Include obsolete atoms.
+            include_suppressible (bool): Include suppressible atoms.
+
+        Yields:
+            int: The atoms kept.
+        """
+        excluded = EXCLUDED
+        if not include_obsolete:
+            excluded |= OBSOLETE
+        if not include_suppressible:
+            excluded |= SUPPRESSIBLE
+        allowed = None
+        if sabs:
+            allowed = {self._sab_ids[sab] for sab in sabs if sab in self._sab_ids}
+            if not allowed:
+                return
+        atom_sab, atom_flags = self._sections["atom_sab"], self._sections["atom_flags"]
+        for atom in atoms:
+            if atom_flags[atom] & excluded:
+                continue
+            if allowed is not None and atom_sab[atom] not in allowed:
+                continue
+            yield atom
+
+    def atom(self, atom: int) -> Dict[str, Any]:
+        """Return an atom as a row with the cui, aui, sab, code, scui, sdui and str MRCONSO columns."""
+        row = {column: table[atom] for column, table in self._columns.items()}
+        cui_id = self._sections["atom_cui"][atom]
+        row.update(
+            cui=self._cuis[cui_id],
+            cui_id=cui_id,
+            sab=self.sabs[self._sections["atom_sab"][atom]],
+        )
+        return row
+
+    def search_results(
+        self,
+        string: str,
+        search_type: str = "exact",
+        sabs: Optional[Sequence[str]] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        return_id_type: str = "concept",
+        base_url: str = "https://uts-ws.nlm.nih.gov/rest",
+        version: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a search and shape the matches like the results of the UTS search endpoint.
+
+        Args:
+            string (str): The search string.
+            search_type (str): One of `SEARCH_TYPES`.
+            sabs (Optional[Sequence[str]]): Only atoms of these sources.
+            include_obsolete (bool): Include obsolete atoms.
+            include_suppressible (bool): Include suppressible atoms.
+            return_id_type (str): The identifier of each result, as in `SearchAPI.search`.
+            base_url (str): Base of the result URIs.
+            version (Optional[str]): The release used in result URIs. Defaults to the index release.
+            limit (Optional[int]): Stop after this many results (None for all).
+
+        Returns:
+            List[Dict[str, Any]]: The results (ui, rootSource, uri, name), best match first.
+        """
+        atoms = self.lookup(
+            string, search_type, sabs, include_obsolete, include_suppressible
+        )
+        return self.results(atoms, return_id_type, base_url, version, limit)
+
+    def results(
+        self,
+        atoms: Iterable[int],
+        return_id_type: str = "concept",
+        base_url: str = "https://uts-ws.nlm.nih.gov/rest",
+        version: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Shape ranked atoms like the results of the UTS search endpoint, one per distinct identifier.
+
+        Args:
+            atoms (Iterable[int]): Atom numbers, best first. Consumed lazily.
+            return_id_type (str): The identifier of each result, as in `SearchAPI.search`.
+            base_url (str): Base of the result URIs.
+            version (Optional[str]): The release used in result URIs. Defaults to the index release.
+            limit (Optional[int]): Stop after this many results (None for all).
+
+        Returns:
+            List[Dict[str, Any]]: The results (ui, rootSource, uri, name).
+        """
+        return search_results(
+            (self.atom(atom) for atom in atoms),
+            lambda row: self._names[row["cui_id"]],
+            return_id_type=return_id_type,
+            base_url=base_url,
+            version=version or self.release or "current",
+            limit=limit,
+        )
+
+    def search(
+        self,
+        search_string: str,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        return_id_type: str = "concept",
+        sabs: Optional[str] = None,
+        search_type: str = "exact",
+        page_number: int = 1,
+        page_size: int = 25,
+    ) -> Dict[str, Any]:
+        """
+        Search the index, returning the response `SearchAPI.search` would return for the search.
+
+        Parameters:
+            search_string (str): The search term.
+            include_obsolete (bool, optional): Return content that matches on obsolete terms. Default is False.
+            include_suppressible (bool, optional): Return content that matches on suppressible terms. Default is False.
+            return_id_type (str, optional): Specifies the type of identifier to retrieve. Default is 'concept'.
+            sabs (str, optional): Comma-separated list of source vocabularies to include in your search.
+            search_type (str, optional): 'exact' (default), 'normalizedString', 'normalizedWords',
+                'rightTruncation' or 'leftTruncation'.
+            page_number (int, optional): Specifies the page of results to fetch. Default is 1.
+            page_size (int, optional): Specifies the number of results to include per page. Default is 25.
+
+        Returns:
+            Dict[str, Any]: The search results.
+        """
+        results = self.search_results(
+            search_string,
+            search_type=search_type,
+            sabs=[sab for sab in (sabs or "").split(",") if sab],
+            include_obsolete=include_obsolete,
+            include_suppressible=include_suppressible,
+            return_id_type=return_id_type,
+            limit=page_number * page_size,
+        )
+        return search_response(results, page_number, page_size)
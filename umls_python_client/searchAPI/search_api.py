@@ -1,11 +1,15 @@
 import logging
 import os
-from typing import Any, Dict, Optional
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
 
 from umls_python_client.baseAPI.umls_api_base import UMLSAPIBase
-from umls_python_client.utils.save_output import save_output_to_file
+from umls_python_client.utils.save_output import (
+    save_output_to_file,
+    save_rows_to_file,
+)
 from umls_python_client.utils.utils import handle_response_with_format
 
 # Configure logging
@@ -98,7 +102,7 @@ class SearchAPI(UMLSAPIBase):
 
         # Make the API request
         try:
-            response = requests.get(endpoint, params=params)
+            response = self._fetch(endpoint, params=params)
         except requests.RequestException as e:
             logger.error(f"Error during API request: {e}")
             return {"error": f"Request failed: {e}"}
@@ -108,13 +112,178 @@ class SearchAPI(UMLSAPIBase):
                 file_path = f"search_{search_string}.txt"
             else:
                 file_path = os.path.join(file_path, f"search_{search_string}.txt")
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         # Handle the response
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             format=format,
             return_indented=return_indented,
         )
+
+    def iter_search(
+        self,
+        search_string: str,
+        input_type: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        return_id_type: str = "concept",
+        sabs: Optional[str] = None,
+        search_type: str = "words",
+        partial_search: bool = False,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all search results, fetching the next page only when it is needed.
+
+        Parameters:
+            search_string (str): The search term or code to search in UMLS.
+            page_size (int, optional): Number of results fetched per request. Default is 25.
+            max_items (int, optional): Stop after this many results. Default is None (all results).
+            The remaining parameters are the same as for `search`.
+
+        Yields:
+            Dict[str, Any]: One search result at a time.
+        """
+        return self._iter_pages(
+            lambda page_number: self.search(
+                search_string,
+                input_type=input_type,
+                include_obsolete=include_obsolete,
+                include_suppressible=include_suppressible,
+                return_id_type=return_id_type,
+                sabs=sabs,
+                search_type=search_type,
+                partial_search=partial_search,
+                page_number=page_number,
+                page_size=page_size,
+                return_indented=False,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    @staticmethod
+    def normalize_search_string(search_string: str) -> str:
+        """
+        Normalize a query string for deduplication: lower case with runs of whitespace collapsed.
+        UMLS search is case-insensitive, so normalized duplicates return the same results.
+        """
+        return " ".join(search_string.split()).lower()
+
+    def search_many(
+        self,
+        search_strings: Iterable[str],
+        top_k: int = 1,
+        max_workers: int = 8,
+        ordered: bool = True,
+        input_type: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        return_id_type: str = "concept",
+        sabs: Optional[str] = None,
+        search_type: str = "words",
+        partial_search: bool = False,
+    ) -> Iterator[Tuple[str, str, Union[List[str], Dict[str, Any]]]]:
+        """
+        Search many strings concurrently, sending every distinct normalized string only once.
+
+        Every input string gets its own row, repeats included, so the rows can be joined back to the
+        caller's data on the original string (or zipped with the input when `ordered` is True).
+
+        Parameters:
+            search_strings (Iterable[str]): The strings to search; may be a generator.
+            top_k (int, optional): Number of identifiers kept per string. Default is 1.
+            max_workers (int, optional): Maximum number of searches in flight at once. Default is 8.
+            ordered (bool, optional): Yield in input order (True) or as soon as each search finishes (False).
+            The remaining parameters are the same as for `search`.
+
+        Yields:
+            Tuple[str, str, Union[List[str], Dict[str, Any]]]: Each input string, its normalized form (the
+            deduplication key) and the identifiers of its top `top_k` results (best first), or an error
+            dictionary if the search failed. Blank strings get no identifiers.
+        """
+
+        def search_one(search_string: str) -> Union[List[str], Dict[str, Any]]:
+            data = self.search(
+                search_string,
+                input_type=input_type,
+                include_obsolete=include_obsolete,
+                include_suppressible=include_suppressible,
+                return_id_type=return_id_type,
+                sabs=sabs,
+                search_type=search_type,
+                partial_search=partial_search,
+                page_size=top_k,
+                return_indented=False,
+            )
+            if not isinstance(data, dict) or "error" in data:
+                return data
+            return [result["ui"] for result in self._page_results(data)[:top_k]]
+
+        # Results by normalized string, and the input strings still waiting for theirs
+        results: Dict[str, Union[List[str], Dict[str, Any]]] = {"": []}
+        waiting: "deque[Tuple[str, str]]" = deque()
+
+        def keys() -> Iterator[str]:
+            for search_string in search_strings:
+                key = self.normalize_search_string(search_string)
+                waiting.append((search_string, key))
+                if key:
+                    yield key
+
+        def ready() -> Iterator[Tuple[str, str, Union[List[str], Dict[str, Any]]]]:
+            if ordered:
+                while waiting and waiting[0][1] in results:
+                    search_string, key = waiting.popleft()
+                    yield search_string, key, results[key]
+            else:
+                for _ in range(len(waiting)):
+                    search_string, key = waiting.popleft()
+                    if key in results:
+                        yield search_string, key, results[key]
+                    else:
+                        waiting.append((search_string, key))
+
+        for key, result in self._map_many(
+            search_one, keys(), max_workers=max_workers, ordered=ordered
+        ):
+            results[key] = result
+            yield from ready()
+        yield from ready()
+
+    def save_search_table(
+        self,
+        search_strings: Iterable[str],
+        file_path: str,
+        format: str = "csv",
+        **kwargs: Any,
+    ) -> int:
+        """
+        Stream the string to top-k identifier table of `search_many` to a CSV or JSON Lines file.
+
+        Parameters:
+            search_strings (Iterable[str]): The strings to search; may be a generator.
+            file_path (str): The path of the output file.
+            format (str, optional): Either 'csv' or 'jsonl'. Default is 'csv'.
+            **kwargs: Additional arguments for `search_many` (top_k, sabs, search_type, ...).
+
+        Returns:
+            int: The number of rows written, one per input string with columns string (as given),
+            normalized (the deduplication key) and ids. Strings whose search failed are logged and left out.
+        """
+
+        def rows() -> Iterator[Tuple[str, str, List[str]]]:
+            for search_string, key, ids in self.search_many(search_strings, **kwargs):
+                if isinstance(ids, dict):
+                    logger.error(f"Search for '{search_string}' failed: {ids}")
+                    continue
+                yield search_string, key, ids
+
+        return save_rows_to_file(
+            rows(),
+            file_path,
+            fieldnames=("string", "normalized", "ids"),
+            format=format,
+        )
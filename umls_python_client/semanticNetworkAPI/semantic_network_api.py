@@ -54,7 +54,7 @@ class SemanticNetworkAPI(UMLSAPIBase):
 
         # Make the API request
         try:
-            response = requests.get(url, params=params)
+            response = self._fetch(url, params=params)
         except requests.RequestException as e:
             logger.error(f"Error during API request: {e}")
             return {"error": f"Request failed: {e}"}
@@ -64,12 +64,10 @@ class SemanticNetworkAPI(UMLSAPIBase):
                 file_path = f"semantic_type_{tui}.txt"
             else:
                 file_path = os.path.join(file_path, f"semantic_type_{tui}.txt")
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         # Handle the response
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             return_indented=return_indented,
         )
@@ -1 +1,4 @@
+from .hierarchy_snapshot import HierarchySnapshot
+from .similarity_engine import SimilarityEngine
 from .source_api import SourceAPI
+from .subsumption_index import SubsumptionIndex
@@ -0,0 +1,311 @@
+import logging
+import mmap
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from umls_python_client.utils.mapped_sections import (
+    StringTable,
+    build_string_table,
+    close_sections,
+    load_sections,
+    save_sections,
+)
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"UMLSHSN1"
+FORMAT_VERSION = 1
+# Section order in the file; offsets are int64 ("q"), edge targets are int32 ("i")
+SECTIONS = (
+    ("id_offsets", "q"),
+    ("id_blob", "B"),
+    ("name_offsets", "q"),
+    ("name_blob", "B"),
+    ("parent_offsets", "q"),
+    ("parent_index", "i"),
+    ("child_offsets", "q"),
+    ("child_index", "i"),
+)
+
+
+class HierarchySnapshot:
+    """
+    Compact local copy of a source hierarchy that answers hierarchy queries without the network.
+
+    Concept identifiers are sorted and mapped to dense integers (their rank), so an identifier is
+    found by binary search. Parent and child edges are stored as CSR adjacency arrays: the
+    neighbours of concept `i` are `index[offsets[i]:offsets[i + 1]]`. Saved snapshots are
+    memory-mapped on load, so opening one is instant and its pages are shared between processes.
+
+    Attributes:
+        source (str): The source vocabulary of the hierarchy, e.g. 'SNOMEDCT_US'.
+        partial (bool): Whether the crawl that built the snapshot was cut short or missed concepts,
+            so some edges may be absent.
+        include_ancestors (bool): Whether the ancestors of every concept up to the roots of the source
+            are included, so depths count from the real roots.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        sections: Dict[str, Sequence[int]],
+        mapped: Optional[mmap.mmap] = None,
+        partial: bool = False,
+        include_ancestors: bool = True,
+    ):
+        """
+        Initialize the HierarchySnapshot from its arrays. Use `from_edges` or `load` instead.
+
+        Args:
+            source (str): The source vocabulary.
+            sections (Dict[str, Sequence[int]]): The arrays named in `SECTIONS`.
+            mapped (Optional[mmap.mmap]): The memory map backing the arrays, if any.
+            partial (bool): Whether some edges of the hierarchy may be missing.
+            include_ancestors (bool): Whether the ancestors of every concept are included.
+        """
+        self.source = source
+        self.partial = partial
+        self.include_ancestors = include_ancestors
+        self._sections = sections
+        self._mmap = mapped
+        self._ids = StringTable(sections["id_blob"], sections["id_offsets"])
+        self._names = StringTable(sections["name_blob"], sections["name_offsets"])
+
+    @classmethod
+    def from_edges(
+        cls,
+        source: str,
+        edges: Iterable[Tuple[str, str]],
+        names: Optional[Dict[str, str]] = None,
+        partial: bool = False,
+        include_ancestors: bool = True,
+    ) -> "HierarchySnapshot":
+        """
+        Build a snapshot from (child, parent) edges.
+
+        Args:
+            source (str): The source vocabulary.
+            edges (Iterable[Tuple[str, str]]): The is-a edges as (child, parent) pairs. Repeated edges are ignored
+                and the order of each concept's parents and children is kept.
+            names (Optional[Dict[str, str]]): Concept names by identifier.
+            partial (bool): Whether some edges of the hierarchy may be missing.
+            include_ancestors (bool): Whether the ancestors of every concept are included.
+
+        Returns:
+            HierarchySnapshot: The in-memory snapshot.
+        """
+        names = names or {}
+        edges = list(dict.fromkeys(edges))
+        ids = sorted({concept for edge in edges for concept in edge} | set(names))
+        index = {concept_id: i for i, concept_id in enumerate(ids)}
+
+        def csr(pairs: List[Tuple[int, int]]) -> Tuple[array, array]:
+            counts = [0] * (len(ids) + 1)
+            for node, _ in pairs:
+                counts[node + 1] += 1
+            for i in range(len(ids)):
+                counts[i + 1] += counts[i]
+            offsets = array("q", counts)
+            targets = array("i", bytes(4 * len(pairs)))
+            position = list(counts[:-1])
+            for node, target in pairs:
+                targets[position[node]] = target
+                position[node] += 1
+            return offsets, targets
+
+        id_offsets, id_blob = build_string_table(ids)
+        name_offsets, name_blob = build_string_table(
+            [names.get(concept_id) or "" for concept_id in ids]
+        )
+        parent_offsets, parent_index = csr(
+            [(index[child], index[parent]) for child, parent in edges]
+        )
+        child_offsets, child_index = csr(
+            [(index[parent], index[child]) for child, parent in edges]
+        )
+        logger.info(
+            f"Built {source} hierarchy snapshot with {len(ids)} concepts and {len(edges)} edges"
+        )
+        return cls(
+            source,
+            {
+                "id_offsets": id_offsets,
+                "id_blob": id_blob,
+                "name_offsets": name_offsets,
+                "name_blob": name_blob,
+                "parent_offsets": parent_offsets,
+                "parent_index": parent_index,
+                "child_offsets": child_offsets,
+                "child_index": child_index,
+            },
+            partial=partial,
+            include_ancestors=include_ancestors,
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Write the snapshot to a file that `load` can memory-map.
+
+        Args:
+            path (str): The file to write.
+        """
+        save_sections(
+            path,
+            MAGIC,
+            {
+                "version": FORMAT_VERSION,
+                "source": self.source,
+                "partial": self.partial,
+                "include_ancestors": self.include_ancestors,
+            },
+            [(name, typecode, self._sections[name]) for name, typecode in SECTIONS],
+        )
+        logger.info(f"Saved {self.source} hierarchy snapshot to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> "HierarchySnapshot":
+        """
+        Memory-map a snapshot written by `save`.
+
+        Args:
+            path (str): The snapshot file.
+
+        Returns:
+            HierarchySnapshot: The snapshot, backed by the file.
+        Raises:
+            ValueError: If the file is not a snapshot or was written on a machine with another byte order.
+        """
+        header, sections, mapped = load_sections(
+            path, MAGIC, "hierarchy snapshot", FORMAT_VERSION
+        )
+        return cls(
+            header["source"],
+            sections,
+            mapped,
+            partial=header.get("partial", False),
+            include_ancestors=header.get("include_ancestors", True),
+        )
+
+    def close(self) -> None:
+        """Release the memory map of a loaded snapshot."""
+        close_sections(self._sections, self._mmap)
+        self._mmap = None
+
+    def __enter__(self) -> "HierarchySnapshot":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, concept_id: str) -> bool:
+        return self.index_of(concept_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def index_of(self, concept_id: str) -> Optional[int]:
+        """Return the dense integer of a concept, or None if it is not in the snapshot."""
+        i = bisect_left(self._ids, concept_id)
+        if i < len(self._ids) and self._ids[i] == concept_id:
+            return i
+        return None
+
+    def concept_id(self, index: int) -> str:
+        """Return the concept identifier of a dense integer."""
+        return self._ids[index]
+
+    def name(self, concept_id: str) -> Optional[str]:
+        """Return the name of a concept, or None if it is unknown."""
+        i = self.index_of(concept_id)
+        return (self._names[i] or None) if i is not None else None
+
+    def concept(self, concept_id: str) -> Dict[str, Any]:
+        """Return a concept in the shape of the UTS source-asserted entries (ui, name, rootSource)."""
+        return {
+            "ui": concept_id,
+            "name": self.name(concept_id),
+            "rootSource": self.source,
+        }
+
+    def adjacency(self, kind: str) -> Tuple[Sequence[int], Sequence[int]]:
+        """
+        Return the CSR arrays of one edge direction.
+
+        Args:
+            kind (str): 'parent' or 'child'.
+
+        Returns:
+            Tuple[Sequence[int], Sequence[int]]: The offsets and index arrays; the neighbours of concept `i`
+            are `index[offsets[i]:offsets[i + 1]]`.
+        """
+        return self._sections[f"{kind}_offsets"], self._sections[f"{kind}_index"]
+
+    def _neighbours(self, i: int, kind: str) -> Sequence[int]:
+        offsets = self._sections[f"{kind}_offsets"]
+        return self._sections[f"{kind}_index"][offsets[i] : offsets[i + 1]]
+
+    def _closure(self, concept_id: str, kind: str) -> List[str]:
+        """Breadth-first transitive closure over the parent or child arrays."""
+        start = self.index_of(concept_id)
+        if start is None:
+            return []
+        visited = {start}
+        queue = deque([start])
+        closure = []
+        while queue:
+            for neighbour in self._neighbours(queue.popleft(), kind):
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    queue.append(neighbour)
+                    closure.append(self._ids[neighbour])
+        return closure
+
+    def parents(self, concept_id: str) -> List[str]:
+        """Return the immediate parents of a concept."""
+        i = self.index_of(concept_id)
+        if i is None:
+            return []
+        return [self._ids[parent] for parent in self._neighbours(i, "parent")]
+
+    def children(self, concept_id: str) -> List[str]:
+        """Return the immediate children of a concept."""
+        i = self.index_of(concept_id)
+        if i is None:
+            return []
+        return [self._ids[child] for child in self._neighbours(i, "child")]
+
+    def ancestors(self, concept_id: str) -> List[str]:
+        """Return all ancestors of a concept, nearest first."""
+        return self._closure(concept_id, "parent")
+
+    def descendants(self, concept_id: str) -> List[str]:
+        """Return all descendants of a concept, nearest first."""
+        return self._closure(concept_id, "child")
+
+    def relatives(self, concept_id: str, relation: str) -> List[Dict[str, Any]]:
+        """
+        Answer a source hierarchy endpoint from the snapshot.
+
+        Args:
+            concept_id (str): The concept.
+            relation (str): 'parents', 'children', 'ancestors' or 'descendants'.
+
+        Returns:
+            List[Dict[str, Any]]: The related concepts as UTS-style entries.
+        Raises:
+            ValueError: If the relation is not one of the hierarchy endpoints.
+        """
+        lookups = {
+            "parents": self.parents,
+            "children": self.children,
+            "ancestors": self.ancestors,
+            "descendants": self.descendants,
+        }
+        if relation not in lookups:
+            raise ValueError(f"Unsupported hierarchy relation: {relation}")
+        return [self.concept(related) for related in lookups[relation](concept_id)]
@@ -0,0 +1,209 @@
+import logging
+import math
+from array import array
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from umls_python_client.sourceAPI.hierarchy_snapshot import HierarchySnapshot
+
+logger = logging.getLogger(__name__)
+
+MEASURES = ("path_length", "wu_palmer", "leacock_chodorow")
+
+
+class SimilarityEngine:
+    """
+    Lowest common ancestor and taxonomy similarity measures over a HierarchySnapshot.
+
+    The depth of every concept (shortest is-a path from a root, roots have depth 1) and the
+    maximum depth of the taxonomy are precomputed. The upward distances from a concept to each of
+    its ancestors are computed once per concept and memoized, so scoring many pairs that share
+    concepts costs little more than intersecting two small dictionaries. In a polyhierarchy the
+    lowest common ancestor is the deepest common ancestor (ties go to the one closest to both).
+
+    Attributes:
+        source (str): The source vocabulary of the hierarchy.
+        max_depth (int): The depth of the deepest concept.
+    """
+
+    def __init__(self, snapshot: HierarchySnapshot, cache_size: Optional[int] = 65536):
+        """
+        Build the engine from a snapshot.
+
+        Args:
+            snapshot (HierarchySnapshot): The hierarchy.
+            cache_size (Optional[int]): Number of ancestor distance maps kept in memory (None for unbounded).
+        """
+        self.source = snapshot.source
+        self._ids = list(snapshot)
+        self._index = {concept_id: i for i, concept_id in enumerate(self._ids)}
+        self._parent_offsets, self._parent_index = snapshot.adjacency("parent")
+        child_offsets, child_index = snapshot.adjacency("child")
+
+        count = len(self._ids)
+        depth = array("i", [0]) * count
+        queue = deque()
+        for i in range(count):
+            if self._parent_offsets[i] == self._parent_offsets[i + 1]:
+                depth[i] = 1
+                queue.append(i)
+        while queue:
+            node = queue.popleft()
+            for position in range(child_offsets[node], child_offsets[node + 1]):
+                child = child_index[position]
+                if depth[child] == 0:
+                    depth[child] = depth[node] + 1
+                    queue.append(child)
+        # Concepts only reachable through a cycle have no root; treat them as top level
+        for i in range(count):
+            if depth[i] == 0:
+                depth[i] = 1
+        self._depth = depth
+        self.max_depth = max(depth) if count else 0
+        self._upward = lru_cache(maxsize=cache_size)(self._upward_distances)
+        logger.info(
+            f"Built {self.source} similarity engine over {count} concepts, maximum depth {self.max_depth}"
+        )
+
+    def _upward_distances(self, node: int) -> Dict[int, int]:
+        """Shortest number of is-a steps from a concept to itself and each of its ancestors."""
+        distances = {node: 0}
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            for position in range(
+                self._parent_offsets[current], self._parent_offsets[current + 1]
+            ):
+                parent = self._parent_index[position]
+                if parent not in distances:
+                    distances[parent] = distances[current] + 1
+                    queue.append(parent)
+        return distances
+
+    def _lcs(self, first: int, second: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Return (lca, distance from first, distance from second, shortest path length through any
+        common ancestor), or None if the concepts share no ancestor.
+        """
+        up_first = self._upward(first)
+        up_second = self._upward(second)
+        if len(up_first) > len(up_second):
+            up_first, up_second = up_second, up_first
+            first, second = second, first
+            swapped = True
+        else:
+            swapped = False
+
+        best = None
+        shortest = None
+        for ancestor, distance in up_first.items():
+            other = up_second.get(ancestor)
+            if other is None:
+                continue
+            path = distance + other
+            if shortest is None or path < shortest:
+                shortest = path
+            key = (-self._depth[ancestor], path, ancestor)
+            if best is None or key < best[0]:
+                best = (key, ancestor, distance, other)
+        if best is None:
+            return None
+        _, ancestor, distance, other = best
+        if swapped:
+            distance, other = other, distance
+        return ancestor, distance, other, shortest
+
+    def _score(self, measure: str, lcs: Tuple[int, int, int, int]) -> float:
+        """Compute one measure from the result of `_lcs`."""
+        ancestor, distance, other, shortest = lcs
+        if measure == "path_length":
+            return shortest
+        if measure == "wu_palmer":
+            lca_depth = self._depth[ancestor]
+            return 2 * lca_depth / (distance + other + 2 * lca_depth)
+        return -math.log((shortest + 1) / (2 * self.max_depth))
+
+    def _resolve(self, concept_id: str) -> int:
+        i = self._index.get(concept_id)
+        if i is None:
+            raise ValueError(f"{concept_id} is not in the {self.source} snapshot.")
+        return i
+
+    def depth(self, concept_id: str) -> int:
+        """Return the depth of a concept (roots have depth 1). Raises ValueError if it is unknown."""
+        return self._depth[self._resolve(concept_id)]
+
+    def lca(self, first: str, second: str) -> Optional[str]:
+        """Return the lowest (deepest) common ancestor of two concepts, a concept counting as its own ancestor."""
+        lcs = self._lcs(self._resolve(first), self._resolve(second))
+        return self._ids[lcs[0]] if lcs is not None else None
+
+    def similarity(self, first: str, second: str) -> Dict[str, Any]:
+        """
+        Compute the LCA and all similarity measures of a concept pair.
+
+        - path_length: the fewest is-a edges on a path through a common ancestor.
+        - wu_palmer: 2 * depth(lca) / (d1 + d2 + 2 * depth(lca)), where d1 and d2 are the distances to the lca.
+        - leacock_chodorow: -log((path_length + 1) / (2 * max_depth)).
+
+        Args:
+            first (str): The first concept.
+            second (str): The second concept.
+
+        Returns:
+            Dict[str, Any]: The lca and the measures; all None if the concepts share no ancestor.
+        Raises:
+            ValueError: If either concept is not in the snapshot.
+        """
+        i, j = self._resolve(first), self._resolve(second)
+        result = {"concept_1": first, "concept_2": second, "lca": None}
+        result.update({measure: None for measure in MEASURES})
+        lcs = self._lcs(i, j)
+        if lcs is None:
+            return result
+        result["lca"] = self._ids[lcs[0]]
+        result.update({measure: self._score(measure, lcs) for measure in MEASURES})
+        return result
+
+    def path_length(self, first: str, second: str) -> Optional[int]:
+        """Return the fewest is-a edges on a path between two concepts through a common ancestor."""
+        return self.similarity(first, second)["path_length"]
+
+    def wu_palmer(self, first: str, second: str) -> Optional[float]:
+        """Return the Wu-Palmer similarity of two concepts (1.0 for identical concepts)."""
+        return self.similarity(first, second)["wu_palmer"]
+
+    def leacock_chodorow(self, first: str, second: str) -> Optional[float]:
+        """Return the Leacock-Chodorow similarity of two concepts."""
+        return self.similarity(first, second)["leacock_chodorow"]
+
+    def score_many(
+        self, pairs: Iterable[Tuple[str, str]], measure: str = "wu_palmer"
+    ) -> List[Optional[float]]:
+        """
+        Score many concept pairs with one measure, reusing the memoized ancestor distances. Only the
+        requested measure is computed for each pair.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): The concept pairs.
+            measure (str): 'path_length', 'wu_palmer' or 'leacock_chodorow' (default: 'wu_palmer').
+
+        Returns:
+            List[Optional[float]]: One score per pair, in order (None where undefined).
+        Raises:
+            ValueError: If the measure is not supported or a concept is not in the snapshot.
+        """
+        if measure not in MEASURES:
+            raise ValueError(
+                f"Unsupported similarity measure: {measure}. Available measures are {', '.join(MEASURES)}"
+            )
+        resolve = self._resolve
+        lcs_of = self._lcs
+        score = self._score
+        scores = []
+        append = scores.append
+        for first, second in pairs:
+            lcs = lcs_of(resolve(first), resolve(second))
+            append(score(measure, lcs) if lcs is not None else None)
+        return scores
@@ -1,11 +1,25 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import requests
 
 from umls_python_client.baseAPI.umls_api_base import UMLSAPIBase
+from umls_python_client.sourceAPI.hierarchy_snapshot import HierarchySnapshot
+from umls_python_client.sourceAPI.similarity_engine import SimilarityEngine
+from umls_python_client.sourceAPI.subsumption_index import SubsumptionIndex
+from umls_python_client.utils.concurrency import bounded_map
 from umls_python_client.utils.save_output import save_output_to_file
 from umls_python_client.utils.utils import handle_response_with_format
 
@@ -16,9 +30,152 @@ logging.basicConfig(
 logger = logging.getLogger()
 
 
+# Paging parameters used by the public getters by default, so composite methods share their cache entries
+FIRST_PAGE = {"pageNumber": 1, "pageSize": 25}
+
+
 class SourceAPI(UMLSAPIBase):
     """Class for handling source-asserted UMLS API requests."""
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        Initialize the SourceAPI. Takes the same arguments as UMLSAPIBase.
+        Attributes:
+            snapshots (Dict[str, HierarchySnapshot]): Registered local hierarchies by source vocabulary.
+        """
+        super().__init__(*args, **kwargs)
+        self.snapshots: Dict[str, HierarchySnapshot] = {}
+        self._subsumption_indexes: Dict[str, SubsumptionIndex] = {}
+        self._similarity_engines: Dict[str, SimilarityEngine] = {}
+
+    def register_snapshot(self, snapshot: HierarchySnapshot) -> None:
+        """
+        Answer is-a and similarity queries for the snapshot's source vocabulary from the snapshot.
+
+        Args:
+            snapshot (HierarchySnapshot): The hierarchy, e.g. from `build_hierarchy_snapshot` or `HierarchySnapshot.load`.
+        """
+        self.snapshots[snapshot.source] = snapshot
+        self._subsumption_indexes.pop(snapshot.source, None)
+        self._similarity_engines.pop(snapshot.source, None)
+
+    def get_subsumption_index(self, source: str) -> Optional[SubsumptionIndex]:
+        """Return the subsumption index of a registered snapshot, building it on first use."""
+        if source not in self.snapshots:
+            return None
+        if source not in self._subsumption_indexes:
+            self._subsumption_indexes[source] = SubsumptionIndex(self.snapshots[source])
+        return self._subsumption_indexes[source]
+
+    def get_similarity_engine(self, source: str) -> SimilarityEngine:
+        """
+        Return the similarity engine of a registered snapshot, building it on first use.
+
+        Depths are counted from the roots the snapshot contains, so the snapshot must reach the roots of
+        the source: built with `include_ancestors` and not partial.
+        Raises:
+            ValueError: If no snapshot is registered for the source, or it is partial or lacks ancestors.
+        """
+        if source not in self.snapshots:
+            raise ValueError(
+                f"No hierarchy snapshot registered for {source}; see build_hierarchy_snapshot and register_snapshot."
+            )
+        snapshot = self.snapshots[source]
+        if snapshot.partial or not snapshot.include_ancestors:
+            raise ValueError(
+                f"The {source} snapshot is {'partial' if snapshot.partial else 'missing ancestors'}; "
+                "similarity needs a complete snapshot built with include_ancestors=True."
+            )
+        if source not in self._similarity_engines:
+            self._similarity_engines[source] = SimilarityEngine(self.snapshots[source])
+        return self._similarity_engines[source]
+
+    def _source_result(
+        self,
+        source: str,
+        id: str,
+        endpoint: Optional[str] = None,
+        default: Any = None,
+        **params: Any,
+    ) -> Any:
+        """
+        Fetch a source-asserted endpoint and return the parsed `result` object as is.
+
+        Composite methods use this instead of the public getters so that no response is formatted
+        to a JSON string and parsed back.
+
+        Args:
+            source (str): The source vocabulary.
+            id (str): The source-asserted identifier.
+            endpoint (Optional[str]): The sub-resource, e.g. 'parents' (None for the concept itself).
+            default (Any): Returned when the request fails or the response has no result.
+            **params (Any): Additional query parameters.
+        Returns:
+            Any: The `result` member of the response, or `default`.
+        """
+        url = f"{self.base_url}/content/{self.version}/source/{source}/{id}"
+        if endpoint:
+            url = f"{url}/{endpoint}"
+        data = self._fetch(url, params={"apiKey": self.api_key, **params})
+        if not isinstance(data, dict) or "error" in data:
+            logger.warning(f"No {endpoint or 'concept'} data for {source}/{id}: {data}")
+            return default
+        return data.get("result", default)
+
+    def _fetch_relatives(
+        self,
+        source: str,
+        ids: List[str],
+        endpoints: Tuple[str, ...],
+        max_workers: int = 8,
+        snapshot: Optional[HierarchySnapshot] = None,
+    ) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """
+        Fetch the first page of several hierarchy endpoints for many concepts concurrently.
+
+        Args:
+            source (str): The source vocabulary.
+            ids (List[str]): The source-asserted identifiers.
+            endpoints (Tuple[str, ...]): The endpoints to fetch for every identifier, e.g. ('parents', 'children').
+            max_workers (int): Maximum number of requests in flight at once.
+            snapshot (Optional[HierarchySnapshot]): Answer from this local snapshot instead of the network.
+        Returns:
+            Dict[Tuple[str, str], List[Dict[str, Any]]]: The results keyed by (id, endpoint). A failed
+            request is logged and yields an empty list.
+        """
+        lookups = [
+            (concept_id, endpoint) for concept_id in ids for endpoint in endpoints
+        ]
+        if snapshot is not None:
+            self._check_snapshot(source, snapshot)
+            return {
+                (concept_id, endpoint): snapshot.relatives(concept_id, endpoint)
+                for concept_id, endpoint in lookups
+            }
+        relatives = {}
+        for (concept_id, endpoint), result in bounded_map(
+            lambda lookup: self._source_result(
+                source, lookup[0], lookup[1], [], **FIRST_PAGE
+            ),
+            lookups,
+            max_workers=max_workers,
+        ):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Failed to fetch {endpoint} for {source}/{concept_id}: {result}"
+                )
+                result = []
+            relatives[concept_id, endpoint] = result
+        return relatives
+
+    @staticmethod
+    def _check_snapshot(source: str, snapshot: HierarchySnapshot) -> None:
+        """Make sure a hierarchy snapshot belongs to the requested source vocabulary."""
+        if snapshot.source != source:
+            raise ValueError(
+                f"The hierarchy snapshot is for {snapshot.source}, not {source}."
+            )
+
     def get_source_concept(
         self,
         source: str,
@@ -42,7 +199,7 @@ class SourceAPI(UMLSAPIBase):
         try:
             # Make the API request
             logger.info(f"Fetching source concept: {source}/{id}")
-            response = requests.get(url, params=params)
+            response = self._fetch(url, params=params)
             # If the status code error handling is already in _handle_response, no need to add it here
 
             # Save to file if required
@@ -53,12 +210,10 @@ class SourceAPI(UMLSAPIBase):
                     file_path = os.path.join(
                         file_path, f"source_concept_{source}_{id}.txt"
                     )
-                save_output_to_file(
-                    response=self._handle_response(response), file_path=file_path
-                )
+                save_output_to_file(response=response, file_path=file_path)
 
             return handle_response_with_format(
-                response=self._handle_response(response),
+                response=response,
                 format=format,
                 return_indented=return_indented,
             )
@@ -121,7 +276,7 @@ class SourceAPI(UMLSAPIBase):
         params = {k: v for k, v in params.items() if v is not None}
 
         # Make the request
-        response = requests.get(url, params=params)
+        response = self._fetch(url, params=params)
         logger.info(f"Fetching source atoms for: {source}/{id}")
 
         if save_to_file:
@@ -129,12 +284,10 @@ class SourceAPI(UMLSAPIBase):
                 file_path = f"source_atoms_{source}_{id}.txt"
             else:
                 file_path = os.path.join(file_path, f"source_atoms_{source}_{id}.txt")
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             format=format,
             return_indented=return_indented,
         )
@@ -147,6 +300,8 @@ class SourceAPI(UMLSAPIBase):
         format: str = "json",
         save_to_file: bool = False,
         file_path: str = None,
+        page_number: int = 1,
+        page_size: int = 25,
     ) -> Union[str, Dict[str, Any]]:
         """Retrieve immediate parents of a known source-asserted identifier."""
         if format not in ["json", "rdf"]:
@@ -156,20 +311,22 @@ class SourceAPI(UMLSAPIBase):
             return ""
 
         url = f"{self.base_url}/content/{self.version}/source/{source}/{id}/parents"
-        params = {"apiKey": self.api_key}
-        response = requests.get(url, params=params)
+        params = {
+            "apiKey": self.api_key,
+            "pageNumber": page_number,
+            "pageSize": page_size,
+        }
+        response = self._fetch(url, params=params)
 
         if save_to_file:
             if file_path == None:
                 file_path = f"source_parents_{source}_{id}.txt"
             else:
                 file_path = os.path.join(file_path, f"source_parents_{source}_{id}.txt")
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             format=format,
             return_indented=return_indented,
         )
@@ -182,6 +339,8 @@ class SourceAPI(UMLSAPIBase):
         format: str = "json",
         save_to_file: bool = False,
         file_path: str = None,
+        page_number: int = 1,
+        page_size: int = 25,
     ) -> Union[str, Dict[str, Any]]:
         """Retrieve immediate children of a known source-asserted identifier."""
 
@@ -192,8 +351,12 @@ class SourceAPI(UMLSAPIBase):
             return ""
 
         url = f"{self.base_url}/content/{self.version}/source/{source}/{id}/children"
-        params = {"apiKey": self.api_key}
-        response = requests.get(url, params=params)
+        params = {
+            "apiKey": self.api_key,
+            "pageNumber": page_number,
+            "pageSize": page_size,
+        }
+        response = self._fetch(url, params=params)
 
         if save_to_file:
             if file_path == None:
@@ -202,12 +365,10 @@ class SourceAPI(UMLSAPIBase):
                 file_path = os.path.join(
                     file_path, f"source_children_{source}_{id}.txt"
                 )
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             format=format,
             return_indented=return_indented,
         )
@@ -220,6 +381,8 @@ class SourceAPI(UMLSAPIBase):
         format: str = "json",
         save_to_file: bool = False,
         file_path: str = None,
+        page_number: int = 1,
+        page_size: int = 25,
     ) -> Union[str, Dict[str, Any]]:
         """Retrieve all ancestors of a known source-asserted identifier."""
 
@@ -230,8 +393,12 @@ class SourceAPI(UMLSAPIBase):
             return ""
 
         url = f"{self.base_url}/content/{self.version}/source/{source}/{id}/ancestors"
-        params = {"apiKey": self.api_key}
-        response = requests.get(url, params=params)
+        params = {
+            "apiKey": self.api_key,
+            "pageNumber": page_number,
+            "pageSize": page_size,
+        }
+        response = self._fetch(url, params=params)
         logger.info(f"Fetching ancestors for: {source}/{id}")
 
         if save_to_file:
@@ -241,12 +408,10 @@ class SourceAPI(UMLSAPIBase):
                 file_path = os.path.join(
                     file_path, f"source_ancestors_{source}_{id}.txt"
                 )
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             format=format,
             return_indented=return_indented,
         )
@@ -259,6 +424,8 @@ class SourceAPI(UMLSAPIBase):
         format: str = "json",
         save_to_file: bool = False,
         file_path: str = None,
+        page_number: int = 1,
+        page_size: int = 25,
     ) -> Union[str, Dict[str, Any]]:
         """Retrieve all descendants of a known source-asserted identifier."""
 
@@ -269,8 +436,12 @@ class SourceAPI(UMLSAPIBase):
             return ""
 
         url = f"{self.base_url}/content/{self.version}/source/{source}/{id}/descendants"
-        params = {"apiKey": self.api_key}
-        response = requests.get(url, params=params)
+        params = {
+            "apiKey": self.api_key,
+            "pageNumber": page_number,
+            "pageSize": page_size,
+        }
+        response = self._fetch(url, params=params)
         logger.info(f"Fetching descendants for: {source}/{id}")
 
         if save_to_file:
@@ -280,12 +451,10 @@ class SourceAPI(UMLSAPIBase):
                 file_path = os.path.join(
                     file_path, f"source_descendants_{source}_{id}.txt"
                 )
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             format=format,
             return_indented=return_indented,
         )
@@ -308,7 +477,7 @@ class SourceAPI(UMLSAPIBase):
             return ""
         url = f"{self.base_url}/content/{self.version}/source/{source}/{id}/attributes"
         params = {"apiKey": self.api_key}
-        response = requests.get(url, params=params)
+        response = self._fetch(url, params=params)
 
         if save_to_file:
             if file_path == None:
@@ -317,12 +486,10 @@ class SourceAPI(UMLSAPIBase):
                 file_path = os.path.join(
                     file_path, f"source_attributes_{source}_{id}.txt"
                 )
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             format=format,
             return_indented=return_indented,
         )
@@ -365,7 +532,7 @@ class SourceAPI(UMLSAPIBase):
         # Filter out any None values from params
         params = {k: v for k, v in params.items() if v is not None}
 
-        response = requests.get(url, params=params)
+        response = self._fetch(url, params=params)
         logger.info(f"Fetching relations for concept: {source}/{id}")
 
         if save_to_file:
@@ -375,12 +542,10 @@ class SourceAPI(UMLSAPIBase):
                 file_path = os.path.join(
                     file_path, f"source_relations_{source}_{id}.txt"
                 )
-            save_output_to_file(
-                response=self._handle_response(response), file_path=file_path
-            )
+            save_output_to_file(response=response, file_path=file_path)
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             format=format,
             return_indented=return_indented,
         )
@@ -396,15 +561,464 @@ class SourceAPI(UMLSAPIBase):
             )
             return ""
         params = {"apiKey": self.api_key}
-        response = requests.get(relations_url, params=params)
+        response = self._fetch(relations_url, params=params)
         logger.info(f"Fetching relations from URL: {relations_url}")
 
         return handle_response_with_format(
-            response=self._handle_response(response),
+            response=response,
             format=format,
             return_indented=return_indented,
         )
 
+    def iter_source_atoms(
+        self,
+        source: str,
+        id: str,
+        sabs: Optional[str] = None,
+        ttys: Optional[str] = None,
+        language: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all atoms of a source-asserted identifier, one page at a time."""
+        return self._iter_pages(
+            lambda page_number: self.get_source_atoms(
+                source,
+                id,
+                sabs=sabs,
+                ttys=ttys,
+                language=language,
+                include_obsolete=include_obsolete,
+                include_suppressible=include_suppressible,
+                page_number=page_number,
+                page_size=page_size,
+                return_indented=False,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    def iter_source_relations(
+        self,
+        source: str,
+        id: str,
+        include_relation_labels: Optional[str] = None,
+        include_additional_labels: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all relations of a source-asserted identifier, one page at a time."""
+        return self._iter_pages(
+            lambda page_number: self.get_source_relations(
+                source,
+                id,
+                include_relation_labels=include_relation_labels,
+                include_additional_labels=include_additional_labels,
+                include_obsolete=include_obsolete,
+                include_suppressible=include_suppressible,
+                page_number=page_number,
+                page_size=page_size,
+                return_indented=False,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    def iter_source_parents(
+        self,
+        source: str,
+        id: str,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all immediate parents of a source-asserted identifier, one page at a time."""
+        return self._iter_pages(
+            lambda page_number: self.get_source_parents(
+                source,
+                id,
+                return_indented=False,
+                page_number=page_number,
+                page_size=page_size,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    def iter_source_children(
+        self,
+        source: str,
+        id: str,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all immediate children of a source-asserted identifier, one page at a time."""
+        return self._iter_pages(
+            lambda page_number: self.get_source_children(
+                source,
+                id,
+                return_indented=False,
+                page_number=page_number,
+                page_size=page_size,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    def iter_source_ancestors(
+        self,
+        source: str,
+        id: str,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all ancestors of a source-asserted identifier, one page at a time."""
+        return self._iter_pages(
+            lambda page_number: self.get_source_ancestors(
+                source,
+                id,
+                return_indented=False,
+                page_number=page_number,
+                page_size=page_size,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    def iter_source_descendants(
+        self,
+        source: str,
+        id: str,
+        page_size: int = 25,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all descendants of a source-asserted identifier, one page at a time."""
+        return self._iter_pages(
+            lambda page_number: self.get_source_descendants(
+                source,
+                id,
+                return_indented=False,
+                page_number=page_number,
+                page_size=page_size,
+            ),
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    def get_all_source_children(
+        self,
+        source: str,
+        id: str,
+        page_size: int = 200,
+        max_workers: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Retrieve all immediate children of a source-asserted identifier, fetching the pages concurrently."""
+        logger.info(f"Fetching all children for: {source}/{id}")
+        return self.get_all_pages(
+            self.get_source_children,
+            source,
+            id,
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
+    def get_all_source_ancestors(
+        self,
+        source: str,
+        id: str,
+        page_size: int = 200,
+        max_workers: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Retrieve all ancestors of a source-asserted identifier, fetching the pages concurrently."""
+        logger.info(f"Fetching all ancestors for: {source}/{id}")
+        return self.get_all_pages(
+            self.get_source_ancestors,
+            source,
+            id,
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
+    def get_all_source_descendants(
+        self,
+        source: str,
+        id: str,
+        page_size: int = 200,
+        max_workers: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Retrieve all descendants of a source-asserted identifier, fetching the pages concurrently."""
+        logger.info(f"Fetching all descendants for: {source}/{id}")
+        return self.get_all_pages(
+            self.get_source_descendants,
+            source,
+            id,
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
+    def get_all_source_relations(
+        self,
+        source: str,
+        id: str,
+        include_relation_labels: Optional[str] = None,
+        include_additional_labels: Optional[str] = None,
+        include_obsolete: bool = False,
+        include_suppressible: bool = False,
+        page_size: int = 200,
+        max_workers: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Retrieve all relations of a source-asserted identifier, fetching the pages concurrently."""
+        logger.info(f"Fetching all relations for: {source}/{id}")
+        return self.get_all_pages(
+            self.get_source_relations,
+            source,
+            id,
+            include_relation_labels=include_relation_labels,
+            include_additional_labels=include_additional_labels,
+            include_obsolete=include_obsolete,
+            include_suppressible=include_suppressible,
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+
+    def build_hierarchy_snapshot(
+        self,
+        source: str,
+        roots: Union[str, Sequence[str]],
+        include_ancestors: bool = True,
+        max_nodes: Optional[int] = None,
+        page_size: int = 200,
+        max_workers: int = 8,
+        file_path: Optional[str] = None,
+    ) -> HierarchySnapshot:
+        """
+        Materialize the hierarchy below one or more root concepts into a local HierarchySnapshot.
+
+        The subtree is crawled breadth first through the `children` endpoint (every page, levels fetched
+        concurrently). With `include_ancestors` the `parents` endpoint is then crawled from every concept of
+        the subtree, so concepts keep parents outside the subtree and upward queries reach the top of the
+        source. The snapshot is marked `partial` when `max_nodes` cuts the crawl short or a lookup fails.
+
+        Args:
+            source (str): The source vocabulary, e.g. 'SNOMEDCT_US'.
+            roots (Union[str, Sequence[str]]): The root concept(s); use the source root for the whole vocabulary.
+            include_ancestors (bool): Also crawl the ancestors of every concept in the subtree (default: True).
+            max_nodes (Optional[int]): Stop expanding after this many concepts (default: None, no limit).
+            page_size (int): Number of concepts fetched per request (default: 200).
+            max_workers (int): Maximum number of requests in flight at once (default: 8).
+            file_path (Optional[str]): Save the snapshot to this file when given; load it later with
+                `HierarchySnapshot.load`.
+
+        Returns:
+            HierarchySnapshot: The snapshot.
+        """
+        if isinstance(roots, str):
+            roots = [roots]
+        getters = {
+            "children": self.get_source_children,
+            "parents": self.get_source_parents,
+        }
+        edges = []
+        names = {}
+        expanded = 0
+        partial = False
+
+        def crawl(relation: str, start: List[str]) -> List[str]:
+            """Expand `relation` breadth first from `start`, returning every concept reached."""
+            nonlocal expanded, partial
+            visited = dict.fromkeys(start)
+            frontier = list(start)
+            while frontier:
+                if max_nodes is not None and expanded + len(frontier) > max_nodes:
+                    logger.warning(
+                        f"Node limit reached, snapshot of {source} is partial"
+                    )
+                    partial = True
+                    frontier = frontier[: max(max_nodes - expanded, 0)]
+                    if not frontier:
+                        break
+                expanded += len(frontier)
+                next_frontier = []
+                for concept_id, relatives in bounded_map(
+                    lambda concept_id: self.get_all_pages(
+                        getters[relation],
+                        source,
+                        concept_id,
+                        page_size=page_size,
+                        max_workers=1,
+                    ),
+                    frontier,
+                    max_workers=max_workers,
+                ):
+                    if isinstance(relatives, Exception):
+                        logger.error(
+                            f"Failed to fetch {relation} for {source}/{concept_id}: {relatives}"
+                        )
+                        partial = True
+                        continue
+                    for relative in relatives:
+                        relative_id = relative.get("ui")
+                        if not relative_id:
+                            continue
+                        names.setdefault(relative_id, relative.get("name"))
+                        if relation == "children":
+                            edges.append((relative_id, concept_id))
+                        else:
+                            edges.append((concept_id, relative_id))
+                        if relative_id not in visited:
+                            visited[relative_id] = None
+                            next_frontier.append(relative_id)
+                logger.info(f"Crawled {expanded} {source} concepts")
+                frontier = next_frontier
+            return list(visited)
+
+        for root in roots:
+            concept = self._source_result(source, root, default={})
+            names[root] = concept.get("name")
+        subtree = crawl("children", roots)
+        if include_ancestors:
+            crawl("parents", subtree)
+
+        snapshot = HierarchySnapshot.from_edges(
+            source,
+            edges,
+            names,
+            partial=partial,
+            include_ancestors=include_ancestors,
+        )
+        if file_path is not None:
+            snapshot.save(file_path)
+        return snapshot
+
+    def is_a(
+        self, source: str, child: str, ancestor: str, include_self: bool = False
+    ) -> bool:
+        """
+        Check whether a concept is a descendant of another in a source hierarchy.
+
+        With a registered snapshot for the source the check is a lookup in its subsumption index;
+        otherwise, or when the snapshot cannot decide (see `is_a_many`), the ancestors of `child` are
+        fetched (and cached like any response).
+
+        Args:
+            source (str): The source vocabulary, e.g. 'SNOMEDCT_US'.
+            child (str): The candidate descendant.
+            ancestor (str): The candidate ancestor.
+            include_self (bool): Whether a concept counts as a descendant of itself (default: False).
+
+        Returns:
+            bool: True if `child` is below `ancestor`.
+        """
+        return self.is_a_many(source, [(child, ancestor)], include_self=include_self)[0]
+
+    def is_a_many(
+        self,
+        source: str,
+        pairs: Iterable[Tuple[str, str]],
+        include_self: bool = False,
+        max_workers: int = 8,
+    ) -> List[bool]:
+        """
+        Check many (child, ancestor) pairs in a source hierarchy.
+
+        Pairs are answered from the subsumption index of a registered snapshot where possible. Pairs
+        with a concept the snapshot lacks, and negative answers of a partial snapshot, fall back to
+        fetching the ancestors of the child.
+
+        Args:
+            source (str): The source vocabulary, e.g. 'SNOMEDCT_US'.
+            pairs (Iterable[Tuple[str, str]]): The (child, ancestor) pairs.
+            include_self (bool): Whether a concept counts as a descendant of itself (default: False).
+            max_workers (int): Maximum number of requests in flight at once without a snapshot (default: 8).
+
+        Returns:
+            List[bool]: One result per pair, in order.
+
+        Raises:
+            RuntimeError: If the ancestors of a child could not be fetched.
+        """
+        pairs = list(pairs)
+        index = self.get_subsumption_index(source)
+        if index is None:
+            results: List[Optional[bool]] = [None] * len(pairs)
+        else:
+            results = index.is_a_many(pairs, include_self=include_self)
+            if self.snapshots[source].partial:
+                # Edges missing from a partial snapshot can only turn a True into a False
+                results = [result or None for result in results]
+            if None not in results:
+                return results
+
+        pending = [k for k, result in enumerate(results) if result is None]
+        closures = {}
+        for child, ancestors in self._map_many(
+            lambda child: self.get_all_pages(
+                self.get_source_ancestors, source, child, page_size=200, max_workers=1
+            ),
+            (pairs[k][0] for k in pending),
+            max_workers=max_workers,
+        ):
+            if isinstance(ancestors, dict):
+                raise RuntimeError(
+                    f"Could not fetch the ancestors of {source}/{child}: {ancestors['error']}"
+                )
+            closures[child] = {concept.get("ui") for concept in ancestors}
+        for k in pending:
+            child, ancestor = pairs[k]
+            results[k] = ancestor in closures[child] or (
+                include_self and child == ancestor
+            )
+        return results
+
+    def concept_similarity(self, source: str, id1: str, id2: str) -> Dict[str, Any]:
+        """
+        Rank how similar two concepts are within a registered source hierarchy.
+
+        Args:
+            source (str): The source vocabulary; a snapshot must be registered for it.
+            id1 (str): The first concept.
+            id2 (str): The second concept.
+
+        Returns:
+            Dict[str, Any]: The lowest common ancestor ("lca", with "lca_name") and the path_length,
+            wu_palmer and leacock_chodorow measures (None if the concepts share no ancestor).
+        Raises:
+            ValueError: If no snapshot is registered for the source, it is partial or lacks ancestors, or it
+                lacks either concept.
+        """
+        similarity = self.get_similarity_engine(source).similarity(id1, id2)
+        similarity["lca_name"] = (
+            self.snapshots[source].name(similarity["lca"])
+            if similarity["lca"]
+            else None
+        )
+        return similarity
+
+    def concept_similarity_many(
+        self,
+        source: str,
+        pairs: Iterable[Tuple[str, str]],
+        measure: str = "wu_palmer",
+    ) -> List[Optional[float]]:
+        """
+        Score many concept pairs within a registered source hierarchy.
+
+        Args:
+            source (str): The source vocabulary; a snapshot must be registered for it.
+            pairs (Iterable[Tuple[str, str]]): The concept pairs.
+            measure (str): 'path_length', 'wu_palmer' or 'leacock_chodorow' (default: 'wu_palmer').
+
+        Returns:
+            List[Optional[float]]: One score per pair, in order (None if the concepts share no ancestor).
+        Raises:
+            ValueError: If no snapshot is registered for the source, it is partial or lacks ancestors, or it
+                lacks a concept of any pair.
+        """
+        return self.get_similarity_engine(source).score_many(pairs, measure=measure)
+
     def get_concept_pathways(
         self,
         source,
@@ -413,67 +1027,85 @@ class SourceAPI(UMLSAPIBase):
         return_indented=True,
         save_to_file: bool = False,
         file_path: str = None,
+        max_workers: int = 8,
+        max_nodes: Optional[int] = None,
+        max_requests: Optional[int] = None,
+        snapshot: Optional[HierarchySnapshot] = None,
     ) -> Union[str, Dict[str, Any]]:
         """
         Retrieve full parent-child pathways from the root to the concept and its descendants iteratively.
 
+        The hierarchy is explored breadth first, one level at a time; the parents and children of all
+        concepts on a level are fetched concurrently and every concept is fetched only once.
+
         Parameters:
             - source: The source vocabulary (e.g., SNOMEDCT_US, LOINC)
             - id: The concept ID for which to fetch the pathways
             - max_depth: The maximum depth to explore (default is 2)
+            - max_workers: Maximum number of requests in flight at once (default is 8)
+            - max_nodes: Stop after fetching this many concepts (default is None, no limit)
+            - max_requests: Stop before issuing more than this many requests (default is None, no limit)
+            - snapshot: Answer from this local HierarchySnapshot instead of the network (default is None)
         """
-
-        def fetch_parents_children(concept_id, pathways, cache):
-            """Fetch parents and children for a concept and store them in cache."""
-            # Check if we have already fetched this concept
-            if concept_id in cache:
-                return cache[concept_id]
-
-            # Fetch parents and children using the source API methods
-            parents_response = self.get_source_parents(source, concept_id)
-            children_response = self.get_source_children(source, concept_id)
-            parents = json.loads(parents_response).get("result", [])
-            children = json.loads(children_response).get("result", [])
-
-            # Cache the results to avoid redundant API calls
-            cache[concept_id] = {"parents": parents, "children": children}
-            logger.info(f"Cache updated: {cache}")
-
-            # Add to pathways
-            if parents:
-                pathways.setdefault(f"concept_{concept_id}_parents", []).extend(
-                    [parent.get("name") for parent in parents]
-                )
-            if children:
-                pathways.setdefault(f"concept_{concept_id}_children", []).extend(
-                    [child.get("name") for child in children]
-                )
-
-            return cache[concept_id]
-
-        # Initialize structures
-        cache = {}
         pathways = {}
-        queue = [(id, 0)]  # (concept_id, depth)
-
-        # Process concepts iteratively using a queue (Breadth-First Search)
-        while queue:
-            concept_id, depth = queue.pop(0)  # Dequeue the first element
-
-            if depth > max_depth:
-                logger.info(f"Reached maximum depth for concept: {concept_id}")
-                continue
-
-            # Fetch the parents and children
-            concept_data = fetch_parents_children(concept_id, pathways, cache)
-            parents = concept_data["parents"]
-            children = concept_data["children"]
-
-            # Enqueue parents and children for further exploration
-            for parent in parents:
-                queue.append((parent.get("ui"), depth + 1))
-            for child in children:
-                queue.append((child.get("ui"), depth + 1))
+        visited = {id}
+        frontier = [id]
+        nodes = 0
+        requests_issued = 0
+
+        for depth in range(max_depth + 1):
+            if not frontier:
+                break
+
+            # Trim the level to the remaining budget; every concept costs two requests
+            budget = len(frontier)
+            if max_nodes is not None:
+                budget = min(budget, max_nodes - nodes)
+            if max_requests is not None:
+                budget = min(budget, (max_requests - requests_issued) // 2)
+            if budget < len(frontier):
+                logger.warning(
+                    f"Node or request limit reached at depth {depth}, "
+                    f"skipping {len(frontier) - budget} concepts"
+                )
+                frontier = frontier[: max(budget, 0)]
+            if not frontier:
+                break
+
+            logger.info(f"Expanding {len(frontier)} concepts at depth {depth}")
+            relatives = self._fetch_relatives(
+                source,
+                frontier,
+                ("parents", "children"),
+                max_workers=max_workers,
+                snapshot=snapshot,
+            )
+            nodes += len(frontier)
+            if snapshot is None:
+                requests_issued += len(relatives)
+
+            next_frontier = []
+            for concept_id in frontier:
+                parents = relatives[concept_id, "parents"]
+                children = relatives[concept_id, "children"]
+                if parents:
+                    pathways[f"concept_{concept_id}_parents"] = [
+                        parent.get("name") for parent in parents
+                    ]
+                if children:
+                    pathways[f"concept_{concept_id}_children"] = [
+                        child.get("name") for child in children
+                    ]
+                for relative in parents + children:
+                    relative_id = relative.get("ui")
+                    if relative_id and relative_id not in visited:
+                        visited.add(relative_id)
+                        next_frontier.append(relative_id)
+            frontier = next_frontier
+
+        logger.info(
+            f"Explored {nodes} concepts with {requests_issued} requests for: {source}/{id}"
+        )
 
         if save_to_file:
             if file_path == None:
@@ -487,7 +1119,7 @@ class SourceAPI(UMLSAPIBase):
         if return_indented:
             return json.dumps(pathways, indent=4)
         else:
-            pathways
+            return pathways
 
     def get_related_concepts_by_relation_type(
         self,
@@ -500,16 +1132,20 @@ class SourceAPI(UMLSAPIBase):
     ):
         """Retrieve related concepts based on the specified relationship type."""
         # Step 1: Fetch the source concept
-        concept_response = self.get_source_concept(source, id)
+        concept = self._source_result(source, id, default={})
 
         # Step 2: Check if 'relations' is an endpoint URL
-        relations_url = (
-            json.loads(concept_response).get("result", {}).get("relations", "")
-        )
+        relations_url = concept.get("relations", "")
         if isinstance(relations_url, str) and relations_url.startswith("http"):
             # If it's a URL, make a second request to fetch relations
-            relations_response = self.get_relations_by_url(relations_url)
-            relations = json.loads(relations_response).get("result", [])
+            relations_response = self._fetch(
+                relations_url, params={"apiKey": self.api_key}
+            )
+            relations = (
+                relations_response.get("result", [])
+                if isinstance(relations_response, dict)
+                else []
+            )
         else:
             logger.warning(f"No valid relations endpoint found for concept: {id}")
             return {relation_type: []}
@@ -550,13 +1186,12 @@ class SourceAPI(UMLSAPIBase):
         if return_indented:
             return json.dumps({relation_type: related_concepts}, indent=4)
         else:
-            {relation_type: related_concepts}
+            return {relation_type: related_concepts}
 
     # https://www.nlm.nih.gov/research/umls/knowledge_sources/metathesaurus/release/attribute_names.html
     def get_concept_attributes(self, source: str, id: str) -> dict:
         """Retrieve specific attributes of a source-asserted concept."""
-        attributes_response = self.get_source_attributes(source, id)
-        attributes = json.loads(attributes_response).get("result", [])
+        attributes = self._source_result(source, id, "attributes", [])
         attribute_dict = {
             attribute.get("name"): attribute.get("value")
             for attribute in attributes
@@ -574,54 +1209,41 @@ class SourceAPI(UMLSAPIBase):
         file_path: str = None,
     ):
         """Compare two concepts by examining their relationships, ancestors, and descendants."""
-        concept_1_ancestors = json.loads(self.get_source_ancestors(source, id1)).get(
-            "result", []
-        )
-        concept_2_ancestors = json.loads(self.get_source_ancestors(source, id2)).get(
-            "result", []
+        closures = self._fetch_relatives(
+            source, [id1, id2], ("ancestors", "descendants"), max_workers=4
         )
-        concept_1_descendants = json.loads(
-            self.get_source_descendants(source, id1)
-        ).get("result", [])
-        concept_2_descendants = json.loads(
-            self.get_source_descendants(source, id2)
-        ).get("result", [])
+
+        def names(concepts, other, shared):
+            """Names of the concepts whose `ui` is (or is not) in the other concept's closure."""
+            other_ids = {concept.get("ui") for concept in other}
+            return [
+                concept.get("name")
+                for concept in concepts
+                if (concept.get("ui") in other_ids) == shared
+            ]
+
+        concept_1_ancestors = closures[id1, "ancestors"]
+        concept_2_ancestors = closures[id2, "ancestors"]
+        concept_1_descendants = closures[id1, "descendants"]
+        concept_2_descendants = closures[id2, "descendants"]
         comparison = {
             "concept_1": id1,
             "concept_2": id2,
-            "shared_ancestors": [
-                ancestor.get("name")
-                for ancestor in concept_1_ancestors
-                if ancestor in concept_2_ancestors
-            ],
-            "shared_descendants": [
-                descendant.get("name")
-                for descendant in concept_1_descendants
-                if descendant in concept_2_descendants
-            ],
+            "shared_ancestors": names(concept_1_ancestors, concept_2_ancestors, True),
+            "shared_descendants": names(
+                concept_1_descendants, concept_2_descendants, True
+            ),
             "unique_to_concept_1": {
-                "ancestors": [
-                    ancestor.get("name")
-                    for ancestor in concept_1_ancestors
-                    if ancestor not in concept_2_ancestors
-                ],
-                "descendants": [
-                    descendant.get("name")
-                    for descendant in concept_1_descendants
-                    if descendant not in concept_2_descendants
-                ],
+                "ancestors": names(concept_1_ancestors, concept_2_ancestors, False),
+                "descendants": names(
+                    concept_1_descendants, concept_2_descendants, False
+                ),
             },
             "unique_to_concept_2": {
-                "ancestors": [
-                    ancestor.get("name")
-                    for ancestor in concept_2_ancestors
-                    if ancestor not in concept_1_ancestors
-                ],
-                "descendants": [
-                    descendant.get("name")
-                    for descendant in concept_2_descendants
-                    if descendant not in concept_1_descendants
-                ],
+                "ancestors": names(concept_2_ancestors, concept_1_ancestors, False),
+                "descendants": names(
+                    concept_2_descendants, concept_1_descendants, False
+                ),
             },
         }
 
@@ -637,7 +1259,99 @@ class SourceAPI(UMLSAPIBase):
         if return_indented:
             return json.dumps(comparison, indent=4)
         else:
-            comparison
+            return comparison
+
+    def compare_concepts_many(
+        self,
+        source: str,
+        ids: List[str],
+        include_names: bool = False,
+        page_size: int = 200,
+        max_workers: int = 8,
+        return_indented: bool = True,
+        save_to_file: bool = False,
+        file_path: str = None,
+    ) -> Union[str, Dict[str, Any]]:
+        """
+        Compare N concepts pairwise by their full ancestor and descendant closures.
+
+        The closures are fetched concurrently (every page) and compared by `ui` with set operations.
+        For each of "ancestors" and "descendants" the result holds two N x N matrices in the order of
+        "concepts": "shared"[i][j] covers the concepts in both closures of i and j (the diagonal is the
+        closure itself), and "unique"[i][j] the concepts only in the closure of i.
+
+        Args:
+            source (str): The source vocabulary.
+            ids (List[str]): The concepts to compare; repeated identifiers are compared once.
+            include_names (bool): Fill the matrices with sorted concept names instead of counts (default: False).
+            page_size (int): Number of concepts fetched per request (default: 200).
+            max_workers (int): Maximum number of requests in flight at once (default: 8).
+            return_indented (bool): Whether to return indented JSON output (default: True).
+            save_to_file (bool): Whether to save the output to a file (default: False).
+            file_path (str): Directory to save the output file in.
+
+        Returns:
+            str | dict: The comparison in indented JSON format or as a dictionary, depending on `return_indented`.
+
+        Raises:
+            RuntimeError: If a closure could not be fetched.
+        """
+        ids = list(dict.fromkeys(ids))
+        getters = {
+            "ancestors": self.get_source_ancestors,
+            "descendants": self.get_source_descendants,
+        }
+        lookups = [(concept_id, relation) for concept_id in ids for relation in getters]
+
+        closures = {}
+        concept_names = {}
+        for (concept_id, relation), concepts in bounded_map(
+            lambda lookup: self.get_all_pages(
+                getters[lookup[1]],
+                source,
+                lookup[0],
+                page_size=page_size,
+                max_workers=1,
+            ),
+            lookups,
+            max_workers=max_workers,
+        ):
+            if isinstance(concepts, Exception):
+                raise RuntimeError(
+                    f"Could not fetch the {relation} of {source}/{concept_id}: {concepts}"
+                ) from concepts
+            closures[concept_id, relation] = {
+                concept.get("ui") for concept in concepts if concept.get("ui")
+            }
+            for concept in concepts:
+                concept_names.setdefault(concept.get("ui"), concept.get("name"))
+
+        def cell(members):
+            if include_names:
+                return sorted(str(concept_names.get(member)) for member in members)
+            return len(members)
+
+        comparison = {"concepts": ids}
+        for relation in getters:
+            sets = [closures[concept_id, relation] for concept_id in ids]
+            comparison[relation] = {
+                "shared": [[cell(row & column) for column in sets] for row in sets],
+                "unique": [[cell(row - column) for column in sets] for row in sets],
+            }
+        logger.info(f"Compared {len(ids)} concepts pairwise in {source}")
+
+        if save_to_file:
+            file_name = f"compare_concepts_many_{source}_{len(ids)}.txt"
+            if file_path == None:
+                file_path = file_name
+            else:
+                file_path = os.path.join(file_path, file_name)
+            save_output_to_file(response=comparison, file_path=file_path)
+
+        if return_indented:
+            return json.dumps(comparison, indent=4)
+        else:
+            return comparison
 
     def get_concept_coverage(
         self,
@@ -648,10 +1362,8 @@ class SourceAPI(UMLSAPIBase):
         file_path: str = None,
     ) -> dict:
         """Check in which medical systems the concept is present."""
-        concept_response = self.get_source_concept(source, id)
-        source_systems = (
-            json.loads(concept_response).get("result", {}).get("rootSource", [])
-        )
+        concept = self._source_result(source, id, default={})
+        source_systems = concept.get("rootSource", [])
 
         if save_to_file:
             if file_path == None:
@@ -670,36 +1382,99 @@ class SourceAPI(UMLSAPIBase):
                 {"concept_id": id, "covered_in_sources": source_systems}, indent=4
             )
         else:
-            {"concept_id": id, "covered_in_sources": source_systems}
+            return {"concept_id": id, "covered_in_sources": source_systems}
+
+    def iter_children_attributes(
+        self,
+        source: str,
+        id: str,
+        attribute_names: Union[str, Sequence[str]],
+        page_size: int = 200,
+        max_workers: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Stream every child of a concept together with the requested attribute values.
+
+        Children are paged in lazily and their attributes are fetched concurrently, so very wide
+        parents are processed in constant memory.
+
+        Args:
+            source (str): The source vocabulary.
+            id (str): The parent concept.
+            attribute_names (Union[str, Sequence[str]]): One or more attribute names, e.g. 'ACTIVE'.
+            page_size (int): Number of children fetched per request (default: 200).
+            max_workers (int): Maximum number of attribute requests in flight at once (default: 8).
+            ordered (bool): Yield children in hierarchy order (True) or as soon as their attributes arrive (False).
+
+        Yields:
+            Tuple[Dict[str, Any], Dict[str, Any]]: Each child and its values of the requested attributes
+            ("Unknown" when the child does not have the attribute).
+        """
+        if isinstance(attribute_names, str):
+            attribute_names = [attribute_names]
+
+        for child, child_attributes in bounded_map(
+            lambda child: self.get_concept_attributes(source, child.get("ui")),
+            self.iter_source_children(source, id, page_size=page_size),
+            max_workers=max_workers,
+            ordered=ordered,
+        ):
+            if isinstance(child_attributes, Exception):
+                logger.error(
+                    f"Failed to fetch attributes of {source}/{child.get('ui')}: {child_attributes}"
+                )
+                child_attributes = {}
+
+            # Log the attributes of the child for user awareness
+            logger.info(
+                f"Child ID: {child.get('ui')}, Available Attributes: {child_attributes}"
+            )
+            yield child, {
+                attribute_name: child_attributes.get(attribute_name, "Unknown")
+                for attribute_name in attribute_names
+            }
 
     def aggregate_children_by_attribute(
         self,
         source: str,
         id: str,
-        attribute_name: str,
+        attribute_name: Union[str, Sequence[str]],
         return_indented: bool = True,
         save_to_file: bool = False,
         file_path: str = None,
+        page_size: int = 200,
+        max_workers: int = 8,
     ):
-        """Aggregate children of a concept based on a specific attribute."""
-        children_response = self.get_source_children(source, id)
-        children = json.loads(children_response).get("result", [])
-        attribute_aggregation = {}
-
-        for child in children:
-            child_id = child.get("ui")
-            child_attributes = self.get_concept_attributes(source, child_id)
+        """
+        Aggregate children of a concept based on a specific attribute.
 
-            # Log the attributes of the child for user awareness
-            logger.info(
-                f"Child ID: {child_id}, Available Attributes: {child_attributes}"
-            )
+        All pages of children are read and their attributes are fetched concurrently. With a single
+        attribute name the result maps each value to the child names; with a list of names it maps
+        each attribute name to such a grouping, built in the same pass.
+        """
+        attribute_names = (
+            [attribute_name] if isinstance(attribute_name, str) else attribute_name
+        )
+        aggregations = {name: {} for name in attribute_names}
+
+        for child, values in self.iter_children_attributes(
+            source,
+            id,
+            attribute_names,
+            page_size=page_size,
+            max_workers=max_workers,
+        ):
+            for name, attribute_value in values.items():
+                aggregations[name].setdefault(attribute_value, []).append(
+                    child.get("name")
+                )
 
-            # Check if the requested attribute exists, otherwise use "Unknown"
-            attribute_value = child_attributes.get(attribute_name, "Unknown")
-            attribute_aggregation.setdefault(attribute_value, []).append(
-                child.get("name")
-            )
+        attribute_aggregation = (
+            aggregations[attribute_name]
+            if isinstance(attribute_name, str)
+            else aggregations
+        )
 
         if save_to_file:
             if file_path == None:
@@ -724,44 +1499,63 @@ class SourceAPI(UMLSAPIBase):
         return_indented: bool = True,
         save_to_file: bool = False,
         file_path: str = None,
+        max_workers: int = 8,
+        include_stats: bool = False,
+        snapshot: Optional[HierarchySnapshot] = None,
     ):
-        """Retrieve a family tree structure with relationships organized in a hierarchy of ancestors and descendants."""
+        """
+        Retrieve a family tree structure with relationships organized in a hierarchy of ancestors and descendants.
 
-        def fetch_ancestors(concept_id, hierarchy, depth=0):
-            """Recursively fetch ancestors and add them to the family tree."""
-            if depth >= max_depth:
-                return
-            response = self.get_source_parents(source, concept_id)
-            parents = json.loads(response).get("result", [])
-            if not parents:
-                logger.info(f"No more parents found for: {concept_id}")
-                return
-            for parent in parents:
-                parent_name = parent.get("name")
-                parent_id = parent.get("ui")
-                if parent_name:
-                    hierarchy.setdefault(f"level_{depth}_parents", []).append(
-                        parent_name
+        The hierarchy is treated as a DAG: the parents (or children) of every concept are fetched once,
+        concurrently for all concepts on a level, and ancestors shared by several paths reuse that result.
+        Set `include_stats` to add the number of hierarchy lookups under "lookup_count" (lookups answered
+        by the response caches are included), and pass a `snapshot` to build the tree from a local
+        HierarchySnapshot without any requests.
+        """
+        lookups = 1 if snapshot is None else 0
+
+        def fetch_levels(endpoint):
+            """Fetch `endpoint` once for every concept reachable within `max_depth` levels."""
+            nonlocal lookups
+            relatives_of = {None: []}
+            level = [id]
+            for depth in range(max_depth):
+                pending = [
+                    concept_id for concept_id in level if concept_id not in relatives_of
+                ]
+                if pending:
+                    fetched = self._fetch_relatives(
+                        source,
+                        pending,
+                        (endpoint,),
+                        max_workers=max_workers,
+                        snapshot=snapshot,
                     )
-                    fetch_ancestors(parent_id, hierarchy, depth + 1)
-
-        def fetch_descendants(concept_id, hierarchy, depth=0):
-            """Recursively fetch descendants and add them to the family tree."""
+                    if snapshot is None:
+                        lookups += len(fetched)
+                    for (concept_id, _), relatives in fetched.items():
+                        if not relatives:
+                            logger.info(f"No more {endpoint} found for: {concept_id}")
+                        relatives_of[concept_id] = relatives
+                next_level = {}
+                for concept_id in level:
+                    for relative in relatives_of[concept_id]:
+                        if relative.get("name"):
+                            next_level[relative.get("ui")] = None
+                level = list(next_level)
+            return relatives_of
+
+        def build(relatives_of, key, concept_id, hierarchy, depth=0):
+            """Add the relatives of every path to the family tree, level by level."""
             if depth >= max_depth:
                 return
-            response = self.get_source_children(source, concept_id)
-            children = json.loads(response).get("result", [])
-            if not children:
-                logger.info(f"No more children found for: {concept_id}")
-                return
-            for child in children:
-                child_name = child.get("name")
-                child_id = child.get("ui")
-                if child_name:
-                    hierarchy.setdefault(f"level_{depth}_children", []).append(
-                        child_name
+            for relative in relatives_of.get(concept_id, []):
+                relative_name = relative.get("name")
+                if relative_name:
+                    hierarchy.setdefault(f"level_{depth}_{key}", []).append(
+                        relative_name
                     )
-                    fetch_descendants(child_id, hierarchy, depth + 1)
+                    build(relatives_of, key, relative.get("ui"), hierarchy, depth + 1)
 
         # Initialize family tree structure
         family_tree = {
@@ -772,14 +1566,19 @@ class SourceAPI(UMLSAPIBase):
         }
 
         # Fetch source concept details to get the name
-        source_concept = self.get_source_concept(source, id)
-        family_tree["concept_name"] = (
-            json.loads(source_concept).get("result", {}).get("name", "Unknown Concept")
-        )
+        if snapshot is not None:
+            self._check_snapshot(source, snapshot)
+            source_concept = {"name": snapshot.name(id)} if id in snapshot else {}
+        else:
+            source_concept = self._source_result(source, id, default={})
+        family_tree["concept_name"] = source_concept.get("name", "Unknown Concept")
 
         # Fetch ancestors and descendants in family tree structure
-        fetch_ancestors(id, family_tree["ancestors"])
-        fetch_descendants(id, family_tree["descendants"])
+        build(fetch_levels("parents"), "parents", id, family_tree["ancestors"])
+        build(fetch_levels("children"), "children", id, family_tree["descendants"])
+        logger.info(f"Built family tree of {source}/{id} with {lookups} lookups")
+        if include_stats:
+            family_tree["lookup_count"] = lookups
 
         if save_to_file:
             if file_path == None:
@@ -801,67 +1600,82 @@ class SourceAPI(UMLSAPIBase):
         return_indented: bool = True,
         save_to_file: bool = False,
         file_path: str = None,
+        include_edges: bool = False,
+        page_size: int = 200,
+        max_workers: int = 8,
+        snapshot: Optional[HierarchySnapshot] = None,
     ) -> str | Dict[str, Any]:
-        """Recursively retrieve all ancestors and descendants until root/leaf, with logging.
+        """Retrieve all ancestors and descendants until root/leaf, with logging.
+
+        The transitive `ancestors` and `descendants` endpoints already return the whole closure, so each
+        is paginated once (pages fetched concurrently) and deduplicated by `ui`. Parents are only
+        fetched when `include_edges` asks for the hierarchy edges within the closure.
 
         Args:
             source (str): The source vocabulary from which to retrieve data.
             id (str): The concept identifier.
-            depth (int): The depth for recursion (default: 0).
+            depth (int): The depth reported in the log messages (default: 0).
             return_indented (bool): Whether to return indented JSON output (default: True).
             save_to_file (bool): Whether to save the output to a file (default: False).
             file_path (str): The file path to save the output if `save_to_file` is True (default: 'family_tree_output.txt').
+            include_edges (bool): Whether to add the [child, parent] edges of both closures under "edges" (default: False).
+            page_size (int): Number of concepts fetched per request (default: 200).
+            max_workers (int): Maximum number of requests in flight at once (default: 8).
+            snapshot (Optional[HierarchySnapshot]): Answer from this local snapshot instead of the network (default: None).
 
         Returns:
             str | dict: The full hierarchy in indented JSON format or as a dictionary, depending on `return_indented`.
         """
 
-        def fetch_ancestors_recursive(
-            concept_id: str, hierarchy: Dict[str, Any], depth: int = 0
-        ) -> None:
-            """Recursively fetch ancestors."""
-            logger.info(
-                f"Fetching ancestors at depth {depth} for concept: {concept_id}"
-            )
-            response = self.get_source_ancestors(source, concept_id)
-            ancestors = json.loads(response).get("result", [])
-            if not ancestors:
-                logger.info(f"No more ancestors found for: {concept_id}")
-                return
-            for ancestor in ancestors:
-                ancestor_id = ancestor.get("ui")
-                if ancestor_id and ancestor_id not in [
-                    a.get("ui") for a in hierarchy["ancestors"]
-                ]:
-                    hierarchy["ancestors"].append(ancestor)
-                    fetch_ancestors_recursive(ancestor_id, hierarchy, depth + 1)
-
-        def fetch_descendants_recursive(
-            concept_id: str, hierarchy: Dict[str, Any], depth: int = 0
-        ) -> None:
-            """Recursively fetch descendants."""
-            logger.info(
-                f"Fetching descendants at depth {depth} for concept: {concept_id}"
+        def fetch_closure(getter, relation: str) -> List[Dict[str, Any]]:
+            """Fetch every page of a transitive endpoint, keeping the first entry of each `ui`."""
+            logger.info(f"Fetching {relation} at depth {depth} for concept: {id}")
+            if snapshot is not None:
+                self._check_snapshot(source, snapshot)
+                concepts = snapshot.relatives(id, relation)
+            else:
+                concepts = self.get_all_pages(
+                    getter, source, id, page_size=page_size, max_workers=max_workers
+                )
+            seen = set()
+            closure = []
+            for concept in concepts:
+                concept_id = concept.get("ui")
+                if concept_id and concept_id not in seen:
+                    seen.add(concept_id)
+                    closure.append(concept)
+            if not closure:
+                logger.info(f"No more {relation} found for: {id}")
+            return closure
+
+        def fetch_edges(closure: List[Dict[str, Any]]) -> List[List[str]]:
+            """Reconstruct the [child, parent] edges between the concept and its closure."""
+            members = {id} | {concept["ui"] for concept in closure}
+            parents = self._fetch_relatives(
+                source,
+                list(members),
+                ("parents",),
+                max_workers=max_workers,
+                snapshot=snapshot,
             )
-            response = self.get_source_descendants(source, concept_id)
-            descendants = json.loads(response).get("result", [])
-            if not descendants:
-                logger.info(f"No more descendants found for: {concept_id}")
-                return
-            for descendant in descendants:
-                descendant_id = descendant.get("ui")
-                if descendant_id and descendant_id not in [
-                    d.get("ui") for d in hierarchy["descendants"]
-                ]:
-                    hierarchy["descendants"].append(descendant)
-                    fetch_descendants_recursive(descendant_id, hierarchy, depth + 1)
+            return [
+                [concept_id, parent["ui"]]
+                for concept_id in [id] + [concept["ui"] for concept in closure]
+                for parent in parents[concept_id, "parents"]
+                if parent.get("ui") in members
+            ]
 
         # Initialize hierarchy structure
-        hierarchy = {"concept_id": id, "ancestors": [], "descendants": []}
-
-        # Recursively fetch ancestors and descendants with logging
-        fetch_ancestors_recursive(id, hierarchy, depth=depth)
-        fetch_descendants_recursive(id, hierarchy, depth=depth)
+        hierarchy = {
+            "concept_id": id,
+            "ancestors": fetch_closure(self.get_source_ancestors, "ancestors"),
+            "descendants": fetch_closure(self.get_source_descendants, "descendants"),
+        }
+        if include_edges:
+            hierarchy["edges"] = {
+                "ancestors": fetch_edges(hierarchy["ancestors"]),
+                "descendants": fetch_edges(hierarchy["descendants"]),
+            }
 
         # Save to file if required
         if save_to_file:
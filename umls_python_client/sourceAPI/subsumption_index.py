@@ -0,0 +1,160 @@
+import logging
+from array import array
+from bisect import bisect_right
+from typing import Iterable, List, Optional, Tuple
+
+from umls_python_client.sourceAPI.hierarchy_snapshot import HierarchySnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class SubsumptionIndex:
+    """
+    Precomputed is-a index over a HierarchySnapshot, answering subsumption in O(log k) time.
+
+    Every concept is numbered in post-order over a depth-first spanning tree of the hierarchy, so
+    the descendants of a concept within the tree form one contiguous interval of numbers. In a
+    polyhierarchy a concept also reaches descendants through its other parents' edges; those are
+    covered by merging the intervals of all children into a short sorted interval list per
+    concept. A concept `x` is then below `y` exactly when the number of `x` falls into one of the
+    intervals of `y`, which is a binary search.
+
+    Attributes:
+        source (str): The source vocabulary of the indexed hierarchy.
+    """
+
+    def __init__(self, snapshot: HierarchySnapshot):
+        """
+        Build the index from a snapshot.
+
+        Args:
+            snapshot (HierarchySnapshot): The hierarchy to index.
+        """
+        self.source = snapshot.source
+        self._index = {concept_id: i for i, concept_id in enumerate(snapshot)}
+        count = len(self._index)
+        parent_offsets, _ = snapshot.adjacency("parent")
+        child_offsets, child_index = snapshot.adjacency("child")
+
+        # Iterative DFS from the roots; concepts left over (only possible with cycles) start new trees
+        post = array("i", [-1]) * count
+        low = array("i", [0]) * count
+        order = []
+        started = bytearray(count)
+        roots = [i for i in range(count) if parent_offsets[i] == parent_offsets[i + 1]]
+        for root in roots + list(range(count)):
+            if started[root]:
+                continue
+            started[root] = 1
+            low[root] = len(order)
+            stack = [(root, child_offsets[root])]
+            while stack:
+                node, position = stack[-1]
+                if position < child_offsets[node + 1]:
+                    stack[-1] = (node, position + 1)
+                    child = child_index[position]
+                    if not started[child]:
+                        started[child] = 1
+                        low[child] = len(order)
+                        stack.append((child, child_offsets[child]))
+                else:
+                    stack.pop()
+                    post[node] = len(order)
+                    order.append(node)
+
+        # Post-order visits children before parents, so child intervals are final when merged
+        intervals: List[List[Tuple[int, int]]] = [[] for _ in range(count)]
+        for node in order:
+            spans = [(low[node], post[node])]
+            for position in range(child_offsets[node], child_offsets[node + 1]):
+                spans.extend(intervals[child_index[position]])
+            spans.sort()
+            merged = [spans[0]]
+            for start, end in spans[1:]:
+                if start <= merged[-1][1] + 1:
+                    if end > merged[-1][1]:
+                        merged[-1] = (merged[-1][0], end)
+                else:
+                    merged.append((start, end))
+            intervals[node] = merged
+
+        self._post = post
+        self._offsets = array("q", [0])
+        self._starts = array("i")
+        self._ends = array("i")
+        for node in range(count):
+            for start, end in intervals[node]:
+                self._starts.append(start)
+                self._ends.append(end)
+            self._offsets.append(len(self._starts))
+        logger.info(
+            f"Built {self.source} subsumption index over {count} concepts "
+            f"with {len(self._starts)} intervals"
+        )
+
+    def __contains__(self, concept_id: str) -> bool:
+        return concept_id in self._index
+
+    def _subsumes(self, ancestor: int, child: int) -> bool:
+        number = self._post[child]
+        first = self._offsets[ancestor]
+        j = bisect_right(self._starts, number, first, self._offsets[ancestor + 1]) - 1
+        return j >= first and self._ends[j] >= number
+
+    def is_a(self, child: str, ancestor: str, include_self: bool = False) -> bool:
+        """
+        Check whether a concept is a descendant of another.
+
+        Args:
+            child (str): The candidate descendant.
+            ancestor (str): The candidate ancestor.
+            include_self (bool): Whether a concept counts as a descendant of itself (default: False).
+
+        Returns:
+            bool: True if `child` is below `ancestor`.
+        Raises:
+            ValueError: If either concept is not in the indexed snapshot.
+        """
+        child_index = self._index.get(child)
+        ancestor_index = self._index.get(ancestor)
+        if child_index is None or ancestor_index is None:
+            unknown = child if child_index is None else ancestor
+            raise ValueError(f"{unknown} is not in the {self.source} snapshot.")
+        if child_index == ancestor_index:
+            return include_self
+        return self._subsumes(ancestor_index, child_index)
+
+    def is_a_many(
+        self, pairs: Iterable[Tuple[str, str]], include_self: bool = False
+    ) -> List[Optional[bool]]:
+        """
+        Check many (child, ancestor) pairs.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): The (child, ancestor) pairs.
+            include_self (bool): Whether a concept counts as a descendant of itself (default: False).
+
+        Returns:
+            List[Optional[bool]]: One result per pair, in order; None where a concept is not in the
+            indexed snapshot, so the index cannot decide.
+        """
+        index = self._index.get
+        post = self._post
+        offsets = self._offsets
+        starts = self._starts
+        ends = self._ends
+        results = []
+        append = results.append
+        for child, ancestor in pairs:
+            child_index = index(child)
+            ancestor_index = index(ancestor)
+            if child_index is None or ancestor_index is None:
+                append(None)
+            elif child_index == ancestor_index:
+                append(include_self)
+            else:
+                number = post[child_index]
+                first = offsets[ancestor_index]
+                j = bisect_right(starts, number, first, offsets[ancestor_index + 1]) - 1
+                append(j >= first and ends[j] >= number)
+        return results
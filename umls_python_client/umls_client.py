@@ -1,12 +1,26 @@
 import logging
+import os
+from typing import Dict, Optional
 
+from umls_python_client.baseAPI.release_resolver import ReleaseResolver
+from umls_python_client.baseAPI.session_pool import SessionPool
 from umls_python_client.crosswalkAPI.crosswalk_api import CrosswalkAPI
 from umls_python_client.cuiAPI.cui_api import CUIAPI
+from umls_python_client.localAPI.fuzzy_index import FuzzyIndex
+from umls_python_client.localAPI.local_backend import LocalBackend
+from umls_python_client.localAPI.rrf_store import RRFStore
+from umls_python_client.localAPI.string_index import StringIndex
 from umls_python_client.searchAPI.search_api import SearchAPI
 from umls_python_client.semanticNetworkAPI.semantic_network_api import (
     SemanticNetworkAPI,
 )
 from umls_python_client.sourceAPI.source_api import SourceAPI
+from umls_python_client.utils.cache import MemoryCache, SQLiteCache
+from umls_python_client.utils.rate_limiter import (
+    AIMDController,
+    RetryPolicy,
+    TokenBucket,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -24,26 +38,231 @@ class UMLSClient:
     - Semantic Network
     - Crosswalk APIs
 
-    This class organizes the APIs into namespaces for easy access.
+    This class organizes the APIs into namespaces for easy access. All namespaces share one
+    thread-safe pool of keep-alive connections, so a single client can serve a worker pool.
+    The pool also holds one rate limiter and retry policy, so every namespace and thread of the
+    client stays within the same request budget.
+
+    Given `rrf_path`, the client answers every request from local Metathesaurus release files
+    instead of UTS, with the same method signatures and result shapes.
     """
 
-    def __init__(self, api_key: str, version: str = "current"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        version: str = "current",
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = True,
+        keep_alive: bool = True,
+        gzip: bool = True,
+        timeout: Optional[float] = None,
+        requests_per_second: Optional[float] = 20.0,
+        burst: Optional[float] = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        cache_max_bytes: Optional[int] = None,
+        memory_cache_entries: Optional[int] = 1024,
+        memory_cache_bytes: Optional[int] = None,
+        memory_cache_ttl: Optional[float] = None,
+        resolve_current: bool = True,
+        adaptive_concurrency: bool = False,
+        rrf_path: Optional[str] = None,
+        rrf_store_path: Optional[str] = None,
+        rrf_index_dir: Optional[str] = None,
+        rrf_fuzzy_index: bool = False,
+    ):
         """
         Initialize the UMLSClient with the provided API key and version.
         Each API is accessible via its own namespace, like sourceAPI, searchAPI, cuiAPI.
 
         Args:
-            api_key (str): UMLS API key required for authentication.
+            api_key (Optional[str]): UMLS API key required for authentication (not needed with `rrf_path`).
             version (str): UMLS version to use for API calls (default is "current").
+            pool_connections (int): Number of per-host connection pools to cache (default is 10).
+            pool_maxsize (int): Maximum number of connections kept alive per host (default is 10).
+            pool_block (bool): Block when all connections to a host are busy (default is True).
+            keep_alive (bool): Reuse connections between requests (default is True).
+            gzip (bool): Request gzip/deflate compressed responses (default is True).
+            timeout (Optional[float]): Request timeout in seconds (default is None).
+            requests_per_second (Optional[float]): Client-wide request rate limit, None to disable (default is 20).
+            burst (Optional[float]): Number of requests allowed in a burst (default is `requests_per_second`).
+            max_retries (int): Retries for throttled (429) and failed (5xx) requests (default is 3).
+            backoff_factor (float): Base delay in seconds of the exponential backoff (default is 0.5).
+            cache_path (Optional[str]): SQLite file used to cache parsed responses on disk, None to disable (default is None).
+            cache_ttl (Optional[float]): Time to live of cached responses in seconds (default is None, never expire).
+            cache_max_bytes (Optional[int]): Size limit of the disk cache, evicting least recently used entries (default is None).
+            memory_cache_entries (Optional[int]): Entry limit of the in-process LRU cache, 0 to disable (default is 1024).
+            memory_cache_bytes (Optional[int]): Approximate size limit of the in-process cache in bytes (default is None).
+            memory_cache_ttl (Optional[float]): Time to live of in-process cached responses in seconds (default is None).
+            resolve_current (bool): Resolve version "current" to the concrete current release once and use it in
+                URLs and cache keys; cached responses of a superseded release are invalidated (default is True).
+                While the release service is unreachable the lookup is retried at most once a minute, and
+                the request that triggers a retry waits for it (up to `timeout`) before being sent.
+            adaptive_concurrency (bool): Adapt the number of requests in flight with an AIMD controller,
+                growing it while latency is healthy and halving it on throttling (default is False).
+            rrf_path (Optional[str]): Serve all namespaces offline from a directory of RRF files (MRCONSO, MRREL,
+                MRSTY, MRDEF, MRSAT) or from a store file built earlier (default is None, query UTS).
+            rrf_store_path (Optional[str]): SQLite file to keep the store loaded from `rrf_path` in, so later runs
+                skip loading (default is None, keep it in memory).
+            rrf_index_dir (Optional[str]): Directory of memory-mapped search indexes over the local store, built
+                on first use; exact, normalized and truncation searches are then answered from them (default is None).
+            rrf_fuzzy_index (bool): Also open a trigram index in `rrf_index_dir` for approximate searches through
+                `fuzzy_index.search`, building it on first use (default is False).
         """
+        # One connection pool shared by every namespace
+        self.session_pool = SessionPool(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            gzip=gzip,
+            timeout=timeout,
+            rate_limiter=(
+                TokenBucket(requests_per_second, burst) if requests_per_second else None
+            ),
+            concurrency_controller=(
+                AIMDController(
+                    initial_limit=min(4, pool_maxsize), max_limit=pool_maxsize
+                )
+                if adaptive_concurrency
+                else None
+            ),
+            retry_policy=RetryPolicy(
+                max_retries=max_retries, backoff_factor=backoff_factor
+            ),
+        )
+
+        # One persistent response cache shared by every namespace
+        self.cache = (
+            SQLiteCache(cache_path, ttl=cache_ttl, max_size_bytes=cache_max_bytes)
+            if cache_path
+            else None
+        )
+        self.memory_cache = (
+            MemoryCache(
+                max_entries=memory_cache_entries,
+                max_bytes=memory_cache_bytes,
+                ttl=memory_cache_ttl,
+            )
+            if memory_cache_entries != 0
+            else None
+        )
+
+        # Local release files replace UTS for every namespace
+        self.local_store = None
+        self.string_index = None
+        self.fuzzy_index = None
+        local_backend = None
+        if rrf_path:
+            if os.path.isdir(rrf_path):
+                self.local_store = RRFStore.from_directory(
+                    rrf_path, path=rrf_store_path or ":memory:"
+                )
+            else:
+                self.local_store = RRFStore(rrf_path)
+                if not self.local_store.is_loaded:
+                    raise ValueError(f"{rrf_path} is not a loaded RRF store.")
+            if rrf_index_dir:
+                self.string_index = self._open_string_index(rrf_index_dir)
+                if rrf_fuzzy_index:
+                    self.fuzzy_index = self._open_fuzzy_index(rrf_index_dir)
+            local_backend = LocalBackend(
+                self.local_store, string_index=self.string_index
+            )
+            if version == "current" and self.local_store.release:
+                version = self.local_store.release
+
         # Initialize individual API clients as attributes
-        self.searchAPI = SearchAPI(api_key, version)
-        self.sourceAPI = SourceAPI(api_key, version)
-        self.cuiAPI = CUIAPI(api_key, version)
-        self.semanticNetworkAPI = SemanticNetworkAPI(api_key, version)
-        self.crosswalkAPI = CrosswalkAPI(api_key, version)
+        # "current" is pinned to one release shared by every namespace
+        self.release_resolver = (
+            ReleaseResolver(self.session_pool, caches=[self.memory_cache, self.cache])
+            if resolve_current and local_backend is None
+            else None
+        )
+
+        shared = {
+            "session_pool": self.session_pool,
+            "cache": self.cache,
+            "memory_cache": self.memory_cache,
+            "release_resolver": self.release_resolver,
+            "local_backend": local_backend,
+        }
+        self.searchAPI = SearchAPI(api_key, version, **shared)
+        self.sourceAPI = SourceAPI(api_key, version, **shared)
+        self.cuiAPI = CUIAPI(api_key, version, **shared)
+        self.semanticNetworkAPI = SemanticNetworkAPI(api_key, version, **shared)
+        self.crosswalkAPI = CrosswalkAPI(api_key, version, **shared)
 
         # Log the successful initialization of UMLSClient
         logger.info(
             "UMLSClient initialized with SearchAPI, SourceAPI, CUIAPI, semanticNetworkAPI and crosswalkAPI"
         )
+
+    def _open_string_index(self, index_dir: str) -> StringIndex:
+        """Load the string index of the local store, building it if it is missing, outdated or of another release."""
+        path = os.path.join(index_dir, "strings.idx")
+        if os.path.exists(path):
+            try:
+                index = StringIndex.load(path)
+            except ValueError:
+                logger.info(
+                    f"Rebuilding string index {path} written in an older format"
+                )
+            else:
+                if index.release == self.local_store.release:
+                    return index
+                index.close()
+        os.makedirs(index_dir, exist_ok=True)
+        StringIndex.build(self.local_store).save(path)
+        return StringIndex.load(path)
+
+    def _open_fuzzy_index(self, index_dir: str) -> FuzzyIndex:
+        """Load the trigram index over the string index, building it if it is missing or stale."""
+        path = os.path.join(index_dir, "fuzzy.idx")
+        if os.path.exists(path):
+            try:
+                return FuzzyIndex.load(path, self.string_index)
+            except ValueError:
+                logger.info(f"Rebuilding fuzzy index {path}")
+        FuzzyIndex.build(self.string_index).save(path)
+        return FuzzyIndex.load(path, self.string_index)
+
+    @property
+    def release(self) -> str:
+        """The UMLS release the namespaces query, resolving "current" on first access."""
+        return self.searchAPI.version
+
+    def cache_stats(self) -> Dict[str, Optional[Dict[str, int]]]:
+        """
+        Return hit, miss and eviction counters of the response caches.
+
+        Returns:
+            Dict[str, Optional[Dict[str, int]]]: Statistics of the "memory" and "disk" caches (None if disabled).
+        """
+        return {
+            "memory": (
+                self.memory_cache.stats() if self.memory_cache is not None else None
+            ),
+            "disk": self.cache.stats() if self.cache is not None else None,
+        }
+
+    def close(self) -> None:
+        """Close the pooled connections, the response cache and the local store shared by all namespaces."""
+        self.session_pool.close()
+        if self.cache is not None:
+            self.cache.close()
+        if self.fuzzy_index is not None:
+            self.fuzzy_index.close()
+        if self.string_index is not None:
+            self.string_index.close()
+        if self.local_store is not None:
+            self.local_store.close()
+
+    def __enter__(self) -> "UMLSClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
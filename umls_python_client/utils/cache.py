@@ -0,0 +1,383 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(version: str, path: str, params: Optional[Dict[str, Any]]) -> str:
+    """
+    Build a cache key from the UMLS release, the URL path and the query parameters.
+
+    The API key is left out so that cached responses can be shared between keys, and parameters
+    are sorted and stringified so equivalent requests map to the same key.
+
+    Args:
+        version (str): The UMLS release the response belongs to.
+        path (str): The URL path of the endpoint.
+        params (Optional[Dict[str, Any]]): The query parameters of the request.
+
+    Returns:
+        str: A hex digest identifying the request.
+    """
+    normalized = sorted(
+        (k, str(v))
+        for k, v in (params or {}).items()
+        if k != "apiKey" and v is not None
+    )
+    raw = json.dumps([version, path, normalized], separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SQLiteCache:
+    """
+    Persistent single-file cache of parsed UMLS API responses.
+
+    Entries are stored as compact JSON in a SQLite database together with the release they belong
+    to. Entries older than `ttl` seconds are treated as missing, and once the stored payloads grow
+    beyond `max_size_bytes` the least recently used entries are evicted.
+
+    Attributes:
+        path (str): Location of the SQLite database file.
+        ttl (Optional[float]): Time to live of an entry in seconds (None keeps entries forever).
+        max_size_bytes (Optional[int]): Maximum total size of the stored payloads (None for unbounded).
+    """
+
+    def __init__(
+        self,
+        path: str = "umls_cache.sqlite",
+        ttl: Optional[float] = None,
+        max_size_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize the SQLiteCache, creating the database file if needed.
+
+        Args:
+            path (str, optional): Location of the database file. Defaults to "umls_cache.sqlite".
+            ttl (Optional[float], optional): Time to live in seconds. Defaults to None.
+            max_size_bytes (Optional[int], optional): Maximum total payload size in bytes. Defaults to None.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_size_bytes = max_size_bytes
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    release TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+                """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_release ON responses (release)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._size = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): The cache key from `make_cache_key`.
+
+        Returns:
+            Optional[Any]: A fresh copy of the parsed response, or None if it is missing or expired.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, size, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, size, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size -= size
+                self.misses += 1
+                self.evictions += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, release: str) -> None:
+        """
+        Store a parsed response.
+
+        Args:
+            key (str): The cache key from `make_cache_key`.
+            value (Any): The parsed JSON response.
+            release (str): The UMLS release the response belongs to.
+        """
+        payload = json.dumps(value, separators=(",", ":"))
+        size = len(payload)
+        now = time.time()
+        with self._lock, self._conn:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, release, payload, size, now, now),
+            )
+            self._size += size - (previous[0] if previous else 0)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries once the cache outgrows `max_size_bytes`."""
+        if self.max_size_bytes is None or self._size <= self.max_size_bytes:
+            return
+        # Evict down to 90% of the limit so the next inserts do not trigger another pass
+        target = int(self.max_size_bytes * 0.9)
+        evicted = 0
+        while self._size > target:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size -= size
+                evicted += 1
+                if self._size <= target:
+                    break
+        self.evictions += evicted
+        logger.info(f"Evicted {evicted} entries from the UMLS response cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the stored payloads in bytes."""
+        return self._size
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss and eviction counters together with the current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "size_bytes": self._size,
+        }
+
+    def invalidate_release(self, release: str) -> int:
+        """
+        Remove every entry that belongs to the given release.
+
+        Args:
+            release (str): The release whose entries are removed.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        with self._lock, self._conn:
+            removed, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses WHERE release = ?",
+                (release,),
+            ).fetchone()
+            self._conn.execute("DELETE FROM responses WHERE release = ?", (release,))
+            self._size -= size
+        if removed:
+            logger.info(f"Invalidated {removed} cached responses of release {release}")
+        return removed
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read a value from the cache metadata table."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Write a value to the cache metadata table."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value)
+            )
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+            self._size = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class MemoryCache:
+    """
+    Thread-safe in-process LRU cache of parsed UMLS API responses.
+
+    Responses are kept as compact JSON and parsed again on every hit, so each caller gets its own
+    copy and mutating a returned result never alters the cache. The cache is bounded by number of
+    entries and, optionally, by the size of the cached JSON. Entries older than `ttl` seconds are
+    treated as missing.
+
+    Attributes:
+        max_entries (Optional[int]): Maximum number of entries (None for unbounded).
+        max_bytes (Optional[int]): Maximum approximate size of the cached payloads (None for unbounded).
+        ttl (Optional[float]): Time to live of an entry in seconds (None keeps entries until evicted).
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that were not in the cache or had expired.
+        evictions (int): Number of entries dropped to respect the bounds or the TTL.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Initialize the MemoryCache.
+
+        Args:
+            max_entries (Optional[int], optional): Maximum number of entries. Defaults to 1024.
+            max_bytes (Optional[int], optional): Maximum approximate payload size in bytes. Defaults to None.
+            ttl (Optional[float], optional): Time to live in seconds. Defaults to None.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # key -> (JSON payload, release, size, created)
+        self._entries: "OrderedDict[str, Tuple[str, str, int, float]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response and mark it as most recently used.
+
+        Args:
+            key (str): The cache key from `make_cache_key`.
+
+        Returns:
+            Optional[Any]: A fresh copy of the parsed response, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if self.ttl is not None and time.monotonic() - entry[3] > self.ttl:
+                self._remove(key)
+                self.misses += 1
+                self.evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            payload = entry[0]
+        return json.loads(payload)
+
+    def set(self, key: str, value: Any, release: str) -> None:
+        """
+        Store a parsed response, evicting least recently used entries if a bound is exceeded.
+
+        Args:
+            key (str): The cache key from `make_cache_key`.
+            value (Any): The parsed JSON response.
+            release (str): The UMLS release the response belongs to.
+        """
+        payload = json.dumps(value, separators=(",", ":"))
+        size = len(payload)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (payload, release, size, time.monotonic())
+            self._size += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._size > self.max_bytes)
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry; the caller must hold the lock."""
+        _, _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate size of the cached payloads in bytes."""
+        return self._size
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss and eviction counters together with the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+            }
+
+    def invalidate_release(self, release: str) -> int:
+        """
+        Remove every entry that belongs to the given release.
+
+        Args:
+            release (str): The release whose entries are removed.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry[1] == release]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
@@ -0,0 +1,97 @@
+import itertools
+import logging
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def bounded_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 8,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    Apply `func` to every item with a bounded thread pool, consuming `items` lazily.
+
+    At most `max_pending` calls are submitted but not yet yielded, so arbitrarily long (streamed)
+    inputs run in constant memory. An exception raised by `func` is yielded in place of its result
+    instead of aborting the remaining items.
+
+    Args:
+        func (Callable[[Any], Any]): The function to apply. Must be thread-safe.
+        items (Iterable[Any]): The inputs, possibly a generator.
+        max_workers (int, optional): Number of worker threads. Defaults to 8.
+        ordered (bool, optional): Yield in input order (True) or as soon as each call finishes (False).
+            Defaults to True.
+        max_pending (Optional[int], optional): Maximum number of outstanding calls. Defaults to
+            four times `max_workers`.
+        executor (Optional[Executor], optional): Run the calls on this executor, e.g. a process pool
+            for CPU-bound work, instead of a private thread pool. It is not shut down afterwards.
+
+    Yields:
+        Tuple[Any, Any]: The item and either its result or the exception raised for it.
+    Raises:
+        ValueError: If `max_workers` is less than 1.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    if max_pending is None:
+        max_pending = max_workers * 4
+    max_pending = max(max_pending, max_workers)
+
+    iterator = iter(items)
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from _run(func, iterator, executor, ordered, max_pending)
+    else:
+        yield from _run(func, iterator, executor, ordered, max_pending)
+
+
+def _run(
+    func: Callable[[Any], Any],
+    iterator: Iterator[Any],
+    executor: Executor,
+    ordered: bool,
+    max_pending: int,
+) -> Iterator[Tuple[Any, Any]]:
+    """Submit calls to `executor`, keeping at most `max_pending` outstanding."""
+
+    def outcome(future: Future) -> Any:
+        try:
+            return future.result()
+        except Exception as e:
+            return e
+
+    if ordered:
+        pending: "deque[Tuple[Any, Future]]" = deque()
+        for item in itertools.islice(iterator, max_pending):
+            pending.append((item, executor.submit(func, item)))
+        while pending:
+            item, future = pending.popleft()
+            result = outcome(future)
+            for next_item in itertools.islice(iterator, 1):
+                pending.append((next_item, executor.submit(func, next_item)))
+            yield item, result
+    else:
+        futures = {
+            executor.submit(func, item): item
+            for item in itertools.islice(iterator, max_pending)
+        }
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = futures.pop(future)
+                for next_item in itertools.islice(iterator, 1):
+                    futures[executor.submit(func, next_item)] = next_item
+                yield item, outcome(future)
@@ -0,0 +1,137 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+# Space reserved for the magic number, the header length and the JSON header
+HEADER_BLOCK = 4096
+
+
+class StringTable(Sequence[str]):
+    """Read-only sequence of strings stored as one UTF-8 blob plus an offsets array."""
+
+    def __init__(self, blob: Sequence[int], offsets: Sequence[int]):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        return bytes(
+            self._blob[self._offsets[index] : self._offsets[index + 1]]
+        ).decode("utf-8")
+
+
+def build_string_table(strings: Iterable[str]) -> Tuple[array, array]:
+    """
+    Encode strings as the arrays of a StringTable.
+
+    Args:
+        strings (Iterable[str]): The strings, in order.
+
+    Returns:
+        Tuple[array, array]: The int64 offsets and the byte blob.
+    """
+    offsets = array("q", [0])
+    blob = bytearray()
+    for string in strings:
+        blob += string.encode("utf-8")
+        offsets.append(len(blob))
+    return offsets, array("B", blob)
+
+
+def save_sections(
+    path: str,
+    magic: bytes,
+    header: Dict[str, Any],
+    sections: Sequence[Tuple[str, str, Any]],
+) -> None:
+    """
+    Write typed arrays to a file that `load_sections` can memory-map.
+
+    The file starts with `magic`, the length of a JSON header and the header itself, which
+    records the byte order and the name, typecode, offset and size of every section. Sections
+    follow 8-byte aligned after the header block.
+
+    Args:
+        path (str): The file to write.
+        magic (bytes): The file signature.
+        header (Dict[str, Any]): Format specific header fields.
+        sections (Sequence[Tuple[str, str, Any]]): (name, typecode, array) of every section.
+    """
+    payloads = [memoryview(data).cast("B") for _, _, data in sections]
+    header_size = HEADER_BLOCK
+    while True:
+        full_header = {**header, "byteorder": sys.byteorder, "sections": []}
+        offset = header_size
+        for (name, typecode, _), payload in zip(sections, payloads):
+            full_header["sections"].append([name, typecode, offset, len(payload)])
+            offset += (len(payload) + 7) // 8 * 8
+        encoded = json.dumps(full_header).encode("utf-8")
+        if len(magic) + 8 + len(encoded) <= header_size:
+            break
+        header_size += HEADER_BLOCK
+
+    with open(path, "wb") as f:
+        f.write(magic + struct.pack("<Q", len(encoded)) + encoded)
+        for (_, _, section_offset, _), payload in zip(
+            full_header["sections"], payloads
+        ):
+            f.write(b"\0" * (section_offset - f.tell()))
+            f.write(payload)
+
+
+def load_sections(
+    path: str, magic: bytes, description: str, version: Optional[int] = None
+) -> Tuple[Dict[str, Any], Dict[str, memoryview], mmap.mmap]:
+    """
+    Memory-map a file written by `save_sections`.
+
+    Args:
+        path (str): The file.
+        magic (bytes): The expected file signature.
+        description (str): What the file holds, for error messages (e.g. 'hierarchy snapshot').
+        version (Optional[int]): The expected `version` header field, if any.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, memoryview], mmap.mmap]: The header, the sections as typed
+        views into the map, and the map itself.
+    Raises:
+        ValueError: If the file has another signature or version, or was written on a machine with
+            another byte order.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mapped[: len(magic)] != magic:
+        mapped.close()
+        raise ValueError(f"{path} is not a {description}.")
+    (length,) = struct.unpack("<Q", mapped[len(magic) : len(magic) + 8])
+    header = json.loads(mapped[len(magic) + 8 : len(magic) + 8 + length])
+    incompatible = header["byteorder"] != sys.byteorder or (
+        version is not None and header.get("version") != version
+    )
+    if incompatible:
+        mapped.close()
+        raise ValueError(f"{path} was written in an incompatible format.")
+
+    view = memoryview(mapped)
+    sections = {
+        name: view[offset : offset + size].cast(typecode)
+        for name, typecode, offset, size in header["sections"]
+    }
+    return header, sections, mapped
+
+
+def close_sections(sections: Dict[str, Any], mapped: Optional[mmap.mmap]) -> None:
+    """Release the section views of a mapped file, then the map."""
+    if mapped is None:
+        return
+    for section in sections.values():
+        if isinstance(section, memoryview):
+            section.release()
+    mapped.close()
@@ -0,0 +1,225 @@
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the request rate of everything that shares it.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Each request takes one token;
+    when the bucket is empty the caller waits for its reservation instead of being rejected, so
+    waiting callers are served in order.
+
+    Attributes:
+        rate (float): Tokens added per second (the sustained request rate).
+        capacity (float): Maximum number of tokens (the allowed burst).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the TokenBucket.
+
+        Args:
+            rate (float): Sustained requests per second.
+            capacity (Optional[float]): Burst size. Defaults to `rate` (at least 1).
+        Raises:
+            ValueError: If the rate is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be a positive number of requests per second.")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token and return how long the caller has to wait before using it.
+
+        Returns:
+            float: Seconds to wait (0 if a token was available right away).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every caller for the given number of seconds, e.g. after a `Retry-After` header.
+
+        Args:
+            seconds (float): How long to pause the bucket.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class AIMDController:
+    """
+    Additive-increase / multiplicative-decrease controller for the number of requests in flight.
+
+    The concurrency limit grows by about `increase` per round of healthy responses (latency at or
+    below `target_latency`) and is multiplied by `decrease_factor` whenever the server throttles.
+
+    Attributes:
+        limit (float): The current concurrency limit.
+        min_limit (int): The lowest the limit can go.
+        max_limit (int): The highest the limit can go.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        target_latency: float = 1.0,
+    ):
+        """
+        Initialize the AIMDController.
+
+        Args:
+            initial_limit (int, optional): Starting concurrency limit. Defaults to 4.
+            min_limit (int, optional): Minimum concurrency limit. Defaults to 1.
+            max_limit (int, optional): Maximum concurrency limit. Defaults to 32.
+            increase (float, optional): Additive increase per round of healthy responses. Defaults to 1.0.
+            decrease_factor (float, optional): Multiplier applied on throttling. Defaults to 0.5.
+            target_latency (float, optional): Latency in seconds considered healthy. Defaults to 1.0.
+        Raises:
+            ValueError: If the limits or the decrease factor are invalid.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit."
+            )
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1.")
+
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.target_latency = target_latency
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block the calling thread until a concurrency slot is free."""
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, throttled: bool = False) -> None:
+        """
+        Free a concurrency slot and adjust the limit from the request outcome.
+
+        Args:
+            latency (float): How long the request took, in seconds.
+            throttled (bool): Whether the server throttled the request (e.g. HTTP 429).
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                logger.warning(
+                    f"Request throttled, reducing concurrency limit to {int(self.limit)}"
+                )
+            elif latency <= self.target_latency:
+                self.limit = min(
+                    self.max_limit, self.limit + self.increase / self.limit
+                )
+            self._condition.notify_all()
+
+
+class RetryPolicy:
+    """
+    Retry policy with jittered exponential backoff that honours `Retry-After` headers.
+
+    Attributes:
+        max_retries (int): Maximum number of retries after the first attempt.
+        backoff_factor (float): Base delay in seconds, doubled on every attempt.
+        max_backoff (float): Upper bound for a single delay in seconds.
+        retry_statuses (Tuple[int, ...]): HTTP status codes that are retried.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+    ):
+        """
+        Initialize the RetryPolicy.
+
+        Args:
+            max_retries (int, optional): Maximum number of retries. Defaults to 3.
+            backoff_factor (float, optional): Base delay in seconds. Defaults to 0.5.
+            max_backoff (float, optional): Maximum delay in seconds. Defaults to 60.
+            retry_statuses (Tuple[int, ...], optional): Status codes to retry. Defaults to 429 and 5xx gateway errors.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+
+    def should_retry(self, status_code: int, attempt: int) -> bool:
+        """Return True if a response with this status should be retried after `attempt` retries."""
+        return status_code in self.retry_statuses and attempt < self.max_retries
+
+    def compute_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Compute how long to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of retries already made (0 for the first retry).
+            retry_after (Optional[str]): Value of the `Retry-After` header, in seconds or as an HTTP date.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        if retry_after:
+            try:
+                return min(self.max_backoff, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after).timestamp()
+                    return min(self.max_backoff, max(0.0, retry_at - time.time()))
+                except (TypeError, ValueError):
+                    logger.warning(
+                        f"Ignoring unparseable Retry-After header: {retry_after}"
+                    )
+
+        # Full jitter spreads retries from many threads over the whole backoff window
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * (2**attempt))
+        )
@@ -1,6 +1,7 @@
+import csv
 import json
 import logging
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -24,3 +25,48 @@ def save_output_to_file(response: Any, file_path: str) -> None:
     except Exception as e:
         # Log the error if file saving fails
         logger.error(f"Failed to save output to {file_path}: {e}")
+
+
+def save_rows_to_file(
+    rows: Iterable[Sequence[Any]],
+    file_path: str,
+    fieldnames: Sequence[str],
+    format: str = "csv",
+) -> int:
+    """
+    Stream table rows to a CSV or JSON Lines file without holding them in memory.
+
+    Args:
+        rows (Iterable[Sequence[Any]]): The rows, one value per field. May be a generator.
+        file_path (str): The path of the file where the rows will be saved.
+        fieldnames (Sequence[str]): The column names, written as the CSV header or used as JSON keys.
+        format (str): Either 'csv' or 'jsonl'. List values are joined with '|' in CSV files.
+
+    Returns:
+        int: The number of rows written.
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if format not in ("csv", "jsonl"):
+        raise ValueError(
+            "Invalid output format selected. Available types are csv, jsonl"
+        )
+
+    count = 0
+    with open(file_path, "w", encoding="utf-8", newline="") as f:
+        if format == "csv":
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            for row in rows:
+                writer.writerow(
+                    "|".join(map(str, value)) if isinstance(value, list) else value
+                    for value in row
+                )
+                count += 1
+        else:
+            for row in rows:
+                f.write(json.dumps(dict(zip(fieldnames, row)), separators=(",", ":")))
+                f.write("\n")
+                count += 1
+    logger.info(f"Saved {count} rows to {file_path}")
+    return count